@@ -0,0 +1,86 @@
+# area_of_effect.py - Memoised area-of-effect regions and building coverage
+from collections import deque
+
+
+class AreaOfEffectService:
+    """Caches area-of-effect tiles per (position, radius) on a ColonyMap.
+
+    Regions only depend on the centre, the radius and the terrain, so they
+    are computed once and reused by police ticks and by drawing. Buildings
+    with a radius are registered when placed on the map, which keeps a
+    reverse index from each tile to the buildings covering it. Terrain
+    edits clear the cache and recompute the coverage.
+    """
+    def __init__(self, colony_map):
+        self.colony_map = colony_map
+        self.regions = {}  # (position, radius) -> tuple of tiles
+        self.coverage = {}  # Building -> tiles it covers
+        self.covered_by = {}  # Tile -> buildings covering it (dicts used as ordered sets)
+
+    def get(self, center_pos, radius):
+        """Tiles within `radius` accessible steps of a position (shared tuple, do not modify)"""
+        key = (tuple(center_pos), radius)
+        region = self.regions.get(key)
+        if region is None:
+            region = self.regions[key] = tuple(self.search(center_pos, radius))
+        return region
+
+    def search(self, center_pos, radius):
+        """Breadth-first search over the map's accessibility graph"""
+        center_hex = self.colony_map.get_hex_at_grid(center_pos[0], center_pos[1])
+        if not center_hex:
+            return []
+
+        adjacency = self.colony_map.adjacency
+        visited = {center_hex}
+        queue = deque([(center_hex, 0)])  # (hex, distance)
+        affected_hexes = []
+
+        while queue:
+            current_hex, distance = queue.popleft()
+            affected_hexes.append(current_hex)
+
+            # If we haven't reached max distance, explore accessible neighbors
+            if distance < radius:
+                for neighbor_hex in adjacency.neighbors_of(current_hex):
+                    if neighbor_hex not in visited:
+                        visited.add(neighbor_hex)
+                        queue.append((neighbor_hex, distance + 1))
+
+        return affected_hexes
+
+    def register(self, building):
+        """Record the tiles covered by a building that was placed on the map"""
+        self.unregister(building)
+        if not building.hex_position or not getattr(building, 'area_of_effect_radius', 0):
+            return
+        tiles = self.get(building.hex_position, building.area_of_effect_radius)
+        self.coverage[building] = tiles
+        for tile in tiles:
+            self.covered_by.setdefault(tile, {})[building] = None
+
+    def unregister(self, building):
+        """Forget the coverage of a building leaving the map"""
+        for tile in self.coverage.pop(building, ()):
+            buildings = self.covered_by.get(tile)
+            if buildings is not None:
+                buildings.pop(building, None)
+                if not buildings:
+                    del self.covered_by[tile]
+
+    def covering(self, tile):
+        """Buildings whose area of effect includes a tile"""
+        return list(self.covered_by.get(tile, ()))
+
+    def clear(self):
+        """Drop all coverage, e.g. before the initial buildings are placed"""
+        self.coverage = {}
+        self.covered_by = {}
+
+    def invalidate(self):
+        """Terrain changed: drop cached regions and recompute coverage"""
+        self.regions = {}
+        buildings = list(self.coverage)
+        self.clear()
+        for building in buildings:
+            self.register(building)
@@ -0,0 +1,93 @@
+# building_registry.py - Indexed collection of the colony's buildings
+
+
+class BuildingRegistry:
+    """The colony's buildings with type, capability and position indexes.
+
+    Behaves like the plain list it replaces for iteration in construction
+    order, len, membership and append/remove, while keeping per-class
+    counts, capability sets and a hex-position index up to date. Buildings
+    should be placed on the map before they are added. Iteration walks the
+    live registry, so copy it first to add or remove buildings in a loop.
+    """
+    # Capability name -> test applied once when a building is added
+    CAPABILITIES = {
+        'residential': lambda b: hasattr(b, 'residents'),
+        'medical': lambda b: hasattr(b, 'calculate_health_boost'),
+        'policing': lambda b: hasattr(b, 'crime_reduction_per_worker'),
+        'producers': lambda b: (b.max_workers > 0 and not hasattr(b, 'calculate_health_boost')
+                                and not hasattr(b, 'crime_reduction_per_worker')),
+    }
+
+    def __init__(self, buildings=()):
+        self.buildings = {}  # Dicts used as ordered sets
+        self.by_type = {}  # Class -> buildings that are instances of it
+        self.capabilities = {name: {} for name in self.CAPABILITIES}
+        self.by_position = {}  # (map_x, map_y) -> building
+        self.version = 0  # Bumped on every add/remove
+        for building in buildings:
+            self.append(building)
+
+    def __iter__(self):
+        return iter(self.buildings)
+
+    def __len__(self):
+        return len(self.buildings)
+
+    def __contains__(self, building):
+        return building in self.buildings
+
+    def append(self, building):
+        """Register a building"""
+        if building in self.buildings:
+            return
+        self.buildings[building] = None
+        for cls in type(building).__mro__:
+            self.by_type.setdefault(cls, {})[building] = None
+        for name, test in self.CAPABILITIES.items():
+            if test(building):
+                self.capabilities[name][building] = None
+        if building.hex_position is not None:
+            self.by_position[building.hex_position] = building
+        self.version += 1
+
+    def remove(self, building):
+        """Unregister a building; raises ValueError like list.remove"""
+        if building not in self.buildings:
+            raise ValueError("building is not registered")
+        del self.buildings[building]
+        for cls in type(building).__mro__:
+            self.by_type[cls].pop(building, None)
+        for members in self.capabilities.values():
+            members.pop(building, None)
+        if self.by_position.get(building.hex_position) is building:
+            del self.by_position[building.hex_position]
+        self.version += 1
+
+    def count_of(self, building_type):
+        """Number of buildings that are instances of a class"""
+        return len(self.by_type.get(building_type, ()))
+
+    def of_type(self, building_type):
+        """Buildings that are instances of a class, in construction order"""
+        return list(self.by_type.get(building_type, ()))
+
+    def at(self, position):
+        """Building placed at a (map_x, map_y) position, or None"""
+        return self.by_position.get(position)
+
+    @property
+    def residential(self):
+        return self.capabilities['residential'].keys()
+
+    @property
+    def medical(self):
+        return self.capabilities['medical'].keys()
+
+    @property
+    def policing(self):
+        return self.capabilities['policing'].keys()
+
+    @property
+    def producers(self):
+        return self.capabilities['producers'].keys()
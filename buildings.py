@@ -1,14 +1,51 @@
 from professions import PROFESSIONS, get_profession_for_building, get_profession_default_wage
 
+def _flow_input(name):
+    """Attribute that invalidates the building's resource-flow row when it changes"""
+    attr = '_' + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        if self.flow is not None:
+            self.flow.mark_dirty(self)
+    return property(getter, setter)
+
+
+def _housing_input(name):
+    """Attribute that refreshes the habitat's vacancy-index entry when it changes"""
+    attr = '_' + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        changed = getattr(self, attr, None) != value
+        setattr(self, attr, value)
+        if changed and self.housing_market is not None:
+            self.housing_market.mark_dirty(self)
+    return property(getter, setter)
+
+
 # buildings.py - update the Building class
 class Building:
+    # Inputs of the compiled resource flow (see resource_flow.py)
+    assigned_workers = _flow_input('assigned_workers')
+    active = _flow_input('active')
+    crime_level = _flow_input('crime_level')
+
     def __init__(self, name, description, max_workers, energy_consumption=0, mineral_consumption=0, 
                  required_surface=None, area_of_effect_radius=0, profession='worker'):  # Add profession parameter
+        self.flow = None  # ResourceFlow this building is compiled into, if any
         self.name = name
         self.description = description
         self.max_workers = max_workers
         self.assigned_workers = 0
         self.assigned_colonists = []  # Track individual colonists
+        self.unhappy_workers = 0  # Assigned colonists below the unhappy threshold
+        self.unhappy_residents = 0  # Residents below the unhappy threshold
         self.energy_consumption = energy_consumption
         self.mineral_consumption = mineral_consumption
         self.required_surface = required_surface  # None for any surface, or specific surface type
@@ -31,16 +68,20 @@ class Building:
         """Set the hex grid position for area of effect calculations"""
         self.hex_position = (hex_x, hex_y)
         
-    def get_area_of_effect_hexes(self, hex_map):
+    def get_area_of_effect_hexes(self, colony_map):
         """Get all hexes within the area of effect radius using proper hex grid flood fill"""
         if not self.hex_position or self.area_of_effect_radius == 0:
             return []
             
-        # Use hex_map's methods for distance and accessibility
-        return hex_map.get_area_of_effect_hexes(self.hex_position, self.area_of_effect_radius)
+        # Use colony_map's methods for distance and accessibility
+        return colony_map.get_area_of_effect_hexes(self.hex_position, self.area_of_effect_radius)
         
     def assign_colonist(self, colonist, wage=None):
         """Assign a colonist to this building with optional custom wage"""
+        if colonist in self.assigned_colonists:
+            # Already working here - only the wage is updated
+            colonist.assign_to_workplace(self, self.base_wage if wage is None else wage)
+            return True
         if len(self.assigned_colonists) < self.max_workers:
             self.assigned_colonists.append(colonist)
             self.assigned_workers = len(self.assigned_colonists)
@@ -60,20 +101,32 @@ class Building:
             return True
         return False
         
+    def get_production_rates(self):
+        """Production per assigned worker and fixed production, as two dicts"""
+        return {}, {}
+        
+    def get_consumption_rates(self):
+        """Consumption at full staffing; scaled by the share of workers assigned"""
+        return {
+            'energy': self.energy_consumption,
+            'regolith': self.mineral_consumption
+        }
+        
     def calculate_production(self):
         """Calculate production based on assigned workers"""
         if not self.active:
             return {}
             
-        return {}
+        per_worker, fixed = self.get_production_rates()
+        production = {resource: self.assigned_workers * rate for resource, rate in per_worker.items()}
+        for resource, amount in fixed.items():
+            production[resource] = production.get(resource, 0) + amount
+        return production
         
     def calculate_consumption(self):
         """Calculate consumption based on assigned workers"""
-        consumption = {
-            'energy': self.energy_consumption * (self.assigned_workers / max(1, self.max_workers)),
-            'regolith': self.mineral_consumption * (self.assigned_workers / max(1, self.max_workers))
-        }
-        return consumption
+        staffing = self.assigned_workers / max(1, self.max_workers)
+        return {resource: rate * staffing for resource, rate in self.get_consumption_rates().items()}
     
     # buildings.py - add this method to the Building class
     def can_operate(self, resource_manager):
@@ -84,34 +137,6 @@ class Building:
                 return False
         return True
     
-    def update_crime(self, game):
-        """Update crime level based on unhappy colonists"""
-        # Base crime decay
-        self.crime_level = max(0, self.crime_level - 2)
-        
-        # Generate crime from unhappy workers
-        if hasattr(self, 'assigned_colonists') and self.assigned_colonists:
-            unhappy_workers = [c for c in self.assigned_colonists if c.happiness < 40]
-            if unhappy_workers:
-                # More unhappy workers = more crime
-                crime_generated = len(unhappy_workers) * 2
-                self.crime_level = min(100, self.crime_level + crime_generated)
-                self.is_crime_source = True
-        
-        # Generate crime from unhappy residents
-        if hasattr(self, 'residents') and self.residents:
-            unhappy_residents = [c for c in self.residents if c.happiness < 40]
-            if unhappy_residents:
-                crime_generated = len(unhappy_residents) * 3  # Residents generate more crime
-                self.crime_level = min(100, self.crime_level + crime_generated)
-                self.is_crime_source = True
-                
-        # Slums always generate crime
-        if hasattr(self, 'is_slum') and self.is_slum:
-            crime_generated = 8  # Constant crime from slums
-            self.crime_level = min(100, self.crime_level + crime_generated)
-            self.is_crime_source = True
-            
     def get_crime_penalty(self):
         """Get the productivity/quality penalty from crime"""
         return max(0, self.crime_level * 0.01)  # 1% penalty per crime point
@@ -148,13 +173,8 @@ class Mine(Building):
         )
         self.production_rate = 2.0  # Raw regolith per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'regolith': self.assigned_workers * self.production_rate
-        }
+    def get_production_rates(self):
+        return {'regolith': self.production_rate}, {}
 
 class EnergyGenerator(Building):
     def __init__(self):
@@ -169,19 +189,14 @@ class EnergyGenerator(Building):
         self.fuel_consumption = 3  # New fuel consumption
         self.production_rate = 4.0  # Energy per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'energy': self.assigned_workers * self.production_rate
-        }
+    def get_production_rates(self):
+        return {'energy': self.production_rate}, {}
         
-    def calculate_consumption(self):
+    def get_consumption_rates(self):
         """Override consumption to include fuel"""
-        consumption = super().calculate_consumption()
-        consumption['fuel'] = self.fuel_consumption * (self.assigned_workers / max(1, self.max_workers))
-        return consumption
+        rates = super().get_consumption_rates()
+        rates['fuel'] = self.fuel_consumption
+        return rates
 
 class OxygenGenerator(Building):
     def __init__(self):
@@ -194,13 +209,8 @@ class OxygenGenerator(Building):
         )
         self.production_rate = 3.0  # Oxygen per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'oxygen': self.assigned_workers * self.production_rate
-        }
+    def get_production_rates(self):
+        return {'oxygen': self.production_rate}, {}
 
 class HydroponicFarm(Building):
     def __init__(self):
@@ -213,13 +223,8 @@ class HydroponicFarm(Building):
         )
         self.production_rate = 2.5  # Food per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'food': self.assigned_workers * self.production_rate
-        }
+    def get_production_rates(self):
+        return {'food': self.production_rate}, {}
 
 class IceExtractor(Building):
     def __init__(self):
@@ -234,14 +239,11 @@ class IceExtractor(Building):
         self.oxygen_production_rate = 2.0  # Oxygen per worker
         self.hydrogen_production_rate = 1.5  # Hydrogen per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
+    def get_production_rates(self):
         return {
-            'oxygen': self.assigned_workers * self.oxygen_production_rate,
-            'hydrogen': self.assigned_workers * self.hydrogen_production_rate
-        }
+            'oxygen': self.oxygen_production_rate,
+            'hydrogen': self.hydrogen_production_rate
+        }, {}
 
 class ChemicalProcessingPlant(Building):
     def __init__(self):
@@ -255,19 +257,14 @@ class ChemicalProcessingPlant(Building):
         self.hydrogen_consumption = 2  # Hydrogen consumed per worker
         self.production_rate = 1.0  # Fuel produced per worker
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'fuel': self.assigned_workers * self.production_rate
-        }
+    def get_production_rates(self):
+        return {'fuel': self.production_rate}, {}
         
-    def calculate_consumption(self):
+    def get_consumption_rates(self):
         """Override consumption to include hydrogen"""
-        consumption = super().calculate_consumption()
-        consumption['hydrogen'] = self.hydrogen_consumption * (self.assigned_workers / max(1, self.max_workers))
-        return consumption
+        rates = super().get_consumption_rates()
+        rates['hydrogen'] = self.hydrogen_consumption
+        return rates
 
 class SolarPanelArray(Building):
     def __init__(self):
@@ -279,15 +276,10 @@ class SolarPanelArray(Building):
         )
         self.production_rate = 10.0  # Energy production (not based on workers)
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        return {
-            'energy': self.production_rate  # Constant production, no workers
-        }
+    def get_production_rates(self):
+        return {}, {'energy': self.production_rate}  # Constant production, no workers
         
-    def calculate_consumption(self):
+    def get_consumption_rates(self):
         """No consumption for solar panels"""
         return {}
 
@@ -305,13 +297,6 @@ class Hospital(Building):
         self.production_rate = 3.0  # Health points per worker
         self.max_capacity = 30  # Maximum colonists one hospital can effectively serve when fully staffed
         
-    def calculate_production(self):
-        if not self.active:
-            return {}
-            
-        # Hospital doesn't produce resources, but improves health
-        return {}
-        
     def calculate_health_boost(self, total_population):
         """Calculate health boost based on assigned workers and population served"""
         if not self.active:
@@ -353,15 +338,11 @@ class PolicePrecinct(Building):
         self.fuel_consumption = 2
         self.crime_reduction_per_worker = 3  # Crime reduction points per worker
         
-    def calculate_production(self):
-        """Police precinct doesn't produce resources"""
-        return {}
-        
-    def calculate_consumption(self):
+    def get_consumption_rates(self):
         """Override consumption to include fuel"""
-        consumption = super().calculate_consumption()
-        consumption['fuel'] = self.fuel_consumption * (self.assigned_workers / max(1, self.max_workers))
-        return consumption
+        rates = super().get_consumption_rates()
+        rates['fuel'] = self.fuel_consumption
+        return rates
         
     def calculate_crime_reduction(self):
         """Calculate total crime reduction based on assigned workers"""
@@ -369,26 +350,17 @@ class PolicePrecinct(Building):
             return 0
             
         return self.assigned_workers * self.crime_reduction_per_worker
-        
-    def apply_area_effect(self, game):
-        """Apply crime reduction to buildings in area of effect"""
-        if not self.active or self.assigned_workers == 0:
-            return
-            
-        crime_reduction = self.calculate_crime_reduction()
-        hex_map = game.graphics.screens['main'].hex_map
-        
-        # Get all hexes in area of effect
-        affected_hexes = self.get_area_of_effect_hexes(hex_map)
-        
-        for hexagon in affected_hexes:
-            if hexagon.building and hasattr(hexagon.building, 'crime_level'):
-                # Apply crime reduction (but not below 0)
-                hexagon.building.crime_level = max(0, hexagon.building.crime_level - crime_reduction)
 
 class ResidentialBuilding(Building):
     """Parent class for all residential buildings"""
+    # Inputs of the housing market's vacancy index (see housing_market.py)
+    quality = _housing_input('quality')
+    rent = _housing_input('rent')
+    capacity = _housing_input('capacity')
+    residents = _housing_input('residents')
+
     def __init__(self, name, description, quality, rent, capacity, energy_consumption=0, mineral_consumption=0):
+        self.housing_market = None  # HousingMarket indexing this habitat's vacancies, if any
         super().__init__(
             name=name,
             description=description,
@@ -409,14 +381,12 @@ class ResidentialBuilding(Building):
         quality_penalty = self.get_crime_penalty() * 2  # Crime has stronger effect on quality
         self.quality = max(1.0, self.base_quality - quality_penalty)
         
-    def calculate_production(self):
-        """Residential buildings don't produce resources"""
-        return {}
-        
     def add_resident(self, colonist):
         """Add a colonist as resident if there's space"""
         if len(self.residents) < self.capacity:
             self.residents.append(colonist)
+            if self.housing_market is not None:
+                self.housing_market.mark_dirty(self)
             colonist.housing = self
             colonist.housing_quality = self.quality
             colonist.rent_cost = self.rent
@@ -427,6 +397,8 @@ class ResidentialBuilding(Building):
         """Remove a colonist from residence"""
         if colonist in self.residents:
             self.residents.remove(colonist)
+            if self.housing_market is not None:
+                self.housing_market.mark_dirty(self)
             colonist.housing = None
             colonist.housing_quality = 0
             colonist.rent_cost = 0
@@ -1,24 +1,352 @@
 # colonist.py
 import random
+from itertools import compress
+
+import numpy as np
+
+UNHAPPY_THRESHOLD = 40  # Colonists below this happiness count as unhappy
+
+
+class ColonistStore:
+    """Structure-of-arrays storage behind Colonist views.
+
+    Every colonist occupies one row of a set of NumPy columns, so the daily
+    rules run as whole-array expressions instead of per-object loops.
+    """
+    COLUMNS = {
+        'health': np.float64,
+        'happiness': np.float64,
+        'wage': np.float64,
+        'savings': np.float64,
+        'debt': np.float64,
+        'days_unemployed': np.int64,
+        'days_homeless': np.int64,
+        'living_cost': np.float64,
+        'housing_quality': np.float64,
+        'rent_cost': np.float64,
+        'employed': np.bool_,
+        'housed': np.bool_,   # Mirrors `colonist.housing is not None`
+        'in_slum': np.bool_,  # Mirrors `hasattr(colonist.housing, 'is_slum')`
+        'unhappy': np.bool_,  # Counted in the unhappy totals of workplace and home
+    }
+
+    def __init__(self, capacity=16):
+        self.size = 0
+        self.capacity = max(1, capacity)
+        self.views = []  # Colonist view for each row, in row order
+        self.layout_version = 0  # Bumped whenever rows are removed or renumbered
+        self.data = {name: np.zeros(self.capacity, dtype=dtype)
+                     for name, dtype in self.COLUMNS.items()}
+
+    def column(self, name):
+        """Get the live (writable) slice of a column for all current rows"""
+        return self.data[name][:self.size]
+
+    def append(self, colonist):
+        """Reserve a zeroed row for a new colonist view and return its index"""
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+
+        row = self.size
+        for array in self.data.values():
+            array[row] = 0
+        self.views.append(colonist)
+        self.size += 1
+        return row
+
+    def _grow(self, new_capacity):
+        """Reallocate every column with more room"""
+        for name, array in self.data.items():
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            self.data[name] = grown
+        self.capacity = new_capacity
+
+    def flip_unhappy(self, rows):
+        """Toggle the unhappy flag of some rows and move their buildings' counters"""
+        unhappy = self.data['unhappy']
+        for row in rows:
+            unhappy[row] = not unhappy[row]
+            self.views[row].count_unhappy(1 if unhappy[row] else -1)
+
+    def sync_unhappy(self):
+        """Update building counters for colonists whose happiness crossed the threshold"""
+        n = self.size
+        unhappy = self.data['happiness'][:n] < UNHAPPY_THRESHOLD
+        crossed = np.flatnonzero(unhappy != self.data['unhappy'][:n])
+        if len(crossed):
+            self.flip_unhappy(crossed.tolist())
+
+    def remove(self, colonist):
+        """Remove a colonist's row by moving the last row into its place"""
+        row = colonist.row
+        if self.data['unhappy'][row]:
+            self.flip_unhappy([row])  # Leavers stop counting
+        last = self.size - 1
+        values = {name: array[row] for name, array in self.data.items()}
+
+        if row != last:
+            for array in self.data.values():
+                array[row] = array[last]
+            moved = self.views[last]
+            self.views[row] = moved
+            moved.row = row
+
+        self.views.pop()
+        self.size -= 1
+        self.layout_version += 1
+        colonist.detach(values)
+
+    def compact(self, keep):
+        """Drop every row not set in the `keep` mask in a single sweep.
+
+        Surviving rows keep their order. The removed views are moved together
+        onto one detached store and returned.
+        """
+        n = self.size
+        keep = np.asarray(keep, dtype=bool)
+        removed_rows = np.flatnonzero(~keep)
+        if not len(removed_rows):
+            return []
+        self.flip_unhappy(removed_rows[self.data['unhappy'][removed_rows]].tolist())
+
+        detached = ColonistStore(len(removed_rows))
+        detached.size = len(removed_rows)
+        for name, array in self.data.items():
+            detached.data[name][:detached.size] = array[removed_rows]
+            kept = array[:n][keep]
+            array[:len(kept)] = kept
+
+        removed = [self.views[row] for row in removed_rows.tolist()]
+        # Only rows after the first removed one move
+        first = int(removed_rows[0])
+        moved = list(compress(self.views[first:], keep[first:n].tolist()))
+        self.views[first:] = moved
+        self.size = len(self.views)
+        self.layout_version += 1
+        for row, view in enumerate(moved, first):
+            view.row = row
+        detached.views = removed
+        for row, view in enumerate(removed):
+            view.store = detached
+            view.row = row
+        return removed
+
+    def living_costs(self):
+        """Vectorized Colonist.calculate_living_cost"""
+        n = self.size
+        base_cost = self.data['living_cost'][:n] + self.data['debt'][:n] * 0.01
+        return base_cost + np.where(self.data['housed'][:n], self.data['rent_cost'][:n], 0.0)
+
+    def wage_satisfaction(self, living_cost=None):
+        """Vectorized Colonist.calculate_wage_satisfaction"""
+        if living_cost is None:
+            living_cost = self.living_costs()
+        wage = self.data['wage'][:self.size]
+        return np.select(
+            [wage <= living_cost, wage <= living_cost * 1.5, wage <= living_cost * 2],
+            [-20, 0, 10],  # Can't afford basic living / Satisfactory / Comfortable
+            20             # Well-off
+        )
+
+    def housing_happiness(self):
+        """Vectorized Colonist.calculate_housing_happiness"""
+        n = self.size
+        wage = self.data['wage'][:n]
+        rent_cost = self.data['rent_cost'][:n]
+
+        # Rent burden penalty (only if rent is more than 30% of wage)
+        rent_ratio = np.divide(rent_cost, wage, out=np.zeros(n), where=wage > 0)
+        rent_burden = np.where(wage > 0,
+                               np.where(rent_ratio > 0.3, (rent_ratio - 0.3) * 15, 0.0),
+                               5.0)  # Small penalty if unemployed with housing costs
+        regular = self.data['housing_quality'][:n] * 3 - rent_burden
+
+        housed_happiness = np.where(self.data['in_slum'][:n], -10.0, regular)
+        homeless_penalty = -15 - self.data['days_homeless'][:n] * 0.5
+        return np.where(self.data['housed'][:n], housed_happiness, homeless_penalty)
+
+    def rent_income(self):
+        """Total rent paid by housed colonists who can afford it"""
+        n = self.size
+        rent_cost = self.data['rent_cost'][:n]
+        payers = self.data['housed'][:n] & (self.data['savings'][:n] + self.data['wage'][:n] >= rent_cost)
+        return float(rent_cost[payers].sum())
+
+    def update_daily(self, severe_shortage=False):
+        """Apply one day of Colonist rules to every row at once"""
+        n = self.size
+        if n == 0:
+            return
+
+        health = self.data['health'][:n]
+        happiness = self.data['happiness'][:n]
+        wage = self.data['wage'][:n]
+        savings = self.data['savings'][:n]
+        debt = self.data['debt'][:n]
+        days_unemployed = self.data['days_unemployed'][:n]
+        days_homeless = self.data['days_homeless'][:n]
+        employed = self.data['employed'][:n]
+        housed = self.data['housed'][:n]
+
+        # Update homelessness counter
+        days_homeless[:] = np.where(housed, 0, days_homeless + 1)
+
+        # Calculate happiness factors
+        living_cost = self.living_costs()
+        wage_satisfaction = self.wage_satisfaction(living_cost)
+        employment_factor = np.where(employed, 0, -5)
+        housing_happiness = self.housing_happiness()
+
+        # Unemployment penalty increases over time, debt causes stress
+        unemployment_penalty = np.minimum(20, days_unemployed * 0.5)
+        debt_penalty = np.minimum(15, debt * 0.1)
+
+        # Health affects happiness
+        health_factor = (health - 50) / 10
+
+        happiness += (wage_satisfaction + employment_factor + housing_happiness -
+                      unemployment_penalty - debt_penalty + health_factor)
+        np.clip(happiness, 0, 100, out=happiness)
+
+        # Update health (basic decay, faster when very unhealthy)
+        health -= 0.1
+        health[health < 30] -= 0.5
+
+        # Track unemployment
+        days_unemployed[:] = np.where(employed, 0, days_unemployed + 1)
+
+        # Pay living costs including rent (debt has not changed since above)
+        can_pay = savings >= living_cost
+        debt += np.where(can_pay, 0.0, living_cost - savings)
+        savings[:] = np.where(can_pay, savings - living_cost, 0.0)
+
+        # Receive wage if employed
+        paid = employed & (wage > 0)
+        savings[paid] += wage[paid]
+
+        # Apply resource shortage effects
+        if severe_shortage:
+            health -= 2  # Rapid health decline
+            happiness -= 5  # Severe unhappiness
+        self.sync_unhappy()
+
+    def clamp(self):
+        """Keep happiness and health within 0-100"""
+        np.clip(self.column('happiness'), 0, 100, out=self.column('happiness'))
+        np.clip(self.column('health'), 0, 100, out=self.column('health'))
+        self.sync_unhappy()
+
+
+def _float_column(name):
+    """Property reading/writing a float column of the colonist's store row"""
+    def getter(self):
+        return float(self.store.data[name][self.row])
+
+    def setter(self, value):
+        self.store.data[name][self.row] = value
+    return property(getter, setter)
+
+
+def _int_column(name):
+    """Property reading/writing an integer column of the colonist's store row"""
+    def getter(self):
+        return int(self.store.data[name][self.row])
+
+    def setter(self, value):
+        self.store.data[name][self.row] = value
+    return property(getter, setter)
+
 
 class Colonist:
-    def __init__(self, id):
+    """Thin view over one row of a ColonistStore.
+
+    Numeric state lives in the store's arrays; object references such as
+    workplace and housing stay on the view.
+    """
+    health = _float_column('health')
+    wage = _float_column('wage')
+    savings = _float_column('savings')
+    debt = _float_column('debt')
+    days_unemployed = _int_column('days_unemployed')
+    days_homeless = _int_column('days_homeless')  # Track homelessness duration
+    living_cost = _float_column('living_cost')
+    housing_quality = _float_column('housing_quality')  # Quality of current housing
+    rent_cost = _float_column('rent_cost')  # Current rent payment
+
+    def __init__(self, id, store=None):
+        self.store = store if store is not None else ColonistStore(1)
+        self.row = self.store.append(self)
         self.id = id
+        self.population = None  # Population keeping this colonist in its indexes
+        self.workplace = None
+        self._housing = None  # Reference to HabitatBlock if housed
         self.health = random.randint(70, 90)
         self.happiness = random.randint(40, 60)
         self.profession = None
         self.employed = False
-        self.workplace = None
         self.wage = 0
         self.savings = 0
         self.debt = 0
         self.days_unemployed = 0
-        self.days_homeless = 0  # Track homelessness duration
+        self.days_homeless = 0
         self.living_cost = 1.0
-        self.housing = None  # Reference to HabitatBlock if housed
-        self.housing_quality = 0  # Quality of current housing
-        self.rent_cost = 0  # Current rent payment
-        
+        self.housing_quality = 0
+        self.rent_cost = 0
+
+    @property
+    def happiness(self):
+        return float(self.store.data['happiness'][self.row])
+
+    @happiness.setter
+    def happiness(self, value):
+        self.store.data['happiness'][self.row] = value
+        if (value < UNHAPPY_THRESHOLD) != self.store.data['unhappy'][self.row]:
+            self.store.flip_unhappy([self.row])
+
+    @property
+    def employed(self):
+        return bool(self.store.data['employed'][self.row])
+
+    @employed.setter
+    def employed(self, value):
+        self.store.data['employed'][self.row] = value
+
+    @property
+    def housing(self):
+        return self._housing
+
+    @housing.setter
+    def housing(self, building):
+        if self.store.data['unhappy'][self.row] and building is not self._housing:
+            self.move_unhappy(self._housing, building, 'unhappy_residents')
+        if self.population and (building is None) != (self._housing is None):
+            self.population.stats.housing_changed(-1 if building is None else 1)
+        self._housing = building
+        self.store.data['housed'][self.row] = building is not None
+        self.store.data['in_slum'][self.row] = hasattr(building, 'is_slum')
+
+    def count_unhappy(self, delta):
+        """Add delta to the unhappy counters of this colonist's workplace and home"""
+        if self.workplace is not None:
+            self.workplace.unhappy_workers += delta
+        if self._housing is not None:
+            self._housing.unhappy_residents += delta
+
+    def move_unhappy(self, old_building, new_building, counter):
+        """Carry this unhappy colonist's count from one building to another"""
+        if old_building is not None:
+            setattr(old_building, counter, getattr(old_building, counter) - 1)
+        if new_building is not None:
+            setattr(new_building, counter, getattr(new_building, counter) + 1)
+
+    def detach(self, values):
+        """Move this view onto a private one-row store after leaving its population"""
+        self.store = ColonistStore(1)
+        self.row = self.store.append(self)
+        for name, value in values.items():
+            self.store.data[name][self.row] = value
+
     def calculate_living_cost(self):
         """Calculate individual cost of living including rent"""
         base_cost = self.living_cost + (self.debt * 0.01)
@@ -61,75 +389,6 @@ class Colonist:
             # Homelessness penalty
             return -15 - (self.days_homeless * 0.5)
 
-    def update_housing_situation(self, available_housing):
-        """Update housing status - find new housing or check affordability"""
-        # Check if currently housed but can't afford it
-        if self.housing and not self.can_afford_rent():
-            self.housing.remove_resident(self)
-            self.housing = None
-            self.housing_quality = 0
-            self.rent_cost = 0
-            return False
-        
-        # Separate slums from other housing
-        slums = [h for h in available_housing if hasattr(h, 'is_slum') and h.is_slum]
-        regular_housing = [h for h in available_housing if not hasattr(h, 'is_slum') or not h.is_slum]
-        
-        # If homeless, first try to find any affordable regular housing
-        if not self.housing:
-            best_habitat = None
-            for habitat in regular_housing:
-                if (habitat.get_vacancy_count() > 0 and 
-                    self.can_afford_housing(habitat.rent) and 
-                    habitat.quality > self.housing_quality):
-                    
-                    # Found a better option than current best
-                    if not best_habitat or habitat.quality > best_habitat.quality:
-                        best_habitat = habitat
-            
-            # If found affordable regular housing, move there
-            if best_habitat:
-                if best_habitat.add_resident(self):
-                    self.housing = best_habitat
-                    self.housing_quality = best_habitat.quality
-                    self.rent_cost = best_habitat.rent
-                    return True
-            
-            # If no affordable regular housing, try slums (no affordability check for slums)
-            for slum in slums:
-                if slum.get_vacancy_count() > 0 and slum.quality > self.housing_quality:
-                    if slum.add_resident(self):
-                        self.housing = slum
-                        self.housing_quality = slum.quality
-                        self.rent_cost = slum.rent
-                        return True
-        
-        # If already housed, look for upgrades to better housing (regular only)
-        else:
-            best_habitat = None
-            for habitat in regular_housing:
-                if (habitat.get_vacancy_count() > 0 and 
-                    self.can_afford_housing(habitat.rent) and 
-                    habitat.quality > self.housing_quality):
-                    
-                    # Found a better option than current best
-                    if not best_habitat or habitat.quality > best_habitat.quality:
-                        best_habitat = habitat
-            
-            # If found better housing, move there
-            if best_habitat:
-                # Leave current housing
-                self.housing.remove_resident(self)
-                
-                # Move to new housing
-                if best_habitat.add_resident(self):
-                    self.housing = best_habitat
-                    self.housing_quality = best_habitat.quality
-                    self.rent_cost = best_habitat.rent
-                    return True
-        
-        return False
-
     def can_afford_housing(self, rent):
         """Simple check if colonist can afford housing rent"""
         if not self.employed:
@@ -149,58 +408,13 @@ class Colonist:
         else:
             return 20    # Well-off
             
-    def update(self, game_state):
-        """Update colonist status daily"""
-        # Update homelessness counter
-        if not self.housing:
-            self.days_homeless += 1
-        else:
-            self.days_homeless = 0
-            
-        # Calculate happiness factors
-        wage_satisfaction = self.calculate_wage_satisfaction()
-        employment_factor = 0 if self.employed else -5
-        housing_happiness = self.calculate_housing_happiness()
-        
-        # Unemployment penalty increases over time
-        unemployment_penalty = min(20, self.days_unemployed * 0.5)
-        
-        # Debt causes stress
-        debt_penalty = min(15, self.debt * 0.1)
-        
-        # Health affects happiness
-        health_factor = (self.health - 50) / 10
-        
-        # Update happiness with housing effect
-        self.happiness += (wage_satisfaction + employment_factor + housing_happiness - 
-                          unemployment_penalty - debt_penalty + health_factor)
-        self.happiness = max(0, min(100, self.happiness))
-
-        # Update health (basic decay for now)
-        self.health -= 0.1
-        if self.health < 30:
-            self.health -= 0.5  # Faster decay when very unhealthy
-            
-        # Track unemployment
-        if not self.employed:
-            self.days_unemployed += 1
-        else:
-            self.days_unemployed = 0
-            
-        # Pay living costs including rent
-        living_cost = self.calculate_living_cost()
-        if self.savings >= living_cost:
-            self.savings -= living_cost
-        else:
-            self.debt += living_cost - self.savings
-            self.savings = 0
-            
-        # Receive wage if employed
-        if self.employed and self.wage > 0:
-            self.savings += self.wage
-            
     def assign_to_workplace(self, building, wage=None):
         """Assign this colonist to a workplace with optional custom wage"""
+        old_profession = self.profession if self.employed else None
+        old_workplace = self.workplace
+        old_wage = self.wage
+        if self.store.data['unhappy'][self.row] and building is not old_workplace:
+            self.move_unhappy(old_workplace, building, 'unhappy_workers')
         self.workplace = building
         self.employed = True
         if hasattr(building, 'profession'):
@@ -209,17 +423,33 @@ class Colonist:
             self.wage = wage
         else:
             self.wage = building.base_wage  # Use building's base wage if not specified
+        if self.population:
+            self.population.stats.wage_changed(self.wage - old_wage)
+            self.population.workforce.record_move(self, old_workplace, building)
+            self.population.reindex_colonist(self, old_profession)
             
     def unassign_from_workplace(self):
         """Remove this colonist from their workplace"""
+        old_profession = self.profession if self.employed else None
+        old_workplace = self.workplace
+        if self.store.data['unhappy'][self.row]:
+            self.move_unhappy(old_workplace, None, 'unhappy_workers')
         self.workplace = None
         self.employed = False
         self.profession = 'unemployed'
+        old_wage = self.wage
         self.wage = 0
+        if self.population:
+            self.population.stats.wage_changed(-old_wage)
+            self.population.workforce.record_move(self, old_workplace, None)
+            self.population.reindex_colonist(self, old_profession)
         
     def set_wage(self, new_wage):
         """Set a new wage for this colonist"""
         if self.employed:
+            old_wage = self.wage
             self.wage = new_wage
+            if self.population:
+                self.population.stats.wage_changed(self.wage - old_wage)
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,330 @@
+# colony_map.py - Hex map model (terrain, buildings, neighbours) without any rendering
+from area_of_effect import AreaOfEffectService
+from map_adjacency import MapAdjacency
+from terrain import TerrainGenerator, SURFACE_TYPES
+
+
+class MapTile:
+    """A single hex cell of the colony map: terrain plus the building placed on it"""
+    def __init__(self, map_x, map_y, surface_type="regolith", elevation=0):
+        self.map_x = map_x  # Grid x coordinate
+        self.map_y = map_y  # Grid y coordinate
+        self.surface_type = surface_type  # "regolith", "stone", or "ice"
+        self.elevation = elevation  # 0, 1, or 2 (low, medium, high)
+        self.building = None  # Building placed on this hex
+
+    def get_accessible_sides(self, neighbor_elevations):
+        """Determine which sides are accessible based on elevation differences"""
+        accessible = [True] * 6  # Start with all sides accessible
+
+        for i, neighbor_elev in enumerate(neighbor_elevations):
+            if neighbor_elev is not None:  # There is a neighbor
+                elevation_diff = abs(self.elevation - neighbor_elev)
+                if elevation_diff >= 2:  # Two or more levels difference - cannot be crossed
+                    accessible[i] = False
+                # If elevation difference is 1 or 0, it's accessible (no need to change)
+
+        return accessible
+
+    def can_place_building(self, building):
+        """Check if a building can be placed on this hex based on surface type"""
+        if self.building is not None:
+            return False  # Already has a building
+
+        return building.can_be_placed_on(self)
+
+    def place_building(self, building):
+        """Place a building on this hex if valid"""
+        if self.can_place_building(building):
+            self.building = building
+            # Set the building's hex position for area of effect calculations
+            building.set_hex_position(self.map_x, self.map_y)
+            return True
+        return False
+
+    def remove_building(self):
+        """Remove building from this hex"""
+        self.building = None
+
+
+class TileSet:
+    """Set of tiles with O(1) add, discard and random choice"""
+    def __init__(self):
+        self.tiles = []
+        self.positions = {}  # Tile -> index in self.tiles
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def __iter__(self):
+        return iter(list(self.tiles))
+
+    def __contains__(self, tile):
+        return tile in self.positions
+
+    def add(self, tile):
+        if tile not in self.positions:
+            self.positions[tile] = len(self.tiles)
+            self.tiles.append(tile)
+
+    def discard(self, tile):
+        """Remove a tile by moving the last tile into its slot"""
+        index = self.positions.pop(tile, None)
+        if index is None:
+            return
+        last = self.tiles.pop()
+        if last is not tile:
+            self.tiles[index] = last
+            self.positions[last] = index
+
+    def clear(self):
+        self.tiles = []
+        self.positions = {}
+
+    def choice(self, rng):
+        """Random tile using a random.Random-like generator, or None if empty"""
+        if not self.tiles:
+            return None
+        return self.tiles[rng.randrange(len(self.tiles))]
+
+
+class ColonyMap:
+    """Grid of map tiles owned by the simulation; graphics only observe it"""
+    def __init__(self, cols, rows, seed=None):
+        self.cols = cols
+        self.rows = rows
+        self.seed = seed  # Same seed, same terrain
+        self.tiles = []
+        self.grid = []  # Dense [row][col] index of tiles
+        self.adjacency = None  # Neighbour graph, rebuilt when terrain changes
+        self.terrain_version = 0  # Bumped whenever terrain is generated or edited
+        self.dirty_tiles = {}  # Tiles drawn differently since the renderer last looked (ordered set)
+        self.area_of_effect = AreaOfEffectService(self)
+        self.built_neighbors = {}  # Tile -> number of accessible neighbours with a building
+        self.frontier = TileSet()  # Empty tiles next to the colony that can be built on
+        self.create_map()
+
+    def create_map(self):
+        """Create a grid of tiles with varied surfaces and elevations"""
+        elevation_map, surface_map = TerrainGenerator(self.seed).generate(self.cols, self.rows)
+
+        self.tiles = [
+            MapTile(col, row, SURFACE_TYPES[surface], elevation)
+            for row, (elevation_row, surface_row) in enumerate(zip(elevation_map.tolist(), surface_map.tolist()))
+            for col, (elevation, surface) in enumerate(zip(elevation_row, surface_row))
+        ]
+
+        self.grid = [self.tiles[row * self.cols:(row + 1) * self.cols] for row in range(self.rows)]
+        self.adjacency = MapAdjacency(self)
+        self.area_of_effect = AreaOfEffectService(self)
+        self.rebuild_frontier()
+        self.dirty_tiles = dict.fromkeys(self.tiles)
+        self.terrain_version += 1
+
+    def set_terrain(self, tile, surface_type=None, elevation=None):
+        """Change the terrain of a tile, rebuilding the neighbour graph if needed"""
+        self.dirty_tiles[tile] = None
+        if surface_type is not None:
+            tile.surface_type = surface_type
+        if elevation is not None and elevation != tile.elevation:
+            tile.elevation = elevation
+            # Cliff edges of the neighbours are drawn from their elevation difference
+            for x, y in self.get_neighbor_positions(tile.map_x, tile.map_y):
+                neighbor = self.get_hex_at_grid(x, y)
+                if neighbor:
+                    self.dirty_tiles[neighbor] = None
+            self.adjacency = MapAdjacency(self)
+            self.area_of_effect.invalidate()
+            self.rebuild_frontier()
+        self.terrain_version += 1
+
+    def hex_distance(self, pos1, pos2):
+        """Proper hex grid distance calculation using axial coordinates"""
+        x1, y1 = pos1
+        x2, y2 = pos2
+
+        # Convert to axial coordinates
+        z1 = -x1 - y1
+        z2 = -x2 - y2
+
+        return (abs(x1 - x2) + abs(y1 - y2) + abs(z1 - z2)) // 2
+
+    def is_hex_accessible(self, from_hex, to_hex):
+        """Check if a hex is accessible considering elevation differences"""
+        if not from_hex or not to_hex:
+            return False
+        elevation_diff = abs(from_hex.elevation - to_hex.elevation)
+        return elevation_diff < 2  # Accessible if elevation difference is 0 or 1
+
+    def get_area_of_effect_hexes(self, center_pos, radius):
+        """Get all hexes within radius of center position, considering accessibility"""
+        return self.area_of_effect.get(center_pos, radius)
+
+    def get_neighbor_positions(self, x, y):
+        """Get neighboring hex positions"""
+        directions = [
+            (0, -1), (1, 0), (0, 1),
+            (-1, 1), (-1, 0), (-1, -1),
+        ]
+
+        neighbors = []
+        for dx, dy in directions:
+            neighbor_x = x + dx
+            neighbor_y = y + dy
+
+            # Adjust for odd/even rows
+            if y % 2 == 1:  # odd row
+                if dy == 1 or dy == -1:
+                    neighbor_x = x + dx + 1
+
+            neighbors.append((neighbor_x, neighbor_y))
+
+        return neighbors
+
+    def get_neighbor_buildings(self, tile):
+        """Get neighboring buildings for a tile"""
+        return [neighbor.building for neighbor in self.adjacency.neighbors_of(tile) if neighbor.building]
+
+    def get_all_building_neighbors(self):
+        """Get all building neighbors mapping for crime spreading"""
+        building_neighbors = {}
+
+        for tile in self.tiles:
+            if tile.building:
+                neighbors = self.get_neighbor_buildings(tile)
+                building_neighbors[tile.building] = neighbors
+
+        return building_neighbors
+
+    def get_neighbor_elevations(self, tile):
+        """Get elevations of all neighbors for a tile"""
+        neighbor_elevations = []
+        neighbor_positions = self.get_neighbor_positions(tile.map_x, tile.map_y)
+
+        for pos in neighbor_positions:
+            neighbor_hex = self.get_hex_at_grid(pos[0], pos[1])
+            if neighbor_hex:
+                neighbor_elevations.append(neighbor_hex.elevation)
+            else:
+                neighbor_elevations.append(None)
+
+        return neighbor_elevations
+
+    def is_tile_accessible(self, tile):
+        """Check if a tile has at least one side that can be crossed"""
+        return self.adjacency.is_accessible(tile)
+
+    def rebuild_frontier(self):
+        """Recount built neighbours of every tile, e.g. after terrain edits"""
+        self.built_neighbors = {}
+        self.frontier.clear()
+        for tile in self.tiles:
+            count = sum(1 for neighbor in self.adjacency.neighbors_of(tile) if neighbor.building)
+            if count:
+                self.built_neighbors[tile] = count
+                if not tile.building:
+                    self.frontier.add(tile)
+
+    def place_building(self, tile, building):
+        """Place a building on a tile of this map"""
+        if not tile.place_building(building):
+            return False
+        self.area_of_effect.register(building)
+
+        # The tile is taken and its neighbours now border the colony
+        self.frontier.discard(tile)
+        for neighbor in self.adjacency.neighbors_of(tile):
+            self.built_neighbors[neighbor] = self.built_neighbors.get(neighbor, 0) + 1
+            if not neighbor.building:
+                self.frontier.add(neighbor)
+        return True
+
+    def remove_building(self, tile):
+        """Remove the building standing on a tile of this map"""
+        if not tile.building:
+            return
+        self.area_of_effect.unregister(tile.building)
+        tile.remove_building()
+
+        # Neighbours with no other built neighbour leave the frontier
+        for neighbor in self.adjacency.neighbors_of(tile):
+            count = self.built_neighbors[neighbor] - 1
+            if count:
+                self.built_neighbors[neighbor] = count
+            else:
+                del self.built_neighbors[neighbor]
+                self.frontier.discard(neighbor)
+        if tile in self.built_neighbors:
+            self.frontier.add(tile)
+
+    def place_buildings(self, buildings):
+        """Place initial buildings on the map"""
+        # Clear existing buildings
+        for tile in self.tiles:
+            tile.building = None
+        self.area_of_effect.clear()
+        self.rebuild_frontier()
+
+        # Track occupied hexes to avoid duplicates
+        occupied_hexes = set()
+
+        # Find all regolith hexes for mine placement
+        regolith_hexes = [tile for tile in self.tiles if tile.surface_type == "regolith"]
+
+        # Place buildings in specific positions, ensuring mine is on regolith
+        building_positions = [
+            (3, 2, "Mine"),          # Mine - must be on regolith
+            (5, 2, "EnergyGenerator"),  # Energy Generator
+            (7, 2, "OxygenGenerator"),  # Oxygen Generator
+            (4, 4, "HydroponicFarm"),   # Hydroponic Farm
+            (6, 4, "Hospital"),         # Hospital
+            (4, 3, "HabitatBlock"),     # Habitat
+        ]
+
+        for i, (col, row, building_type) in enumerate(building_positions):
+            if i < len(buildings):
+                # For mine, find a regolith hex near the target position
+                if building_type == "Mine" and regolith_hexes:
+                    # Find the closest regolith hex to the target position that's not occupied
+                    target_x, target_y = col, row
+                    available_regolith_hexes = [
+                        tile for tile in regolith_hexes
+                        if (tile.map_x, tile.map_y) not in occupied_hexes
+                    ]
+
+                    if available_regolith_hexes:
+                        closest_hex = min(available_regolith_hexes, key=lambda h:
+                                        abs(h.map_x - target_x) + abs(h.map_y - target_y))
+                        self.place_building(closest_hex, buildings[i])
+                        occupied_hexes.add((closest_hex.map_x, closest_hex.map_y))
+                        regolith_hexes.remove(closest_hex)  # Remove from available regolith hexes
+                    else:
+                        # Fallback: use the specified position if no regolith hexes available
+                        tile = self.get_hex_at_grid(col, row)
+                        if tile and (col, row) not in occupied_hexes:
+                            self.place_building(tile, buildings[i])
+                            occupied_hexes.add((col, row))
+                else:
+                    # For other buildings, use the specified position if not occupied
+                    tile = self.get_hex_at_grid(col, row)
+                    if tile and (col, row) not in occupied_hexes:
+                        self.place_building(tile, buildings[i])
+                        occupied_hexes.add((col, row))
+                    else:
+                        # If the target position is occupied, find the nearest available hex
+                        available_hexes = [
+                            tile for tile in self.tiles
+                            if (tile.map_x, tile.map_y) not in occupied_hexes
+                        ]
+                        if available_hexes:
+                            # Find the closest available hex to the target position
+                            closest_hex = min(available_hexes, key=lambda h:
+                                            abs(h.map_x - col) + abs(h.map_y - row))
+                            self.place_building(closest_hex, buildings[i])
+                            occupied_hexes.add((closest_hex.map_x, closest_hex.map_y))
+
+    def get_hex_at_grid(self, col, row):
+        """Get tile at grid coordinates"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.grid[row][col]
+        return None
@@ -0,0 +1,136 @@
+# crime.py - Crime generation, police suppression and spreading as vector steps
+from operator import attrgetter
+
+import numpy as np
+
+WORKER_CRIME = 2  # Crime per unhappy worker
+RESIDENT_CRIME = 3  # Crime per unhappy resident
+SLUM_CRIME = 8  # Constant crime from slums
+CRIME_DECAY = 2  # Daily decay before new crime is added
+SPREAD_RATE = 0.15  # Share of a source's crime passed to each neighbour
+SPREAD_THRESHOLD = 10  # Sources only spread above this level
+
+
+class CrimeModel:
+    """Crime levels of all buildings as one vector, advanced once per day.
+
+    Two sparse operators in coordinate form are cached: building-to-
+    neighbour spreading weights (scaled by the neighbour's resistance) and
+    police-precinct coverage. Both are rebuilt only when buildings are
+    placed or removed, or when terrain edits change the neighbour graph.
+    Crime levels and source flags live in vectors between steps; they are
+    read from the buildings when the operators are rebuilt and only the
+    entries that changed are written back to the buildings' attributes.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.buildings = []
+        self.registry_version = None
+        self.adjacency = None
+
+        # Spreading operator: crime flows from spread_from[k] to spread_to[k]
+        self.spread_from = np.zeros(0, dtype=np.intp)
+        self.spread_to = np.zeros(0, dtype=np.intp)
+        self.spread_weight = np.zeros(0)
+
+        # Police coverage: precinct police_rows[k] protects building covered_rows[k]
+        self.precincts = []
+        self.police_rows = np.zeros(0, dtype=np.intp)
+        self.covered_rows = np.zeros(0, dtype=np.intp)
+        self.is_slum = np.zeros(0, dtype=bool)
+        self.crime = np.zeros(0)
+        self.source = np.zeros(0, dtype=bool)
+
+    def refresh(self, buildings):
+        """Rebuild the operators if the buildings or the neighbour graph changed"""
+        colony_map = self.game.colony_map
+        if (self.registry_version == buildings.version and self.adjacency is colony_map.adjacency
+                and len(self.buildings) == len(buildings)):
+            return
+        self.buildings = list(buildings)
+        self.registry_version = buildings.version
+        self.adjacency = colony_map.adjacency
+        rows = {building: i for i, building in enumerate(self.buildings)}
+
+        tiles = [colony_map.get_hex_at_grid(*building.hex_position) if building.hex_position else None
+                 for building in self.buildings]
+        spread_from, spread_to, spread_weight = [], [], []
+        for i, (building, tile) in enumerate(zip(self.buildings, tiles)):
+            if tile is None:
+                continue
+            for neighbor in colony_map.get_neighbor_buildings(tile):
+                j = rows.get(neighbor)
+                if j is not None:
+                    spread_from.append(i)
+                    spread_to.append(j)
+                    spread_weight.append(SPREAD_RATE / neighbor.crime_resistance)
+        self.spread_from = np.array(spread_from, dtype=np.intp)
+        self.spread_to = np.array(spread_to, dtype=np.intp)
+        self.spread_weight = np.array(spread_weight, dtype=float)
+
+        # Coverage comes from the map's reverse index of area-of-effect tiles
+        self.precincts = list(buildings.policing)
+        precinct_rows = {precinct: p for p, precinct in enumerate(self.precincts)}
+        police_rows, covered_rows = [], []
+        for j, tile in enumerate(tiles):
+            if tile is None:
+                continue
+            for precinct in colony_map.area_of_effect.covering(tile):
+                p = precinct_rows.get(precinct)
+                if p is not None:
+                    police_rows.append(p)
+                    covered_rows.append(j)
+        self.police_rows = np.array(police_rows, dtype=np.intp)
+        self.covered_rows = np.array(covered_rows, dtype=np.intp)
+
+        self.is_slum = np.array([getattr(b, 'is_slum', False) for b in self.buildings], dtype=bool)
+        self.crime = np.array([b.crime_level for b in self.buildings], dtype=float)
+        self.source = np.array([b.is_crime_source for b in self.buildings], dtype=bool)
+
+    def unhappy_counts(self, counter):
+        """Per-building unhappy totals ('unhappy_workers' or 'unhappy_residents')"""
+        self.game.population.store.sync_unhappy()
+        return np.fromiter(map(attrgetter(counter), self.buildings), dtype=float, count=len(self.buildings))
+
+    def step(self, buildings):
+        """Advance crime by one day: suppression, generation, then spreading.
+
+        Returns the buildings whose crime level changed.
+        """
+        self.refresh(buildings)
+        if not self.buildings:
+            return []
+        count = len(self.buildings)
+        crime = self.crime
+        source = self.source.copy()
+
+        # Police: every precinct's reduction summed over the buildings it covers.
+        # Successive clamps at zero equal one clamp of the total
+        if self.precincts:
+            reduction = np.array([p.calculate_crime_reduction() for p in self.precincts], dtype=float)
+            suppression = np.bincount(self.covered_rows, weights=reduction[self.police_rows], minlength=count)
+            crime = np.maximum(0, crime - suppression)
+
+        # Generation from unhappy workers and residents and from slums
+        generated = (WORKER_CRIME * self.unhappy_counts('unhappy_workers')
+                     + RESIDENT_CRIME * self.unhappy_counts('unhappy_residents')
+                     + SLUM_CRIME * self.is_slum)
+        crime = np.maximum(0, crime - CRIME_DECAY)
+        crime = np.where(generated > 0, np.minimum(100, crime + generated), crime)
+        source |= generated > 0  # Once a source, always a source
+
+        # Spreading from sources above the threshold, all from the same day's levels
+        spreading = np.where(source & (crime > SPREAD_THRESHOLD), crime, 0)
+        spread = np.bincount(self.spread_to, weights=self.spread_weight * spreading[self.spread_from],
+                             minlength=count)
+        crime = np.where(spread > 0, np.minimum(100, crime + spread), crime)
+
+        # Write back only what changed, so untouched buildings keep their flow rows
+        changed = np.flatnonzero(crime != self.crime).tolist()
+        for i in changed:
+            self.buildings[i].crime_level = float(crime[i])
+        for i in np.flatnonzero(source != self.source).tolist():
+            self.buildings[i].is_crime_source = True
+        self.crime = crime
+        self.source = source
+        return [self.buildings[i] for i in changed]
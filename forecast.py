@@ -0,0 +1,57 @@
+# forecast.py - Cached projection of the next day's resource changes
+import numpy as np
+
+from resource_flow import RESOURCES, RESOURCE_INDEX
+
+
+class ForecastService:
+    """Projects next-day resource deltas and caches them until the state changes.
+
+    The cache is keyed on version stamps of everything the projection reads:
+    resource stocks (trades, day updates), the building registry
+    (construction, demolition), the resource-flow inputs (worker
+    assignments, crime, activity), the population (wages, housing, head
+    count) and the day.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.state_key = None
+        self.changes = dict.fromkeys(RESOURCES, 0)
+
+    def current_state(self):
+        """Version stamps of every input to the projection"""
+        game = self.game
+        return (game.resources.version, game.buildings.version, game.resources.flow.version,
+                game.population.stats.version, game.day)
+
+    def invalidate(self):
+        """Force a recalculation on the next read"""
+        self.state_key = None
+
+    def get_changes(self):
+        """Projected change of every resource over the next day"""
+        if self.state_key != self.current_state():
+            self.changes = self.calculate()
+            self.state_key = self.current_state()
+        return self.changes
+
+    def calculate(self):
+        """Calculate expected resource changes for the next day"""
+        pop = self.game.population
+        res = self.game.resources
+
+        # Building production and consumption
+        stock = np.array([getattr(res, resource) for resource in RESOURCES], dtype=float)
+        production, consumption = res.flow.daily_totals(self.game.buildings, stock)
+        changes = production - consumption
+
+        # Base consumption by population
+        changes[RESOURCE_INDEX['oxygen']] -= pop.count * 0.1
+        changes[RESOURCE_INDEX['food']] -= pop.count * 0.2
+        changes[RESOURCE_INDEX['energy']] -= pop.count * 0.05
+
+        # Wage cost and rent income
+        changes[RESOURCE_INDEX['credits']] -= pop.calculate_total_wages()
+        changes[RESOURCE_INDEX['credits']] += pop.store.rent_income()
+
+        return dict(zip(RESOURCES, changes.tolist()))
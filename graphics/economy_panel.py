@@ -9,15 +9,16 @@ class EconomyPanel:
     def draw(self, population):
         """Draw the economy panel"""
         self.screen.draw_panel(self.rect.x, self.rect.y, self.rect.width, self.rect.height, "Economy")
+        stats = population.stats.refresh()
         
-        text = self.screen.graphics.small_font.render(f"Avg wage: {self.screen.format_number(population.calculate_average_wage())} credits", True, self.screen.graphics.colors['text'])
+        text = self.screen.graphics.small_font.render(f"Avg wage: {self.screen.format_number(stats.average_wage)} credits", True, self.screen.graphics.colors['text'])
         self.screen.graphics.screen.blit(text, (self.rect.x + 10, self.rect.y + 40))
         
-        daily_cost = self.screen.format_number(population.calculate_total_wages())
+        daily_cost = self.screen.format_number(stats.total_wages)
         text = self.screen.graphics.small_font.render(f"Daily cost: {daily_cost}", True, self.screen.graphics.colors['text'])
         self.screen.graphics.screen.blit(text, (self.rect.x + 10, self.rect.y + 60))
         
-        text = self.screen.graphics.small_font.render(f"Employed: {population.employed_workers}/{population.count}", True, self.screen.graphics.colors['text'])
+        text = self.screen.graphics.small_font.render(f"Employed: {stats.employed}/{stats.count}", True, self.screen.graphics.colors['text'])
         self.screen.graphics.screen.blit(text, (self.rect.x + 10, self.rect.y + 80))
         
         # Add portfolio value if stock market exists
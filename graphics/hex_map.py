@@ -1,399 +1,284 @@
 # hex_map.py - Updated with road drawing functionality
 import pygame
 import math
-import random
+from collections import OrderedDict
 from .hexagon import Hexagon
+from . import texture_cache
+
+CHUNK_SIZE = 8  # Tiles per side of a pre-rendered terrain chunk (even, so chunks start on even rows)
+CHUNK_CACHE_LIMIT = 64  # Rendered chunks kept across all zoom levels
+ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.5, 2.0)  # Multiples of the base hex size
+PAN_STEP = 40  # Pixels moved per arrow key press
 
 class HexMap:
-    def __init__(self, x, y, width, height, hex_size=35):
+    """Draws the simulation's ColonyMap and turns mouse input into map actions.
+
+    The map is seen through a camera: `origin_x`/`origin_y` is the screen
+    position of the center of hex (0, 0) and `hex_size` follows the zoom
+    level. Terrain is rendered per chunk of tiles and zoom level and cached,
+    and only chunks and hexagons inside the panel are drawn, so a frame costs
+    the same on any map size.
+    """
+    def __init__(self, x, y, width, height, colony_map, hex_size=35):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self.hex_size = hex_size
-        self.hexagons = []
-        self.selected_hex = None
+        self.base_hex_size = hex_size
+        self.zoom_sizes = [max(8, round(hex_size * zoom)) for zoom in ZOOM_LEVELS]
+        self.zoom_index = ZOOM_LEVELS.index(1.0)
+        self.hex_size = self.zoom_sizes[self.zoom_index]
+        self.colony_map = colony_map  # Map model owned by the simulation core
+        self.screen_hexes = {}  # (col, row) -> Hexagon at the current camera, created on demand
+        self.origin_x = x  # Screen position of the center of hex (0, 0)
+        self.origin_y = y
+        self.selected_tile = None
         self.area_of_effect_hexes = []  # New: store hexes for AoE visualization
+        
+        # Pre-rendered terrain chunks, dropped when one of their hexes is marked dirty
+        self.chunks = OrderedDict()  # (hex_size, chunk_row, chunk_col) -> surface, least recently used first
+        self.terrain_version = self.colony_map.terrain_version
+        self.colony_map.dirty_tiles.clear()  # Nothing is cached yet
+        
+        self.preload_textures()
         self.create_map()
     
+    def preload_textures(self):
+        """Scale the surface textures once for every zoom level"""
+        for size in self.zoom_sizes:
+            for path in Hexagon.texture_paths.values():
+                texture_cache.get_texture(path, size * 4)
+    
     def create_map(self):
-        """Create a grid of hexagons with varied surfaces and elevations"""
-        self.hexagons = []
-        hex_width = self.hex_size * math.sqrt(3)
-        hex_height = self.hex_size * 1.5
-        
-        # Calculate how many rows and columns fit in the available space
-        max_cols = int(self.width / hex_width) - 1
-        max_rows = int(self.height / hex_height) - 1
-        
-        # Generate elevation map first
-        elevation_map = self.generate_elevation_map(max_cols, max_rows)
-        
-        # Generate surface map based on elevation
-        surface_map = self.generate_surface_map(max_cols, max_rows, elevation_map)
-        
-        # Ensure at least 3 ice hexes
-        self.ensure_minimum_ice(surface_map, elevation_map, max_cols, max_rows, 3)
-        
-        # Ensure no completely inaccessible hexes
-        self.ensure_accessibility(elevation_map, max_cols, max_rows)
-        
-        # Ensure at least 3 regolith hexes for initial mine placement
-        self.ensure_minimum_regolith(surface_map, max_cols, max_rows, 3)
-        
-        # Calculate total map dimensions to center the grid
-        total_map_width = (max_cols - 0.5) * hex_width
-        total_map_height = (max_rows-2) * hex_height + self.hex_size * 2
-        
-        # Calculate offset to center the map within the panel
-        offset_x = (self.width - total_map_width) / 2
-        offset_y = (self.height - total_map_height) / 2 
-        
-        for row in range(max_rows):
-            for col in range(max_cols):
-                x = col * hex_width
-                y = row * hex_height
-                
-                # Offset every other row
-                if row % 2 == 1:
-                    x += hex_width / 2
-                
-                # Position within the map area with centering
-                x += self.x + offset_x
-                y += self.y + offset_y
-                
-                # Get surface type and elevation from our generated maps
-                surface_type = surface_map[row][col]
-                elevation = elevation_map[row][col]
-                
-                hexagon = Hexagon(x, y, self.hex_size, col, row, surface_type, elevation)
-                self.hexagons.append(hexagon)
+        """Reset the camera: maps that fit are centered, larger ones start at the top left corner"""
+        self.origin_x = self.x + self.width
+        self.origin_y = self.y + self.height
+        self.clamp_camera()
     
-    def ensure_minimum_regolith(self, surface_map, cols, rows, min_regolith):
-        """Ensure there are at least min_regolith regolith hexes on the map"""
-        regolith_count = sum(1 for row in surface_map for cell in row if cell == "regolith")
-        
-        if regolith_count < min_regolith:
-            # Find cells that aren't already regolith
-            non_regolith_cells = []
-            for row in range(rows):
-                for col in range(cols):
-                    if surface_map[row][col] != "regolith":
-                        non_regolith_cells.append((row, col))
-            
-            # Convert some to regolith
-            needed = min_regolith - regolith_count
-            if needed > 0 and non_regolith_cells:
-                # Convert the needed number of cells
-                for _ in range(min(needed, len(non_regolith_cells))):
-                    row, col = random.choice(non_regolith_cells)
-                    surface_map[row][col] = "regolith"
-                    non_regolith_cells.remove((row, col))
+    @property
+    def hex_width(self):
+        return self.hex_size * math.sqrt(3)
     
-    def generate_elevation_map(self, cols, rows):
-        """Generate a map with more frequent elevation changes"""
-        # Create multiple noise layers for more varied elevation
-        noise_layers = []
-        for i in range(3):  # Three layers of noise
-            scale = 2 ** i  # Different scales for each layer
-            noise_map = [[random.random() * scale for _ in range(cols)] for _ in range(rows)]
-            noise_layers.append(noise_map)
-        
-        # Combine noise layers
-        combined = [[0 for _ in range(cols)] for _ in range(rows)]
-        for row in range(rows):
-            for col in range(cols):
-                total = 0
-                for layer in noise_layers:
-                    total += layer[row][col]
-                combined[row][col] = total / len(noise_layers)
-        
-        # Normalize to 0-1 range
-        min_val = min(min(row) for row in combined)
-        max_val = max(max(row) for row in combined)
-        normalized = [[(val - min_val) / (max_val - min_val) for val in row] for row in combined]
-        
-        # Convert to elevation levels (0, 1, 2) with more frequent changes
-        elevation_map = [[0 for _ in range(cols)] for _ in range(rows)]
-        for row in range(rows):
-            for col in range(cols):
-                if normalized[row][col] < 0.3:
-                    elevation_map[row][col] = 0  # Low
-                elif normalized[row][col] < 0.6:
-                    elevation_map[row][col] = 1  # Medium
-                else:
-                    elevation_map[row][col] = 2  # High
-        
-        return elevation_map
+    @property
+    def row_height(self):
+        return self.hex_size * 1.5
     
-    def generate_surface_map(self, cols, rows, elevation_map):
-        """Generate surface map based on elevation"""
-        surface_map = [["regolith" for _ in range(cols)] for _ in range(rows)]
+    @property
+    def selected_hex(self):
+        if self.selected_tile is None:
+            return None
+        return self.get_hex_at_grid(self.selected_tile.map_x, self.selected_tile.map_y)
+    
+    @selected_hex.setter
+    def selected_hex(self, hexagon):
+        self.selected_tile = hexagon.tile if hexagon else None
+    
+    def clamp_camera(self):
+        """Center the map on axes where it fits the panel, otherwise keep the panel covered"""
+        cols, rows = self.colony_map.cols, self.colony_map.rows
+        margin = 10
+        
+        map_width = (cols - 0.5) * self.hex_width
+        if map_width <= self.width:
+            self.origin_x = self.x + (self.width - map_width) / 2
+        else:
+            left_limit = self.x + self.hex_width / 2 + margin
+            right_limit = self.x + self.width - cols * self.hex_width - margin
+            self.origin_x = min(left_limit, max(right_limit, self.origin_x))
         
-        for row in range(rows):
-            for col in range(cols):
-                elevation = elevation_map[row][col]
-                
-                # Higher elevation is more likely to be stone
-                if elevation == 2:  # High elevation
-                    surface_map[row][col] = "stone"
-                elif elevation == 0:  # Low elevation
-                    if random.random() < 0.3:  # 30% chance for ice at low elevation
-                        surface_map[row][col] = "ice"
-                elif elevation == 1:  # Medium elevation
-                    if random.random() < 0.6:  # 60% chance for stone at medium elevation
-                        surface_map[row][col] = "stone"
+        map_height = (rows - 2) * self.row_height + self.hex_size * 2
+        if map_height <= self.height:
+            self.origin_y = self.y + (self.height - map_height) / 2
+        else:
+            top_limit = self.y + self.hex_size - min(Hexagon.elevation_offsets.values()) + margin
+            bottom_limit = self.y + self.height - (rows - 1) * self.row_height - self.hex_size - margin
+            self.origin_y = min(top_limit, max(bottom_limit, self.origin_y))
         
-        return surface_map
+        self.screen_hexes = {}  # Hexagons are rebuilt at the new camera position
     
-    def ensure_minimum_ice(self, surface_map, elevation_map, cols, rows, min_ice):
-        """Ensure there are at least min_ice ice hexes on the map"""
-        ice_count = sum(1 for row in surface_map for cell in row if cell == "ice")
-        
-        if ice_count < min_ice:
-            # Find low elevation cells that aren't already ice
-            low_elevation_cells = []
-            for row in range(rows):
-                for col in range(cols):
-                    if elevation_map[row][col] == 0 and surface_map[row][col] != "ice":
-                        low_elevation_cells.append((row, col))
-            
-            # Convert some to ice
-            needed = min_ice - ice_count
-            if needed > 0 and low_elevation_cells:
-                # Convert the needed number of cells
-                for _ in range(min(needed, len(low_elevation_cells))):
-                    row, col = random.choice(low_elevation_cells)
-                    surface_map[row][col] = "ice"
-                    low_elevation_cells.remove((row, col))
+    def pan(self, dx, dy):
+        """Move the view by a screen offset"""
+        self.origin_x += dx
+        self.origin_y += dy
+        self.clamp_camera()
     
-    def ensure_accessibility(self, elevation_map, cols, rows):
-        """Ensure no hexes are completely inaccessible"""
-        directions = [
-            (0, -1), (1, 0), (0, 1), 
-            (-1, 1), (-1, 0), (-1, -1),
-        ]
-        
-        # Check each hex and fix if completely inaccessible
-        for row in range(rows):
-            for col in range(cols):
-                current_elevation = elevation_map[row][col]
-                inaccessible_count = 0
-                
-                # Count inaccessible neighbors
-                for dx, dy in directions:
-                    n_row, n_col = row + dy, col + dx
-                    if 0 <= n_row < rows and 0 <= n_col < cols:
-                        neighbor_elevation = elevation_map[n_row][n_col]
-                        if abs(current_elevation - neighbor_elevation) >= 2:
-                            inaccessible_count += 1
-                    else:
-                        inaccessible_count += 1  # Edge of map is inaccessible
-                
-                # If all sides are inaccessible, adjust elevation
-                if inaccessible_count >= 6:
-                    # Find the most common elevation among neighbors
-                    neighbor_elevations = []
-                    for dx, dy in directions:
-                        n_row, n_col = row + dy, col + dx
-                        if 0 <= n_row < rows and 0 <= n_col < cols:
-                            neighbor_elevations.append(elevation_map[n_row][n_col])
-                    
-                    if neighbor_elevations:
-                        # Set to the most common neighbor elevation
-                        most_common = max(set(neighbor_elevations), key=neighbor_elevations.count)
-                        elevation_map[row][col] = most_common
-                    else:
-                        # If no neighbors (shouldn't happen), set to medium elevation
-                        elevation_map[row][col] = 1
+    def zoom_at(self, pos, steps):
+        """Change the zoom level by `steps`, keeping the point under `pos` in place"""
+        zoom_index = max(0, min(len(self.zoom_sizes) - 1, self.zoom_index + steps))
+        if zoom_index == self.zoom_index:
+            return
+        scale = self.zoom_sizes[zoom_index] / self.hex_size
+        self.zoom_index = zoom_index
+        self.hex_size = self.zoom_sizes[zoom_index]
+        self.origin_x = pos[0] - (pos[0] - self.origin_x) * scale
+        self.origin_y = pos[1] - (pos[1] - self.origin_y) * scale
+        self.clamp_camera()
+    
+    def handle_camera_event(self, event):
+        """Pan with the right or middle mouse button and arrow keys, zoom with the wheel"""
+        map_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        if event.type == pygame.MOUSEWHEEL:
+            mouse_pos = pygame.mouse.get_pos()
+            if map_rect.collidepoint(mouse_pos):
+                self.zoom_at(mouse_pos, event.y)
+                return True
+        elif event.type == pygame.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+            if map_rect.collidepoint(event.pos):
+                self.pan(*event.rel)
+                return True
+        elif event.type == pygame.KEYDOWN:
+            arrows = {
+                pygame.K_LEFT: (PAN_STEP, 0),
+                pygame.K_RIGHT: (-PAN_STEP, 0),
+                pygame.K_UP: (0, PAN_STEP),
+                pygame.K_DOWN: (0, -PAN_STEP),
+            }
+            if event.key in arrows:
+                self.pan(*arrows[event.key])
+                return True
+        return False
+    
+    def get_visible_range(self):
+        """Rows and columns (as ranges) of the hexes that can appear in the panel"""
+        raise_height = -min(Hexagon.elevation_offsets.values())
+        first_row = math.floor((self.y - self.origin_y - self.hex_size) / self.row_height)
+        last_row = math.ceil((self.y + self.height - self.origin_y + self.hex_size + raise_height) / self.row_height)
+        first_col = math.floor((self.x - self.origin_x - self.hex_width) / self.hex_width)
+        last_col = math.ceil((self.x + self.width - self.origin_x + self.hex_width / 2) / self.hex_width)
+        return (range(max(0, first_row), min(self.colony_map.rows, last_row + 1)),
+                range(max(0, first_col), min(self.colony_map.cols, last_col + 1)))
+    
+    def visible_hexagons(self):
+        """Hexagons that can appear in the panel, in map order"""
+        rows, cols = self.get_visible_range()
+        return [self.get_hex_at_grid(col, row) for row in rows for col in cols]
+    
+    def mark_dirty(self, tile):
+        """Redraw the terrain chunk holding a tile (at every zoom level) on the next frame"""
+        chunk = (tile.map_y // CHUNK_SIZE, tile.map_x // CHUNK_SIZE)
+        for key in [key for key in self.chunks if key[1:] == chunk]:
+            del self.chunks[key]
+    
+    def get_chunk_tiles(self, chunk_row, chunk_col):
+        """Tiles of a chunk in map order"""
+        grid = self.colony_map.grid
+        return [tile
+                for row in grid[chunk_row * CHUNK_SIZE:(chunk_row + 1) * CHUNK_SIZE]
+                for tile in row[chunk_col * CHUNK_SIZE:(chunk_col + 1) * CHUNK_SIZE]]
+    
+    def get_chunk_anchor(self, chunk_row, chunk_col):
+        """Offset of a chunk's first hex center from hex (0, 0), and the padding around it"""
+        anchor = (chunk_col * CHUNK_SIZE * self.hex_width, chunk_row * CHUNK_SIZE * self.row_height)
+        padding = (self.hex_width, self.hex_size - min(Hexagon.elevation_offsets.values()) + 4)
+        return anchor, padding
+    
+    def render_chunk(self, chunk_row, chunk_col, colors, fonts):
+        """Draw the terrain of one chunk at the current zoom level"""
+        (anchor_x, anchor_y), (pad_x, pad_y) = self.get_chunk_anchor(chunk_row, chunk_col)
+        surface = pygame.Surface((math.ceil(CHUNK_SIZE * self.hex_width + 2 * pad_x),
+                                  math.ceil(pad_y + (CHUNK_SIZE - 1) * self.row_height + self.hex_size + 6)),
+                                 pygame.SRCALPHA)
+        adjacency = self.colony_map.adjacency
+        tiles = self.get_chunk_tiles(chunk_row, chunk_col)
+        for tile in tiles:
+            x = tile.map_x * self.hex_width + (tile.map_y % 2) * self.hex_width / 2 - anchor_x + pad_x
+            y = tile.map_y * self.row_height - anchor_y + pad_y
+            Hexagon(x, y, self.hex_size, tile).draw_terrain(surface, colors, fonts, adjacency.sides_of(tile))
+        return surface
+    
+    def get_chunk(self, chunk_row, chunk_col, colors, fonts):
+        """Cached terrain surface of a chunk at the current zoom level"""
+        key = (self.hex_size, chunk_row, chunk_col)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+        else:
+            self.chunks[key] = self.render_chunk(chunk_row, chunk_col, colors, fonts)
+            if len(self.chunks) > CHUNK_CACHE_LIMIT:
+                self.chunks.popitem(last=False)
+        return self.chunks[key]
+    
+    def update_terrain_chunks(self):
+        """Mark the chunks of tiles whose terrain changed since the last frame dirty"""
+        if self.terrain_version == self.colony_map.terrain_version:
+            return
+        # One tile per chunk is enough to drop it
+        chunks = {(tile.map_y // CHUNK_SIZE, tile.map_x // CHUNK_SIZE): tile for tile in self.colony_map.dirty_tiles}
+        for tile in chunks.values():
+            self.mark_dirty(tile)
+        self.colony_map.dirty_tiles.clear()
+        self.screen_hexes = {}  # Raised or lowered hexes change shape
+        self.terrain_version = self.colony_map.terrain_version
+    
+    def draw_terrain(self, screen, colors, fonts):
+        """Blit the terrain chunks overlapping the panel"""
+        self.update_terrain_chunks()
+        rows, cols = self.get_visible_range()
+        if not rows or not cols:
+            return
+        for chunk_row in range(rows[0] // CHUNK_SIZE, rows[-1] // CHUNK_SIZE + 1):
+            for chunk_col in range(cols[0] // CHUNK_SIZE, cols[-1] // CHUNK_SIZE + 1):
+                (anchor_x, anchor_y), (pad_x, pad_y) = self.get_chunk_anchor(chunk_row, chunk_col)
+                surface = self.get_chunk(chunk_row, chunk_col, colors, fonts)
+                screen.blit(surface, (round(self.origin_x + anchor_x - pad_x), round(self.origin_y + anchor_y - pad_y)))
     
     def get_hex_at_position(self, pos):
         """Get the hexagon at a given screen position"""
-        for hexagon in self.hexagons:
-            if hexagon.contains_point(pos):
+        # Raised hexes are drawn shifted up, so look up the hex under the point
+        # for every elevation offset, plus its neighbours for edge cases
+        candidates = set()
+        for offset in set(Hexagon.elevation_offsets.values()):
+            col, row = self.pixel_to_grid(pos[0] - self.origin_x, pos[1] - offset - self.origin_y)
+            candidates.add((row, col))
+            for n_col, n_row in self.colony_map.get_neighbor_positions(col, row):
+                candidates.add((n_row, n_col))
+        
+        # Check in map order so overlapping hexes resolve like a full scan
+        for row, col in sorted(candidates):
+            hexagon = self.get_hex_at_grid(col, row)
+            if hexagon and hexagon.contains_point(pos):
                 return hexagon
         return None
     
-    def hex_distance(self, pos1, pos2):
-        """Proper hex grid distance calculation using axial coordinates"""
-        x1, y1 = pos1
-        x2, y2 = pos2
-        
-        # Convert to axial coordinates
-        z1 = -x1 - y1
-        z2 = -x2 - y2
-        
-        return (abs(x1 - x2) + abs(y1 - y2) + abs(z1 - z2)) // 2
-    
-    def is_hex_accessible(self, from_hex, to_hex):
-        """Check if a hex is accessible considering elevation differences"""
-        if not from_hex or not to_hex:
-            return False
-        elevation_diff = abs(from_hex.elevation - to_hex.elevation)
-        return elevation_diff < 2  # Accessible if elevation difference is 0 or 1
-
-    def get_area_of_effect_hexes(self, center_pos, radius):
-        """Get all hexes within radius of center position, considering accessibility"""
-        center_hex = self.get_hex_at_grid(center_pos[0], center_pos[1])
-        if not center_hex:
-            return []
-        
-        visited = set()
-        queue = [(center_hex, 0)]  # (hex, distance)
-        affected_hexes = []
-        
-        while queue:
-            current_hex, distance = queue.pop(0)
-            
-            if current_hex in visited:
-                continue
-                
-            visited.add(current_hex)
-            affected_hexes.append(current_hex)
-            
-            # If we haven't reached max distance, explore neighbors
-            if distance < radius:
-                # Get all neighbor positions
-                neighbor_positions = self.get_neighbor_positions(current_hex.map_x, current_hex.map_y)
-                
-                for pos in neighbor_positions:
-                    neighbor_hex = self.get_hex_at_grid(pos[0], pos[1])
-                    if neighbor_hex and neighbor_hex not in visited:
-                        # Check if this neighbor is accessible from current hex
-                        if self.is_hex_accessible(current_hex, neighbor_hex):
-                            queue.append((neighbor_hex, distance + 1))
+    def pixel_to_grid(self, px, py):
+        """Grid (col, row) of the unraised hex under a point relative to hex (0, 0)"""
+        # Pixel to fractional axial coordinates (pointy-top layout)
+        q = (math.sqrt(3) / 3 * px - py / 3) / self.hex_size
+        r = (2 / 3 * py) / self.hex_size
+        
+        # Cube rounding
+        x, z = q, r
+        y = -x - z
+        rx, ry, rz = round(x), round(y), round(z)
+        dx, dy, dz = abs(rx - x), abs(ry - y), abs(rz - z)
+        if dx > dy and dx > dz:
+            rx = -ry - rz
+        elif dy > dz:
+            ry = -rx - rz
+        else:
+            rz = -rx - ry
         
-        return affected_hexes
+        # Axial to odd-row offset coordinates
+        return rx + (rz - (rz & 1)) // 2, rz
     
-    def get_neighbor_positions(self, x, y):
-        """Get neighboring hex positions"""
-        directions = [
-            (0, -1), (1, 0), (0, 1), 
-            (-1, 1), (-1, 0), (-1, -1),
-        ]
-        
-        neighbors = []
-        for dx, dy in directions:
-            neighbor_x = x + dx
-            neighbor_y = y + dy
-            
-            # Adjust for odd/even rows
-            if y % 2 == 1:  # odd row
-                if dy == 1 or dy == -1:
-                    neighbor_x = x + dx + 1
-            
-            neighbors.append((neighbor_x, neighbor_y))
-            
-        return neighbors
-
-    def get_neighbor_buildings(self, hexagon):
-        """Get neighboring buildings for a hexagon"""
-        neighbor_buildings = []
-        neighbor_positions = self.get_neighbor_positions(hexagon.map_x, hexagon.map_y)
-        
-        for pos in neighbor_positions:
-            neighbor_hex = self.get_hex_at_grid(pos[0], pos[1])
-            if neighbor_hex and neighbor_hex.building:
-                if self.is_hex_accessible(hexagon, neighbor_hex):
-                    neighbor_buildings.append(neighbor_hex.building)
-                
-        return neighbor_buildings
+    def hex_distance(self, pos1, pos2):
+        """Hex grid distance between two grid positions"""
+        return self.colony_map.hex_distance(pos1, pos2)
     
-    def get_all_building_neighbors(self):
-        """Get all building neighbors mapping for crime spreading"""
-        building_neighbors = {}
-        
-        for hexagon in self.hexagons:
-            if hexagon.building:
-                neighbors = self.get_neighbor_buildings(hexagon)
-                building_neighbors[hexagon.building] = neighbors
-                
-        return building_neighbors
-
     def get_neighbor_elevations(self, hexagon):
-        """Get elevations of all neighbors for a hexagon - UPDATED to use get_neighbor_positions"""
-        neighbor_elevations = []
-        neighbor_positions = self.get_neighbor_positions(hexagon.map_x, hexagon.map_y)
-        
-        for pos in neighbor_positions:
-            neighbor_hex = self.get_hex_at_grid(pos[0], pos[1])
-            if neighbor_hex:
-                neighbor_elevations.append(neighbor_hex.elevation)
-            else:
-                neighbor_elevations.append(None)
-                
-        return neighbor_elevations
-
-    def place_buildings(self, buildings):
-        """Place initial buildings on the map"""
-        # Clear existing buildings
-        for hexagon in self.hexagons:
-            hexagon.building = None
-        
-        # Track occupied hexes to avoid duplicates
-        occupied_hexes = set()
-        
-        # Find all regolith hexes for mine placement
-        regolith_hexes = [hex for hex in self.hexagons if hex.surface_type == "regolith"]
-        
-        # Place buildings in specific positions, ensuring mine is on regolith
-        building_positions = [
-            (3, 2, "Mine"),          # Mine - must be on regolith
-            (5, 2, "EnergyGenerator"),  # Energy Generator
-            (7, 2, "OxygenGenerator"),  # Oxygen Generator
-            (4, 4, "HydroponicFarm"),   # Hydroponic Farm
-            (6, 4, "Hospital"),         # Hospital
-            (4, 3, "HabitatBlock"),     # Habitat
-        ]
-        
-        for i, (col, row, building_type) in enumerate(building_positions):
-            if i < len(buildings):
-                # For mine, find a regolith hex near the target position
-                if building_type == "Mine" and regolith_hexes:
-                    # Find the closest regolith hex to the target position that's not occupied
-                    target_x, target_y = col, row
-                    available_regolith_hexes = [
-                        hex for hex in regolith_hexes 
-                        if (hex.map_x, hex.map_y) not in occupied_hexes
-                    ]
-                    
-                    if available_regolith_hexes:
-                        closest_hex = min(available_regolith_hexes, key=lambda h: 
-                                        abs(h.map_x - target_x) + abs(h.map_y - target_y))
-                        closest_hex.place_building(buildings[i])
-                        occupied_hexes.add((closest_hex.map_x, closest_hex.map_y))
-                        regolith_hexes.remove(closest_hex)  # Remove from available regolith hexes
-                    else:
-                        # Fallback: use the specified position if no regolith hexes available
-                        hexagon = self.get_hex_at_grid(col, row)
-                        if hexagon and (col, row) not in occupied_hexes:
-                            hexagon.place_building(buildings[i])
-                            occupied_hexes.add((col, row))
-                else:
-                    # For other buildings, use the specified position if not occupied
-                    hexagon = self.get_hex_at_grid(col, row)
-                    if hexagon and (col, row) not in occupied_hexes:
-                        hexagon.place_building(buildings[i])
-                        occupied_hexes.add((col, row))
-                    else:
-                        # If the target position is occupied, find the nearest available hex
-                        available_hexes = [
-                            hex for hex in self.hexagons 
-                            if (hex.map_x, hex.map_y) not in occupied_hexes
-                        ]
-                        if available_hexes:
-                            # Find the closest available hex to the target position
-                            closest_hex = min(available_hexes, key=lambda h: 
-                                            abs(h.map_x - col) + abs(h.map_y - row))
-                            closest_hex.place_building(buildings[i])
-                            occupied_hexes.add((closest_hex.map_x, closest_hex.map_y))
+        """Get elevations of all neighbors for a hexagon"""
+        return self.colony_map.get_neighbor_elevations(hexagon.tile)
     
     def get_hex_at_grid(self, col, row):
-        """Get hexagon at grid coordinates"""
-        for hexagon in self.hexagons:
-            if hexagon.map_x == col and hexagon.map_y == row:
-                return hexagon
-        return None
+        """Get hexagon at grid coordinates, positioned for the current camera"""
+        hexagon = self.screen_hexes.get((col, row))
+        if hexagon is None:
+            tile = self.colony_map.get_hex_at_grid(col, row)
+            if tile is None:
+                return None
+            x = self.origin_x + col * self.hex_width + (row % 2) * self.hex_width / 2
+            y = self.origin_y + row * self.row_height
+            hexagon = self.screen_hexes[(col, row)] = Hexagon(x, y, self.hex_size, tile)
+        return hexagon
     
     # hex_map.py - update the draw method and handle_click method
     def draw(self, screen, colors, fonts):
@@ -431,10 +316,14 @@ class HexMap:
             screen.blit(instruction_text, text_rect)
             
         
-        # Draw all hexagons with their neighbor elevations
-        for hexagon in self.hexagons:
-            selected = (hexagon == self.selected_hex)
-            neighbor_elevations = self.get_neighbor_elevations(hexagon)
+        # Draw the cached terrain, then buildings, selection and highlights on top,
+        # all clipped to the panel
+        previous_clip = screen.get_clip()
+        screen.set_clip(pygame.Rect(self.x, self.y, self.width, self.height).clip(previous_clip))
+        self.draw_terrain(screen, colors, fonts)
+        
+        for hexagon in self.visible_hexagons():
+            selected = (hexagon.tile is self.selected_tile)
 
             # Highlight empty hexagons in construction mode
             construction_highlight = False
@@ -459,16 +348,16 @@ class HexMap:
             if construction_highlight:
                 if construction_valid:
                     # Valid construction site - use normal highlighting
-                    hexagon.draw(screen, colors, fonts, True, neighbor_elevations)
+                    hexagon.draw_overlay(screen, colors, fonts, True)
                     # Draw a green outline around available hexagons
                     pygame.draw.polygon(screen, (0, 255, 0), hexagon.vertices, 3)
                 else:
                     # Invalid construction site - draw with red tint
-                    hexagon.draw(screen, colors, fonts, False, neighbor_elevations)
+                    hexagon.draw_overlay(screen, colors, fonts, False)
                     # Draw a red outline
                     pygame.draw.polygon(screen, (255, 0, 0), hexagon.vertices, 3)
             else:
-                hexagon.draw(screen, colors, fonts, selected, neighbor_elevations)
+                hexagon.draw_overlay(screen, colors, fonts, selected)
         
         # Draw area of effect highlights if a building with AoE is selected
         if (self.selected_hex and self.selected_hex.building and 
@@ -476,6 +365,8 @@ class HexMap:
             self.selected_hex.building.area_of_effect_radius > 0):
             
             self.draw_area_of_effect(screen, self.selected_hex.building)
+        
+        screen.set_clip(previous_clip)
     
     def draw_area_of_effect(self, screen, building):
         """Draw the area of effect for a building using hexagon's drawing method"""
@@ -487,8 +378,9 @@ class HexMap:
         if not center_hex:
             return
             
-        # Get all hexes in area of effect using hex_map's method
-        affected_hexes = building.get_area_of_effect_hexes(self)
+        # Get all tiles in area of effect from the map model
+        affected_tiles = building.get_area_of_effect_hexes(self.colony_map)
+        affected_hexes = [self.get_hex_at_grid(tile.map_x, tile.map_y) for tile in affected_tiles]
         
         # Choose color based on building type
         if hasattr(building, "crime_reduction_per_worker"):
@@ -561,10 +453,7 @@ class HexMap:
                         return None
                     
                     # Check if the hexagon is accessible
-                    neighbor_elevations = self.get_neighbor_elevations(hexagon)
-                    accessible_sides = hexagon.get_accessible_sides(neighbor_elevations)
-                    
-                    if any(accessible_sides):  # At least one side is accessible
+                    if self.colony_map.is_tile_accessible(hexagon.tile):  # At least one side is accessible
                         self.place_new_building(hexagon)
                     else:
                         self.game.graphics.show_message("This location is not accessible!")
@@ -582,26 +471,8 @@ class HexMap:
         removal_cost = 200
         
         if self.game.resources.credits >= removal_cost:
-            building = hexagon.building
-            
-            # Handle colonists in residential buildings
-            if hasattr(building, 'residents') and building.residents:
-                # Remove all residents from the habitat
-                for colonist in building.residents[:]:  # Use slice copy to avoid modification during iteration
-                    building.remove_resident(colonist)
-            
-            # Handle workers in production buildings
-            if hasattr(building, 'assigned_colonists') and building.assigned_colonists:
-                # Unassign all workers from the building
-                for colonist in building.assigned_colonists[:]:  # Use slice copy
-                    building.remove_colonist(colonist)
-            
-            # Remove building from game buildings list
-            if building in self.game.buildings:
-                self.game.buildings.remove(building)
-            
-            # Remove building from hexagon
-            hexagon.remove_building()
+            # Release colonists and drop the building from the simulation
+            self.game.remove_building(hexagon.tile)
             
             # Deduct removal cost
             self.game.resources.credits -= removal_cost
@@ -620,8 +491,7 @@ class HexMap:
         
         building = create_building_from_name(self.game.construction_system.selected_building_type)
         if building:
-            hexagon.place_building(building)
-            self.game.buildings.append(building)
+            self.game.place_building(hexagon.tile, building)
             
             # Clear construction state
             building_type = self.game.construction_system.selected_building_type
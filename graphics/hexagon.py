@@ -5,6 +5,8 @@ import math
 import sys
 import os
 
+from . import texture_cache
+
 def resource_path(relative_path):
     """ Get the absolute path to a resource """
     try:
@@ -25,15 +27,26 @@ def resource_path(relative_path):
         return relative_path  # Fallback to relative path
 
 class Hexagon:
-    def __init__(self, x, y, size, map_x, map_y, surface_type="regolith", elevation=0):
+    """Screen representation of a ColonyMap tile"""
+    # Define elevation offsets for visual representation
+    elevation_offsets = {
+        0: 0,
+        1: -5,  # More raised for better visibility
+        2: -10  # Even more raised for high elevation
+    }
+
+    # Surface textures, shared through the texture cache
+    texture_paths = {
+        "regolith": "assets/textures/regolithtexture.png",
+        "stone": "assets/textures/stonetexture.png", 
+        "ice": "assets/textures/icetexture.png"
+    }
+
+    def __init__(self, x, y, size, tile):
         self.x = x  # Screen x position (center of hexagon)
         self.y = y  # Screen y position (center of hexagon)
         self.size = size  # Size (radius from center to vertex)
-        self.map_x = map_x  # Grid x coordinate
-        self.map_y = map_y  # Grid y coordinate
-        self.surface_type = surface_type  # "regolith", "stone", or "ice"
-        self.elevation = elevation  # 0, 1, or 2 (low, medium, high)
-        self.building = None  # Building placed on this hex
+        self.tile = tile  # Map model tile this hexagon draws
         
         # Define surface colors
         self.surface_colors = {
@@ -42,13 +55,6 @@ class Hexagon:
             "ice": (200, 220, 240)        # Light blue
         }
         
-        # Define elevation offsets for visual representation
-        self.elevation_offsets = {
-            0: 0,
-            1: -5,  # More raised for better visibility
-            2: -10  # Even more raised for high elevation
-        }
-
         self.vertices = self.calculate_vertices()
         self.rect = self.calculate_bounding_rect()
 
@@ -62,32 +68,36 @@ class Hexagon:
         
     def load_textures(self):
         """Load textures for different surface types"""
-        texture_paths = {
-            "regolith": "assets/textures/regolithtexture.png",
-            "stone": "assets/textures/stonetexture.png", 
-            "ice": "assets/textures/icetexture.png"
-        }
-        
-        for surface_type, path in texture_paths.items():
-            try:
-                # Use the resource_path function to handle different environments
-                full_path = path
-                texture = pygame.image.load(full_path).convert_alpha()
-                
-                # Scale texture to appropriate size for hexagon
-                texture_size = self.size * 4  # Make texture larger than hex for better tiling
-                self.texture_surfaces[surface_type] = pygame.transform.scale(
-                    texture, (texture_size, texture_size)
-                )
-                self.texture_rects[surface_type] = self.texture_surfaces[surface_type].get_rect()
-                
-            except (pygame.error, FileNotFoundError):
-                #print(f"Warning: Could not load texture {path}")
-                # Fall back to solid colors if textures can't be loaded
-                self.texture_surfaces[surface_type] = None
+        # Textures are shared between hexagons of the same size
+        texture_size = self.size * 4  # Make texture larger than hex for better tiling
+        for surface_type, path in self.texture_paths.items():
+            texture = texture_cache.get_texture(path, texture_size)
+            self.texture_surfaces[surface_type] = texture
+            if texture:
+                self.texture_rects[surface_type] = texture.get_rect()
         
         self.textures_loaded = True
 
+    @property
+    def map_x(self):
+        return self.tile.map_x
+
+    @property
+    def map_y(self):
+        return self.tile.map_y
+
+    @property
+    def surface_type(self):
+        return self.tile.surface_type
+
+    @property
+    def elevation(self):
+        return self.tile.elevation
+
+    @property
+    def building(self):
+        return self.tile.building
+
     def calculate_vertices(self):
         """Calculate the six vertices of the hexagon"""
         vertices = []
@@ -126,47 +136,8 @@ class Hexagon:
             p1x, p1y = p2x, p2y
         return inside
     
-    def get_accessible_sides(self, neighbor_elevations):
-        """Determine which sides are accessible based on elevation differences"""
-        accessible = [True] * 6  # Start with all sides accessible
-        
-        for i, neighbor_elev in enumerate(neighbor_elevations):
-            if neighbor_elev is not None:  # There is a neighbor
-                elevation_diff = abs(self.elevation - neighbor_elev)
-                if elevation_diff >= 2:  # Two or more levels difference - cannot be crossed
-                    accessible[i] = False
-                # If elevation difference is 1 or 0, it's accessible (no need to change)
-                    
-        return accessible
-    
-    def can_place_building(self, building):
-        """Check if a building can be placed on this hexagon based on surface type"""
-        if self.building is not None:
-            return False  # Already has a building
-        
-        return building.can_be_placed_on(self)
-    
-    def place_building(self, building):
-        """Place a building on this hexagon if valid"""
-        if self.can_place_building(building):
-            self.building = building
-            # Set the building's hex position for area of effect calculations
-            building.set_hex_position(self.map_x, self.map_y)
-            return True
-        return False
-    
-    def remove_building(self):
-        """Remove building from this hexagon"""
-        self.building = None
-        
-    def draw(self, screen, colors, fonts, selected=False, neighbor_elevations=None):
-        """Draw the hexagon on the screen"""
-        # Determine accessible sides
-        if neighbor_elevations is None:
-            accessible = [True] * 6
-        else:
-            accessible = self.get_accessible_sides(neighbor_elevations)
-
+    def draw_terrain(self, screen, colors, fonts, accessible):
+        """Draw the static part of the hexagon: surface, cliffs, elevation and border"""
         # Draw hexagon with texture or fallback color
         if self.texture_surfaces.get(self.surface_type):
             # Create a mask for the hexagon shape
@@ -226,8 +197,12 @@ class Hexagon:
             screen.blit(elev_text, elev_rect)
         
         # Draw hex border
-        border_color = colors['hex_selected'] if selected else colors['hex_border']
-        pygame.draw.polygon(screen, border_color, self.vertices, 2)
+        pygame.draw.polygon(screen, colors['hex_border'], self.vertices, 2)
+
+    def draw_overlay(self, screen, colors, fonts, selected=False):
+        """Draw the changing part of the hexagon: selection and building info"""
+        if selected:
+            pygame.draw.polygon(screen, colors['hex_selected'], self.vertices, 2)
         
         # Draw building info if present
         if self.building:
@@ -12,7 +12,6 @@ from events import EventType, GameEvent
 class MainScreen(Screen):
     def __init__(self, graphics):
         super().__init__(graphics)
-        self.calculated_changes = {}
         
         # Calculate new dimensions for the expanded map
         top_bar_height = 80     # Height of top bar
@@ -30,9 +29,8 @@ class MainScreen(Screen):
         map_height = self.graphics.height - top_bar_height - bottom_bar_height - 40
         
         # Create hex map with new dimensions
-        self.hex_map = HexMap(map_x, map_y, map_width, map_height, 35)
+        self.hex_map = HexMap(map_x, map_y, map_width, map_height, self.game.colony_map, 35)
         self.hex_map.game = self.game  # Pass game reference to hex map
-        self.hex_map.place_buildings(self.game.buildings)
         
         # Create UI components
         self.top_bar = TopBar(graphics)
@@ -44,57 +42,16 @@ class MainScreen(Screen):
         # Track if we've already handled a click in this frame
         self.click_handled = False
     
-    # main_screen.py - update the calculate_next_day_changes method
-    def calculate_next_day_changes(self):
-        """Calculate expected resource changes for the next day"""
-        # Reset changes with new resources
-        self.calculated_changes = {
-            'oxygen': 0,
-            'food': 0,
-            'regolith': 0,  # Changed from minerals
-            'energy': 0,
-            'credits': 0,
-            'hydrogen': 0,      # New resource
-            'fuel': 0           # New resource
-        }
-        
-        pop = self.game.population
-        res = self.game.resources
-        
-        # Calculate base consumption by population
-        self.calculated_changes['oxygen'] -= pop.count * 0.1
-        self.calculated_changes['food'] -= pop.count * 0.2
-        self.calculated_changes['energy'] -= pop.count * 0.05
-        
-        # Calculate building production and consumption
-        for building in self.game.buildings:
-            production = building.calculate_effective_production(res)
-            consumption = building.calculate_consumption()
-            
-            for resource, amount in production.items():
-                self.calculated_changes[resource] += amount
-                
-            for resource, amount in consumption.items():
-                self.calculated_changes[resource] -= amount
-        
-        # Calculate wage cost
-        wage_cost = pop.calculate_total_wages()
-        self.calculated_changes['credits'] -= wage_cost
-
-        # Calculate rent income (positive change to credits)
-        rent_income = 0
-        for colonist in pop.colonists:
-            if colonist.housing and colonist.can_afford_rent():
-                rent_income += colonist.rent_cost
-        
-        self.calculated_changes['credits'] += rent_income
-    
     # main_screen.py - update the handle_event method
     def handle_event(self, event):
         """Handle mouse events for hex map and building menu"""
         # Reset click handled flag at the start of each event
         self.click_handled = False
         
+        # Camera controls: pan and zoom the map
+        if self.hex_map.handle_camera_event(event):
+            return
+        
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # First check building menu clicks (highest priority)
             menu_action = self.building_menu.handle_click(event.pos)
@@ -157,7 +114,6 @@ class MainScreen(Screen):
         
         if action == "next_day":
             self.game.next_day()
-            self.calculate_next_day_changes()
             
         elif action == "market":
             self.graphics.set_screen('market')
@@ -179,9 +135,8 @@ class MainScreen(Screen):
             building = self.building_menu.selected_building
             if pop.available_workers > 0 and building.assigned_workers < building.max_workers:
                 # Find an unemployed colonist
-                unemployed = pop.unemployed_colonists
-                if unemployed:
-                    colonist = unemployed[0]
+                colonist = pop.get_unemployed_colonist()
+                if colonist:
                     if building.assign_colonist(colonist):
                         self.graphics.show_message(f"Assigned colonist to {building.name}")
                         # Publish worker added event
@@ -190,7 +145,6 @@ class MainScreen(Screen):
                             f"Assigned colonist to {building.name}",
                             {"building": building.name, "workers": building.assigned_workers}
                         ))
-                        self.calculate_next_day_changes()
                 else:
                     self.graphics.show_message("No available workers!")
             else:
@@ -208,7 +162,6 @@ class MainScreen(Screen):
                         f"Removed colonist from {building.name}",
                         {"building": building.name, "workers": building.assigned_workers}
                     ))
-                    self.calculate_next_day_changes()
             else:
                 self.graphics.show_message("No workers assigned to this building!")
                 
@@ -216,14 +169,11 @@ class MainScreen(Screen):
             self.building_menu.hide()
     
     def draw(self):
-        # Calculate resource changes for next day
-        self.calculate_next_day_changes()
-
         # Draw animated background first
         self.draw_animated_background()
         
         # Draw UI components
-        self.top_bar.draw(self.game.resources, self.calculated_changes)
+        self.top_bar.draw(self.game.resources, self.game.forecast)
         
         # Title
         title_text = self.graphics.title_font.render(f"Space Colony - Day {self.game.day}", True, self.graphics.colors['text'])
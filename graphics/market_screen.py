@@ -263,7 +263,7 @@ class MarketScreen(Screen):
         
         # Get price history
         price_history = self.game.market.get_price_history(resource, 30)
-        if not price_history:
+        if len(price_history) == 0:
             no_data_text = self.graphics.small_font.render("No price history available", True, self.graphics.colors['text'])
             self.graphics.screen.blit(no_data_text, (chart_panel_rect.x + 20, chart_panel_rect.y + 60))
             return
@@ -370,7 +370,7 @@ class QuestScreen(Screen):
             building_type = objective['building_type']
             required = objective['required']
             building_instance = building_type()
-            current = sum(1 for b in self.game.buildings if isinstance(b, building_type))
+            current = self.game.buildings.count_of(building_type)
             return f"Build {required} {building_instance.name} ({current}/{required})"
         
         elif obj_type == 'resource_amount':
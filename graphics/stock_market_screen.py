@@ -223,7 +223,7 @@ class StockMarketScreen(Screen):
         info_lines = [
             f"Volume: {stock_data['volume']:,} | Market Cap: {stock_data['market_cap']:,.0f}",
             f"Volatility: {stock_data['volatility']:.1%} | Beta: {stock_data['beta']:.2f}",
-            f"Sentiment Momentum: {stock_data['sentiment']}",
+            f"Sentiment Momentum: {stock_data['sentiment']} | 5-Day Change: {stock_data['momentum']:+.1%} | MA10: {stock_data['moving_avg_10']:.2f} | MA30: {stock_data['moving_avg_30']:.2f}",
             f"VIX (Volatility Index): {self.game.stock_market.global_volatility:.2f}"
         ]
         
@@ -252,7 +252,7 @@ class StockMarketScreen(Screen):
         
         # Get price history
         price_history = stock_data['price_history']
-        if not price_history:
+        if len(price_history) == 0:
             no_data_text = self.graphics.small_font.render("No price history available", True, self.graphics.colors['text'])
             self.graphics.screen.blit(no_data_text, (chart_panel_rect.x + 20, chart_panel_rect.y + 60))
             return
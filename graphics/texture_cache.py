@@ -0,0 +1,30 @@
+# texture_cache.py - Process-wide cache of loaded and scaled textures
+import pygame
+
+_images = {}  # path -> decoded surface, or None if it could not be loaded
+_scaled = {}  # (path, size) -> scaled surface, or None
+
+
+def load_image(path):
+    """Decode an image file once; returns None if it cannot be loaded"""
+    if path not in _images:
+        try:
+            _images[path] = pygame.image.load(path).convert_alpha()
+        except (pygame.error, FileNotFoundError):
+            _images[path] = None  # Callers fall back to solid colors
+    return _images[path]
+
+
+def get_texture(path, size):
+    """Shared texture scaled to size x size pixels; do not draw onto it"""
+    key = (path, size)
+    if key not in _scaled:
+        image = load_image(path)
+        _scaled[key] = pygame.transform.scale(image, (size, size)) if image else None
+    return _scaled[key]
+
+
+def clear():
+    """Drop every cached texture, e.g. after the display mode changes"""
+    _images.clear()
+    _scaled.clear()
@@ -34,8 +34,10 @@ class TopBar:
         change_surf = self.graphics.small_font.render(change_text, True, change_color)
         self.graphics.screen.blit(change_surf, (x + 40, y + 20))
     
-    def draw(self, resources, calculated_changes):
-        """Draw the top resource bar"""
+    def draw(self, resources, forecast):
+        """Draw the top resource bar with the forecast's cached next-day changes"""
+        calculated_changes = forecast.get_changes()
+        
         # Background
         pygame.draw.rect(self.graphics.screen, self.graphics.colors['panel'], (0, 0, self.width, self.height))
         pygame.draw.rect(self.graphics.screen, self.graphics.colors['highlight'], (0, 0, self.width, self.height), 1)
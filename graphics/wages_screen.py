@@ -39,12 +39,9 @@ class WagesScreen(Screen):
         
         # Count colonists in each profession
         for profession_key in self.professions.keys():
-            stats[profession_key] = len([
-                c for c in pop.colonists 
-                if c.employed and c.profession == profession_key
-            ])
+            stats[profession_key] = pop.get_profession_count(profession_key)
         
-        stats['unemployed'] = len(pop.unemployed_colonists)
+        stats['unemployed'] = pop.available_workers
         
         # Calculate total wage costs
         total_cost = 0
@@ -61,10 +58,9 @@ class WagesScreen(Screen):
         pop = self.game.population
         count = 0
         wage_satisfaction = []
-        for colonist in pop.employed_colonists:
-            if colonist.profession == profession_key:
-                wage_satisfaction.append(colonist.calculate_wage_satisfaction())
-                count += 1
+        for colonist in pop.get_colonists_by_profession(profession_key):
+            wage_satisfaction.append(colonist.calculate_wage_satisfaction())
+            count += 1
 
         if count == 0:
             return 0
@@ -77,10 +73,9 @@ class WagesScreen(Screen):
         pop = self.game.population
         changed_count = 0
         
-        for colonist in pop.colonists:
-            if colonist.employed and colonist.profession == profession_key:
-                if colonist.set_wage(new_wage):
-                    changed_count += 1
+        for colonist in pop.get_colonists_by_profession(profession_key):
+            if colonist.set_wage(new_wage):
+                changed_count += 1
         
         self.professions[profession_key]['current_wage'] = new_wage
         return changed_count
@@ -0,0 +1,377 @@
+# housing_market.py - Matches colonists to housing without scanning every habitat
+import bisect
+import heapq
+
+import numpy as np
+
+NO_VACANCY = (float('-inf'), 0)
+
+
+class VacancyIndex:
+    """Max segment tree over habitats sorted by rent.
+
+    While a habitat has a free spot its leaf holds (quality, -order), so a
+    prefix query returns the best habitat whose rent fits a budget in
+    O(log H). Ties go to the habitat listed first among the buildings.
+    """
+    def __init__(self, habitats, order):
+        self.habitats = sorted(habitats, key=lambda h: h.rent)
+        self.rents = [h.rent for h in self.habitats]
+        self.order = order
+        self.by_order = {order[h]: h for h in self.habitats}
+        self.position = {h: i for i, h in enumerate(self.habitats)}
+
+        self.size = 1
+        while self.size < len(self.habitats):
+            self.size *= 2
+        self.tree = [NO_VACANCY] * (2 * self.size)
+        for i, habitat in enumerate(self.habitats):
+            self.tree[self.size + i] = self.key(habitat)
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def key(self, habitat):
+        """Leaf value of a habitat"""
+        if habitat.get_vacancy_count() > 0:
+            return (habitat.quality, -self.order[habitat])
+        return NO_VACANCY
+
+    def __contains__(self, habitat):
+        return habitat in self.position
+
+    def refresh(self, habitat):
+        """Re-read a habitat's vacancy after a resident moved in or out"""
+        i = self.position[habitat] + self.size
+        self.tree[i] = self.key(habitat)
+        i //= 2
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def rent_changed(self, habitat):
+        """Whether a habitat's rent no longer matches its place in the index"""
+        return habitat.rent != self.rents[self.position[habitat]]
+
+    def best(self, count=None):
+        """Best vacant habitat among the `count` cheapest ones (all by default)"""
+        if count is None:
+            count = len(self.habitats)
+        lo = self.size
+        hi = self.size + count
+        best = NO_VACANCY
+        while lo < hi:
+            if lo & 1:
+                best = max(best, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = max(best, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        if best == NO_VACANCY:
+            return None
+        return self.by_order[-best[1]]
+
+    def best_quality(self):
+        """Quality of the best vacancy, or -inf when everything is full"""
+        return self.tree[1][0]
+
+    def cheapest_rent(self):
+        """Rent of the cheapest habitat with a free spot, or inf when everything is full"""
+        if self.tree[1] == NO_VACANCY:
+            return float('inf')
+        i = 1
+        while i < self.size:
+            i = 2 * i if self.tree[2 * i] != NO_VACANCY else 2 * i + 1
+        return self.rents[i - self.size]
+
+    def affordable_count(self, colonist):
+        """Number of cheapest habitats the colonist can afford"""
+        count = bisect.bisect_right(self.rents, colonist.wage - colonist.living_cost)
+        # Settle float rounding against the exact affordability test
+        while count and not colonist.can_afford_housing(self.rents[count - 1]):
+            count -= 1
+        while count < len(self.rents) and colonist.can_afford_housing(self.rents[count]):
+            count += 1
+        return count
+
+
+class WageOrder:
+    """Store rows sorted by wage (highest first, ties in row order), kept across days.
+
+    Each sync compares the wage column with the wages the order was built
+    from and merges only the rows whose wage changed, or that were appended
+    or moved, back into the order. Removing rows renumbers the order in
+    place, since compaction keeps the surviving rows in sequence.
+    """
+    def __init__(self, store):
+        self.store = store
+        self.order = np.zeros(0, dtype=np.int64)  # Rows, best paid first
+        self.wages = np.zeros(0)  # Wage of each known row when last synced (NaN = moved)
+        self.layout_version = store.layout_version
+
+    def sync(self):
+        """Bring the order up to date; returns (order, rank of every row)"""
+        store = self.store
+        n = store.size
+        wage = store.column('wage')
+        if self.layout_version != store.layout_version or len(self.wages) > n:
+            changed = np.arange(n)  # Rows moved without notice
+        else:
+            known = len(self.wages)
+            changed = np.concatenate((np.flatnonzero(wage[:known] != self.wages), np.arange(known, n)))
+
+        if len(changed) * 8 > n:
+            self.order = np.argsort(-wage, kind='stable')
+        elif len(changed):
+            self.merge(changed, wage)
+        self.wages = wage.copy()
+        self.layout_version = store.layout_version
+
+        rank = np.empty(n, dtype=np.int64)
+        rank[self.order] = np.arange(n)
+        return self.order, rank
+
+    def merge(self, changed, wage):
+        """Re-insert a few rows into the otherwise unchanged order"""
+        moved = np.zeros(len(wage), dtype=bool)
+        moved[changed] = True
+        base = self.order[~moved[self.order]]
+        changed = changed[np.lexsort((changed, -wage[changed]))]
+
+        base_keys = -wage[base]
+        keys = -wage[changed]
+        positions = np.searchsorted(base_keys, keys, side='left')
+        ties = positions < np.searchsorted(base_keys, keys, side='right')
+        if ties.any() and len(base):
+            # Equal wages keep row order: number every base row by the start of its
+            # run of equal wages, then search (run start, row) pairs as one integer
+            run_start = np.zeros(len(base), dtype=np.int64)
+            starts = np.flatnonzero(base_keys[1:] != base_keys[:-1]) + 1
+            run_start[starts] = starts
+            np.maximum.accumulate(run_start, out=run_start)
+            span = len(wage) + 1
+            positions[ties] = np.searchsorted(run_start * span + base, positions[ties] * span + changed[ties])
+        self.order = np.insert(base, positions, changed)
+
+    def drop_rows(self, mask):
+        """Renumber the order after compacting away the rows set in `mask`"""
+        if self.layout_version != self.store.layout_version - 1:
+            return  # Already out of step; the next sync re-sorts everything
+        keep = ~mask
+        known = len(self.wages)
+        new_row = np.cumsum(keep) - 1
+        self.order = new_row[self.order[keep[self.order]]]
+        self.wages = self.wages[keep[:known]]
+        self.layout_version = self.store.layout_version
+
+    def drop_row(self, row, last):
+        """Update the order after row `last` was moved into removed row `row`"""
+        if self.layout_version != self.store.layout_version - 1:
+            return
+        known = len(self.wages)
+        self.order = self.order[(self.order != row) & (self.order != last)]
+        if last < known:
+            self.wages = self.wages[:last]
+        if row < len(self.wages):
+            self.wages[row] = np.nan  # Re-inserted at its new row on the next sync
+        self.layout_version = self.store.layout_version
+
+
+class HousingMarket:
+    """Assigns housing in wage order, re-matching only colonists that can change.
+
+    A colonist is a candidate if they can no longer afford their rent, could
+    upgrade to a better vacancy, or are homeless while a spot they could take
+    is free: any slum spot, or a regular one at a rent they can afford.
+    Candidates are handled in the same order as a full wage-sorted pass, and
+    spots freed during the pass pull in the colonists ranked after them.
+    The vacancy indexes and the wage order persist across days and are
+    patched from the habitats and rows that changed.
+    """
+    def __init__(self, population):
+        self.population = population
+        self.regular = None
+        self.slums = None
+        self.habitats = []
+        self.buildings_version = None
+        self.dirty = {}  # Habitats whose vacancy, quality or rent changed (ordered set)
+        self.wage_order = WageOrder(population.store)
+
+    def mark_dirty(self, habitat):
+        """Called by habitats when residents, capacity, quality or rent change"""
+        self.dirty[habitat] = None
+
+    def drop_rows(self, mask):
+        """Called after the population compacted away the rows set in `mask`"""
+        self.wage_order.drop_rows(mask)
+
+    def drop_row(self, row, last):
+        """Called after the population moved its last row into removed row `row`"""
+        self.wage_order.drop_row(row, last)
+
+    def build_indexes(self, buildings):
+        """Index the vacancies of every habitat from scratch"""
+        for habitat in self.habitats:
+            if habitat.housing_market is self:
+                habitat.housing_market = None
+        self.habitats = list(buildings.residential)
+        order = {h: i for i, h in enumerate(self.habitats)}
+        self.regular = VacancyIndex([h for h in self.habitats if not getattr(h, 'is_slum', False)], order)
+        self.slums = VacancyIndex([h for h in self.habitats if getattr(h, 'is_slum', False)], order)
+        for habitat in self.habitats:
+            habitat.housing_market = self
+        self.buildings_version = buildings.version
+
+    def refresh_indexes(self, buildings):
+        """Rebuild after construction or a rent change, else patch the changed habitats"""
+        dirty = [h for h in self.dirty if h in self.regular or h in self.slums]
+        if (buildings.version != self.buildings_version or
+                any(self.index_of(h).rent_changed(h) for h in dirty)):
+            self.build_indexes(buildings)
+        else:
+            for habitat in dirty:
+                self.index_of(habitat).refresh(habitat)
+        self.dirty.clear()
+
+    def update(self, buildings):
+        """Run one day of evictions, moves and upgrades"""
+        if self.regular is None:
+            self.build_indexes(buildings)
+        else:
+            self.refresh_indexes(buildings)
+
+        store = self.population.store
+        n = store.size
+        if n == 0:
+            return
+        views = store.views
+        wage = store.column('wage')
+        housed = store.column('housed').copy()
+        employed = store.column('employed')
+        housing_quality = store.column('housing_quality').copy()
+        self.rows_by_rank, self.rank = self.wage_order.sync()
+
+        evicted = housed & (store.column('savings') + wage < store.column('rent_cost'))
+        self.upgradable = housed & employed & ~evicted
+        self.housing_quality = housing_quality
+
+        # Homeless colonists in rank order, with what their affordability depends on
+        homeless_rows = np.flatnonzero(~housed)
+        by_rank = np.argsort(self.rank[homeless_rows])
+        homeless_rows = homeless_rows[by_rank]
+        self.homeless_ranks = self.rank[homeless_rows]
+        self.homeless_wage = wage[homeless_rows]
+        self.homeless_living_cost = store.column('living_cost')[homeless_rows]
+        self.homeless_employed = employed[homeless_rows]
+        self.feed_homeless(-1)
+
+        self.queue = self.rank[evicted].tolist()
+        self.upgrade_bound = self.regular.best_quality()
+        self.queue.extend(self.rank[self.upgradable & (housing_quality < self.upgrade_bound)].tolist())
+        heapq.heapify(self.queue)
+
+        while True:
+            if self.feed_position < len(self.feed) and self.homeless_threshold() > self.feed_threshold:
+                # Spots were taken since the feed was filtered: narrow it down
+                self.feed_homeless(self.feed[self.feed_position] - 1)
+                continue
+            if self.feed_position < len(self.feed) and (not self.queue or self.feed[self.feed_position] < self.queue[0]):
+                rank = self.feed[self.feed_position]
+                self.feed_position += 1
+            elif self.queue:
+                rank = heapq.heappop(self.queue)
+            else:
+                break
+            vacated = self.rehouse(views[self.rows_by_rank[rank]])
+            if vacated is not None:
+                self.on_vacancy(vacated, rank)
+        self.dirty.clear()  # The indexes were kept current during the pass
+
+    def homeless_threshold(self):
+        """Lowest rent a homeless colonist must afford to get a spot right now"""
+        if self.slums.best_quality() > NO_VACANCY[0]:
+            return float('-inf')  # Slums take anyone
+        return self.regular.cheapest_rent()
+
+    def feed_homeless(self, after_rank):
+        """Line up the homeless colonists ranked after `after_rank` that could get a spot"""
+        threshold = self.homeless_threshold()
+        start = np.searchsorted(self.homeless_ranks, after_rank, side='right')
+        if threshold == float('-inf'):
+            candidates = self.homeless_ranks[start:]
+        elif threshold == float('inf'):
+            candidates = self.homeless_ranks[:0]
+        else:
+            affordable = (self.homeless_employed[start:] &
+                          (self.homeless_wage[start:] >= threshold + self.homeless_living_cost[start:]))
+            candidates = self.homeless_ranks[start:][affordable]
+        self.feed = candidates.tolist()
+        self.feed_position = 0
+        self.feed_threshold = threshold
+
+    def on_vacancy(self, habitat, rank):
+        """Pull in colonists ranked after `rank` that the freed spot could serve"""
+        if self.homeless_threshold() < self.feed_threshold:
+            self.feed_homeless(rank)
+        if habitat in self.regular and habitat.quality > self.upgrade_bound:
+            newly_upgradable = (self.upgradable & (self.rank > rank) &
+                                (self.housing_quality >= self.upgrade_bound) &
+                                (self.housing_quality < habitat.quality))
+            for candidate in self.rank[newly_upgradable].tolist():
+                heapq.heappush(self.queue, candidate)
+            self.upgrade_bound = habitat.quality
+
+    def best_regular(self, colonist):
+        """Best affordable regular vacancy better than the colonist's housing"""
+        if not colonist.employed:
+            return None
+        habitat = self.regular.best(self.regular.affordable_count(colonist))
+        if habitat and habitat.quality > colonist.housing_quality:
+            return habitat
+        return None
+
+    def move_in(self, colonist, habitat):
+        """Add a resident and update the vacancy index"""
+        if habitat.add_resident(colonist):
+            self.index_of(habitat).refresh(habitat)
+            return True
+        return False
+
+    def move_out(self, colonist):
+        """Remove a resident and update the vacancy index"""
+        habitat = colonist.housing
+        habitat.remove_resident(colonist)
+        if habitat in self.regular or habitat in self.slums:
+            self.index_of(habitat).refresh(habitat)
+        return habitat
+
+    def index_of(self, habitat):
+        """Vacancy index holding a habitat"""
+        return self.regular if habitat in self.regular else self.slums
+
+    def rehouse(self, colonist):
+        """Housing decision for one colonist; returns the habitat they left, if any"""
+        # Currently housed but can't afford it
+        if colonist.housing and not colonist.can_afford_rent():
+            return self.move_out(colonist)
+
+        # Homeless: best affordable regular housing, else any slum (no affordability check)
+        if not colonist.housing:
+            if self.regular.best_quality() == NO_VACANCY[0] and self.slums.best_quality() == NO_VACANCY[0]:
+                return None  # Everything is full
+            habitat = self.best_regular(colonist)
+            if habitat and self.move_in(colonist, habitat):
+                return None
+            slum = self.slums.best()
+            if slum and slum.quality > colonist.housing_quality:
+                self.move_in(colonist, slum)
+            return None
+
+        # Already housed: look for an upgrade to better regular housing
+        habitat = self.best_regular(colonist)
+        if habitat:
+            vacated = self.move_out(colonist)
+            self.move_in(colonist, habitat)
+            return vacated
+        return None
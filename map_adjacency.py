@@ -0,0 +1,67 @@
+# map_adjacency.py - Precomputed neighbour and accessibility graph of the colony map
+import numpy as np
+
+from terrain import neighbor_indices
+
+
+class MapAdjacency:
+    """Immutable CSR adjacency of a ColonyMap's tiles.
+
+    Tile i (row-major, i = map_y * cols + map_x) has its neighbours in
+    indices[indptr[i]:indptr[i + 1]], in ColonyMap.get_neighbor_positions
+    order. Each edge stores the side it leaves through and whether the
+    elevation step can be crossed. Side masks hold one accessible bit per
+    side, with sides facing the map edge counted as accessible like
+    MapTile.get_accessible_sides does. Build a new one when terrain changes.
+    """
+    def __init__(self, colony_map):
+        self.cols = colony_map.cols
+        self.rows = colony_map.rows
+        self.tiles = list(colony_map.tiles)
+        count = len(self.tiles)
+
+        elevation = np.array([tile.elevation for tile in self.tiles], dtype=np.int8)
+        neighbors, inside = neighbor_indices(self.rows, self.cols)
+        neighbors = neighbors.reshape(6, count).T  # One row of six sides per tile
+        inside = inside.reshape(6, count).T
+        crossable = np.abs(elevation[neighbors] - elevation[:, None]) < 2
+
+        self.indptr = np.concatenate(([0], np.cumsum(inside.sum(axis=1)))).astype(np.int32)
+        self.indices = neighbors[inside].astype(np.int32)
+        self.sides = np.broadcast_to(np.arange(6, dtype=np.int8), (count, 6))[inside]
+        self.passable = crossable[inside]
+
+        # Map edge does not block a side
+        open_sides = crossable | ~inside
+        self.side_masks = (open_sides << np.arange(6)).sum(axis=1).astype(np.uint8)
+
+        # Python-side views for per-tile loops, filled on first use
+        self.accessible_neighbors = [None] * count
+        self.accessible_sides = [None] * count
+
+    def index_of(self, tile):
+        """Row-major index of a tile"""
+        return tile.map_y * self.cols + tile.map_x
+
+    def neighbors_of(self, tile):
+        """Tiles reachable in one step from a tile"""
+        i = self.index_of(tile)
+        neighbors = self.accessible_neighbors[i]
+        if neighbors is None:
+            start, end = self.indptr[i], self.indptr[i + 1]
+            neighbors = self.accessible_neighbors[i] = tuple(
+                self.tiles[j] for j in self.indices[start:end][self.passable[start:end]].tolist())
+        return neighbors
+
+    def sides_of(self, tile):
+        """Six accessible-side flags of a tile, for drawing"""
+        i = self.index_of(tile)
+        sides = self.accessible_sides[i]
+        if sides is None:
+            mask = int(self.side_masks[i])
+            sides = self.accessible_sides[i] = tuple(bool(mask & (1 << side)) for side in range(6))
+        return sides
+
+    def is_accessible(self, tile):
+        """Whether a tile has at least one side that can be crossed"""
+        return bool(self.side_masks[self.index_of(tile)])
@@ -1,7 +1,11 @@
-import random
+import numpy as np
+
+from timeseries import RingBuffer
 
 class Market:
-    def __init__(self):
+    def __init__(self, history_days=30, seed=None):
+        self.rng = np.random.default_rng(seed)  # Daily price fluctuations
+        
         # Base prices for resources
         self.base_prices = {
             'regolith': 5,
@@ -17,10 +21,9 @@ class Market:
         # Market volatility (how much prices can change naturally)
         self.volatility = 0.15
         
-        # Price history for charts
-        self.price_history = {resource: [] for resource in self.base_prices.keys()}
-        for resource in self.prices:
-            self.price_history[resource].append(self.prices[resource])
+        # Price history for charts, one ring buffer of `history_days` per resource
+        self.price_history = {resource: RingBuffer(history_days, [price])
+                              for resource, price in self.prices.items()}
         
         # Market depth - simulates other traders in the market
         self.market_depth = {
@@ -92,17 +95,12 @@ class Market:
             self.prices[resource] += price_diff * self.recovery_rate
             
             # Add natural market fluctuations
-            natural_change = random.uniform(1 - self.volatility, 1 + self.volatility)
+            natural_change = float(self.rng.uniform(1 - self.volatility, 1 + self.volatility))
             self.prices[resource] = max(0.01, self.prices[resource] * natural_change)
             
-        # Record current prices in history
+        # Record current prices in history (the oldest day drops out once full)
         for resource in self.prices:
             self.price_history[resource].append(self.prices[resource])
-            
-        # Keep only the last 30 days of history for performance
-        for resource in self.price_history:
-            if len(self.price_history[resource]) > 30:
-                self.price_history[resource] = self.price_history[resource][-30:]
         
         # Gradually reduce player influence (market forgets past transactions)
         for resource in self.player_transactions:
@@ -182,10 +180,10 @@ class Market:
         return list(self.prices.keys())
     
     def get_price_history(self, resource, days=30):
-        """Get price history for a resource (last n days)"""
+        """Get price history for a resource (last n days) as a read-only array view"""
         if resource not in self.price_history:
             return []
-        return self.price_history[resource][-days:]
+        return self.price_history[resource].last(days)
     
     def get_market_info(self, resource):
         """Get information about market state for a resource"""
@@ -0,0 +1,106 @@
+# path_service.py - Routing over the accessible hexes of the colony map
+import heapq
+from collections import deque
+
+
+def grid_distance(pos1, pos2):
+    """Exact step count between two odd-row offset positions on an open map"""
+    (col1, row1), (col2, row2) = pos1, pos2
+    # Offset to axial coordinates
+    q1 = col1 - (row1 - (row1 & 1)) // 2
+    q2 = col2 - (row2 - (row2 & 1)) // 2
+    dq, dr = q1 - q2, row1 - row2
+    return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+
+
+class PathService:
+    """Shortest routes between tiles, walking only between accessible neighbours.
+
+    find_path runs A* with the hex distance as heuristic. Building-to-building
+    distances come from one breadth-first search per source building whose
+    results are cached, so repeated queries cost a dict lookup. The cache is
+    dropped when the map's accessibility graph is rebuilt (terrain edits) or
+    the building registry changes.
+    """
+    def __init__(self, colony_map, buildings):
+        self.colony_map = colony_map
+        self.buildings = buildings
+        self.distances = {}  # Source position -> {building position: steps}
+        self.adjacency = colony_map.adjacency
+        self.buildings_version = buildings.version
+
+    def check_cache(self):
+        """Drop cached distances after terrain or building edits"""
+        if self.adjacency is not self.colony_map.adjacency or self.buildings_version != self.buildings.version:
+            self.distances = {}
+            self.adjacency = self.colony_map.adjacency
+            self.buildings_version = self.buildings.version
+
+    def find_path(self, start_pos, goal_pos):
+        """Tiles from start to goal inclusive, or None if the goal cannot be reached"""
+        start = self.colony_map.get_hex_at_grid(*start_pos)
+        goal = self.colony_map.get_hex_at_grid(*goal_pos)
+        if not start or not goal:
+            return None
+
+        adjacency = self.colony_map.adjacency
+        goal_pos = (goal.map_x, goal.map_y)
+        came_from = {start: None}
+        cost = {start: 0}
+        counter = 0  # Tie breaker so tiles are never compared
+        frontier = [(grid_distance((start.map_x, start.map_y), goal_pos), counter, start)]
+
+        while frontier:
+            _, _, current = heapq.heappop(frontier)
+            if current is goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                return path[::-1]
+
+            next_cost = cost[current] + 1
+            for neighbor in adjacency.neighbors_of(current):
+                if next_cost < cost.get(neighbor, next_cost + 1):
+                    cost[neighbor] = next_cost
+                    came_from[neighbor] = current
+                    counter += 1
+                    estimate = next_cost + grid_distance((neighbor.map_x, neighbor.map_y), goal_pos)
+                    heapq.heappush(frontier, (estimate, counter, neighbor))
+        return None
+
+    def distances_from(self, position):
+        """Steps from a position to every reachable building (cached)"""
+        self.check_cache()
+        distances = self.distances.get(position)
+        if distances is None:
+            distances = self.distances[position] = self.search_buildings(position)
+        return distances
+
+    def search_buildings(self, position):
+        """Breadth-first search from a position, stopping once every building is found"""
+        start = self.colony_map.get_hex_at_grid(*position)
+        if not start:
+            return {}
+
+        adjacency = self.colony_map.adjacency
+        remaining = len(self.buildings.by_position)
+        steps = {start: 0}
+        queue = deque([start])
+        distances = {}
+        while queue and len(distances) < remaining:
+            current = queue.popleft()
+            position = (current.map_x, current.map_y)
+            if self.buildings.at(position):
+                distances[position] = steps[current]
+            for neighbor in adjacency.neighbors_of(current):
+                if neighbor not in steps:
+                    steps[neighbor] = steps[current] + 1
+                    queue.append(neighbor)
+        return distances
+
+    def building_distance(self, building1, building2):
+        """Steps between two placed buildings, or None if there is no route"""
+        if not building1.hex_position or not building2.hex_position:
+            return None
+        return self.distances_from(building1.hex_position).get(building2.hex_position)
@@ -1,15 +1,129 @@
 # population.py
 import random
-from colonist import Colonist
+
+import numpy as np
+
+from colonist import Colonist, ColonistStore
+from crime import CrimeModel
+from housing_market import HousingMarket
+from workforce import WorkforceLedger
 from events import EventType, GameEvent
 
+
+class PopulationStats:
+    """Dashboard aggregates kept as running sums and counts.
+
+    Adding or removing colonists, wage changes and moves in or out of
+    housing adjust the sums as they happen. The daily update rewrites every
+    happiness and health value in the store, so end_of_day() re-adds those
+    two columns once per tick; the housing capacity is re-added only after
+    the building registry changed. Reads never scan colonists or buildings.
+    """
+    def __init__(self, population):
+        self.population = population
+        self.version = 0  # Bumped on every change, for caches built on these values
+        self.happiness_sum = 0.0
+        self.health_sum = 0.0
+        self.total_wages = 0.0
+        self.housed = 0
+        self.housing_capacity = 0
+        self.buildings_version = None  # Registry version the capacity was summed at
+
+    @property
+    def count(self):
+        return self.population.store.size
+
+    @property
+    def employed(self):
+        return len(self.population.employed_index)
+
+    @property
+    def homeless(self):
+        return self.count - self.housed
+
+    @property
+    def average_happiness(self):
+        return self.happiness_sum / self.count if self.count else 50
+
+    @property
+    def average_health(self):
+        return self.health_sum / self.count if self.count else 80
+
+    @property
+    def average_wage(self):
+        return self.total_wages / self.employed if self.employed else 0
+
+    @property
+    def available_housing(self):
+        # Every housed colonist lives in one of the registry's residential buildings
+        return self.housing_capacity - self.housed if self.population.game else 0
+
+    def changed(self):
+        """Note a change for caches keyed on `version`"""
+        self.version += 1
+
+    def add_colonist(self, colonist):
+        """Count a colonist that just joined the store"""
+        self.happiness_sum += colonist.happiness
+        self.health_sum += colonist.health
+        self.total_wages += colonist.wage
+        self.housed += colonist.housing is not None
+        self.version += 1
+
+    def remove_rows(self, rows):
+        """Uncount store rows (indexes or a boolean mask) that are about to be removed"""
+        store = self.population.store
+        self.happiness_sum -= float(store.column('happiness')[rows].sum())
+        self.health_sum -= float(store.column('health')[rows].sum())
+        self.total_wages -= float(store.column('wage')[rows].sum())
+        self.housed -= int(np.count_nonzero(store.column('housed')[rows]))
+        self.version += 1
+
+    def wage_changed(self, delta):
+        """A colonist's wage moved by delta (unemployed colonists earn 0)"""
+        self.total_wages += delta
+        self.version += 1
+
+    def housing_changed(self, delta):
+        """A colonist moved into (+1) or out of (-1) housing"""
+        self.housed += delta
+        self.version += 1
+
+    def end_of_day(self):
+        """Re-add the happiness and health columns after the daily update"""
+        store = self.population.store
+        self.happiness_sum = float(store.column('happiness').sum())
+        self.health_sum = float(store.column('health').sum())
+        self.version += 1
+
+    def refresh(self):
+        """Re-add the housing capacity if buildings were added or removed"""
+        pop = self.population
+        if pop.game and pop.game.buildings.version != self.buildings_version:
+            self.housing_capacity = pop.get_total_housing_capacity(pop.game.buildings)
+            self.buildings_version = pop.game.buildings.version
+        return self
+
+
 class Population:
-    def __init__(self, game=None):
+    def __init__(self, game=None, seed=None):
         self.game = game
-        self.colonists = []  # Individual colonists
+        self.store = ColonistStore()  # Column storage behind the colonist views
         self.max_population = 1000  # Population cap
         self.next_colonist_id = 1
         self.base_wage = 6  # Default base wage for new assignments
+        self.rng = np.random.default_rng(seed)  # Batch rolls for deaths and departures
+        
+        # Indexes kept up to date on every job change (dicts used as ordered sets)
+        self.employed_index = {}
+        self.unemployed_index = {}
+        self.profession_index = {}  # Profession -> employed colonists
+        self.colonists_by_id = {}
+        
+        self.housing_market = HousingMarket(self)
+        self.workforce = WorkforceLedger(self)  # Keeps building rosters current
+        self.stats = PopulationStats(self)  # Cached values for the dashboards
+        self.crime = CrimeModel(game)  # Crime levels of all buildings as one vector
         
         # Initialize starting population
         for i in range(10):
@@ -17,21 +131,44 @@ class Population:
             
     def add_colonist(self):
         """Add a new colonist if under population cap"""
-        if len(self.colonists) >= self.max_population:
+        if self.store.size >= self.max_population:
             return False
             
-        colonist = Colonist(self.next_colonist_id)
+        colonist = Colonist(self.next_colonist_id, self.store)
+        colonist.population = self
         self.next_colonist_id += 1
-        self.colonists.append(colonist)
+        self.colonists_by_id[colonist.id] = colonist
+        self.reindex_colonist(colonist)
+        self.stats.add_colonist(colonist)
         return True
         
+    def reindex_colonist(self, colonist, old_profession=None):
+        """Move a colonist between the employment indexes after a job change"""
+        self.stats.changed()
+        if old_profession is not None:
+            self.profession_index.get(old_profession, {}).pop(colonist, None)
+        self.employed_index.pop(colonist, None)
+        self.unemployed_index.pop(colonist, None)
+        
+        if colonist.employed:
+            self.employed_index[colonist] = None
+            self.profession_index.setdefault(colonist.profession, {})[colonist] = None
+        else:
+            self.unemployed_index[colonist] = None
+            
+    def unindex_colonist(self, colonist):
+        """Drop a departing colonist from every index"""
+        self.employed_index.pop(colonist, None)
+        self.unemployed_index.pop(colonist, None)
+        self.profession_index.get(colonist.profession, {}).pop(colonist, None)
+        self.colonists_by_id.pop(colonist.id, None)
+        colonist.population = None
+        
     def remove_colonist(self, colonist):
         """Remove a colonist from the population"""
-        if colonist in self.colonists:
+        if colonist.store is self.store:
             # Remove from workplace if employed
-            if colonist.workplace and colonist in colonist.workplace.assigned_colonists:
-                colonist.workplace.assigned_colonists.remove(colonist)
-                colonist.workplace.assigned_workers -= 1
+            self.workforce.drop_colonists([colonist])
             
             # Remove from housing if housed
             if colonist.housing and hasattr(colonist.housing, 'remove_resident'):
@@ -40,52 +177,94 @@ class Population:
                 colonist.housing_quality = 0
                 colonist.rent_cost = 0
                 
-            self.colonists.remove(colonist)
+            self.stats.remove_rows([colonist.row])
+            self.unindex_colonist(colonist)
+            row = colonist.row
+            self.store.remove(colonist)
+            self.housing_market.drop_row(row, self.store.size)
             return True
         return False
         
+    def remove_colonists(self, mask):
+        """Remove every colonist whose row is set in a boolean mask in one pass"""
+        if not mask.any():
+            return 0
+        self.stats.remove_rows(mask)
+        removed = self.store.compact(~mask)
+        self.housing_market.drop_rows(mask)
+        removed_set = set(removed)
+        for colonist in removed:
+            self.unindex_colonist(colonist)
+        
+        # Rebuild each affected workplace roster and residence list once
+        self.workforce.drop_colonists(removed)
+        homes = {c.housing for c in removed if c.housing and hasattr(c.housing, 'residents')}
+        for building in homes:
+            building.residents = [c for c in building.residents if c not in removed_set]
+            
+        for colonist in removed:
+            if colonist.housing:
+                colonist.housing = None
+                colonist.housing_quality = 0
+                colonist.rent_cost = 0
+        return len(removed)
+        
+    @property
+    def colonists(self):
+        """Colonist views, one per store row"""
+        return self.store.views
+        
     @property
     def count(self):
-        return len(self.colonists)
+        return self.store.size
         
     @property
     def employed_colonists(self):
-        return [c for c in self.colonists if c.employed]
+        return list(self.employed_index)
         
     @property
     def unemployed_colonists(self):
-        return [c for c in self.colonists if not c.employed]
+        return list(self.unemployed_index)
         
     @property
     def available_workers(self):
-        return len(self.unemployed_colonists)
+        return len(self.unemployed_index)
         
     @property
     def employed_workers(self):
-        return len(self.employed_colonists)
+        return len(self.employed_index)
+        
+    def get_unemployed_colonist(self):
+        """Get the longest-waiting unemployed colonist, or None"""
+        return next(iter(self.unemployed_index), None)
+        
+    def get_colonists_by_profession(self, profession):
+        """Get employed colonists working in a profession"""
+        return list(self.profession_index.get(profession, ()))
+        
+    def get_profession_count(self, profession):
+        """Get the number of employed colonists working in a profession"""
+        return len(self.profession_index.get(profession, ()))
         
     def calculate_average_happiness(self):
-        if not self.colonists:
+        if not self.store.size:
             return 50
-        return sum(c.happiness for c in self.colonists) / len(self.colonists)
+        return float(self.store.column('happiness').mean())
         
     def calculate_average_health(self):
-        if not self.colonists:
+        if not self.store.size:
             return 80
-        return sum(c.health for c in self.colonists) / len(self.colonists)
+        return float(self.store.column('health').mean())
         
     def calculate_total_wages(self):
-        employed = self.employed_colonists
-        if not employed:
-            return 0
-        return sum(c.wage for c in employed)
+        employed = self.store.column('employed')
+        return float(self.store.column('wage')[employed].sum())
         
     def calculate_average_wage(self):
         """Calculate the average wage of employed colonists"""
-        employed = self.employed_colonists
-        if not employed:
+        if not self.employed_index:
             return 0
-        return sum(c.wage for c in employed) / len(employed)
+        return self.calculate_total_wages() / len(self.employed_index)
         
     def set_wage_for_all(self, new_wage):
         """Set the same wage for all employed colonists"""
@@ -105,55 +284,35 @@ class Population:
         
     def set_wage_for_colonist(self, colonist_id, new_wage):
         """Set wage for a specific colonist"""
-        for colonist in self.colonists:
-            if colonist.id == colonist_id and colonist.employed:
-                return colonist.set_wage(new_wage)
+        colonist = self.colonists_by_id.get(colonist_id)
+        if colonist and colonist.employed:
+            return colonist.set_wage(new_wage)
         return False
         
     def update_employment(self, buildings):
-        """Update employment status based on available buildings"""
-        # First, unassign colonists from destroyed buildings
-        for colonist in self.employed_colonists:
-            if colonist.workplace and colonist.workplace not in buildings:
-                colonist.unassign_from_workplace()
-                
-        # Count current assignments
-        for building in buildings:
-            building.assigned_colonists = [c for c in self.colonists if c.workplace == building]
-            building.assigned_workers = len(building.assigned_colonists)
+        """Settle the day's assignment changes; returns buildings whose staffing changed"""
+        # Rosters are kept current by the workforce ledger as assignments happen
+        return self.workforce.settle(buildings)
         
     def update_housing(self, buildings):
-        """Update housing for all colonists with proper prioritization"""
-        # Get all habitat buildings (including slums)
-        habitats = [b for b in buildings if hasattr(b, 'residents')]
-        
-        # Sort habitats by quality (highest first) so best housing gets filled first
-        habitats.sort(key=lambda h: h.quality, reverse=True)
-        
-        # Sort colonists by wage (highest first) so wealthiest get first pick
-        sorted_colonists = sorted(self.colonists, key=lambda c: c.wage, reverse=True)
-        
-        # Update housing for each colonist in order of priority
-        for colonist in sorted_colonists:
-            colonist.update_housing_situation(habitats)
+        """Update housing for all colonists, wealthiest first"""
+        self.housing_market.update(buildings)
             
     def get_homeless_count(self):
         """Get number of homeless colonists"""
-        return sum(1 for c in self.colonists if not c.housing)
+        return int(np.count_nonzero(~self.store.column('housed')))
         
     def get_housed_count(self):
         """Get number of housed colonists"""
-        return sum(1 for c in self.colonists if c.housing)
+        return int(np.count_nonzero(self.store.column('housed')))
         
     def get_available_housing(self, buildings):
         """Get total available housing capacity"""
-        habitats = [b for b in buildings if hasattr(b, 'residents')]
-        return sum(h.get_vacancy_count() for h in habitats)
+        return sum(h.get_vacancy_count() for h in buildings.residential)
         
     def get_total_housing_capacity(self, buildings):
         """Get total housing capacity"""
-        habitats = [b for b in buildings if hasattr(b, 'residents')]
-        return sum(h.capacity for h in habitats)
+        return sum(h.capacity for h in buildings.residential)
 
     def update(self, resources, buildings):
         """Update all colonists and handle population changes"""
@@ -173,14 +332,8 @@ class Population:
         food_shortage = resources.food <= 0
         severe_shortage = oxygen_shortage or food_shortage
         
-        # Update each colonist
-        for colonist in self.colonists:
-            colonist.update(self.game)
-            
-            # Apply resource shortage effects
-            if severe_shortage:
-                colonist.health -= 2  # Rapid health decline
-                colonist.happiness -= 5  # Severe unhappiness
+        # Update every colonist at once, including resource shortage effects
+        self.store.update_daily(severe_shortage)
         
         # Calculate and pay wages
         total_wages = self.calculate_total_wages()
@@ -189,9 +342,9 @@ class Population:
         else:
             # Can't pay full wages - severe happiness penalty
             #unpaid_ratio = (total_wages - resources.credits) / total_wages
-            for colonist in self.employed_colonists:
-                colonist.happiness -= 40 #* unpaid_ratio
-                #colonist.debt += colonist.wage * unpaid_ratio  # Add unpaid wages to debt
+            self.store.column('happiness')[self.store.column('employed')] -= 40 #* unpaid_ratio
+            self.store.sync_unhappy()
+            #debt[employed] += wage[employed] * unpaid_ratio  # Add unpaid wages to debt
             resources.credits = 0
             
         # Population changes based on happiness, health, and resource availability
@@ -227,50 +380,47 @@ class Population:
                         {"new_count": self.count}
                     ))
             
-        # Handle deaths
-        dead_colonists = []
-        for colonist in self.colonists[:]:  # Copy list for safe iteration
-            death_roll = random.random()
-            if death_roll < death_chance:
-                dead_colonists.append(colonist)
-                
-        # Remove dead colonists
-        for colonist in dead_colonists:
-            self.remove_colonist(colonist)
-            if self.game:
-                self.game.event_manager.publish(GameEvent(
-                    EventType.POPULATION_DECREASE,
-                    "A colonist has died due to poor conditions.",
-                    {"new_count": self.count}
-                ))
-        
-        # Handle colonists leaving
-        leaving_colonists = []
+        # Roll deaths and departures for everyone at once
+        happiness = self.store.column('happiness')
+        debt = self.store.column('debt')
+        dead = self.rng.random(self.count) < death_chance
         leave_chance = 0.10
-        for colonist in self.colonists[:]:
-            if (colonist.happiness < 20 or colonist.debt > 50):
-                if (random.random() < leave_chance):
-                    leaving_colonists.append(colonist)
-                
-        # Remove leaving colonists
-        for colonist in leaving_colonists:
-            self.remove_colonist(colonist)
+        leaving = (~dead & ((happiness < 20) | (debt > 50)) &
+                   (self.rng.random(self.count) < leave_chance))
+        deaths = int(np.count_nonzero(dead))
+        departures = int(np.count_nonzero(leaving))
+        
+        # Remove dead and leaving colonists in a single sweep
+        if deaths or departures:
+            self.remove_colonists(dead | leaving)
             if self.game:
                 self.game.event_manager.publish(GameEvent(
                     EventType.POPULATION_DECREASE,
-                    "A colonist has left the colony due to unhappiness and debt.",
-                    {"new_count": self.count}
+                    self.get_population_decrease_message(deaths, departures),
+                    {"new_count": self.count, "deaths": deaths, "departures": departures}
                 ))
         
         # Ensure values are within bounds
-        for colonist in self.colonists:
-            colonist.happiness = max(0, min(100, colonist.happiness))
-            colonist.health = max(0, min(100, colonist.health))
+        self.store.clamp()
+        self.stats.end_of_day()
+
+    def get_population_decrease_message(self, deaths, departures):
+        """Describe a day's deaths and departures in one player-facing message"""
+        parts = []
+        if deaths == 1:
+            parts.append("A colonist has died due to poor conditions.")
+        elif deaths:
+            parts.append(f"{deaths} colonists have died due to poor conditions.")
+        if departures == 1:
+            parts.append("A colonist has left the colony due to unhappiness and debt.")
+        elif departures:
+            parts.append(f"{departures} colonists have left the colony due to unhappiness and debt.")
+        return " ".join(parts)
 
     def update_health(self, buildings):
         """Apply health boosts from hospitals, scaled by population"""
         # Get all hospitals
-        hospitals = [b for b in buildings if hasattr(b, 'calculate_health_boost')]
+        hospitals = buildings.medical
         
         if not hospitals:
             return  # No hospitals, no health boost
@@ -283,62 +433,31 @@ class Population:
             total_health_boost += hospital.calculate_health_boost(total_population)
         
         # Apply health boost to all colonists
-        for colonist in self.colonists:
-            colonist.health = min(100, colonist.health + total_health_boost)
+        health = self.store.column('health')
+        np.minimum(100, health + total_health_boost, out=health)
 
     def update_crime_system(self, buildings):
         """Update and spread crime across all buildings"""
-        # First, let police precincts apply their area effects
-        self.apply_police_effects(buildings)
-        
-        # Then update crime in each building (generation)
-        for building in buildings:
-            if hasattr(building, 'update_crime'):
-                building.update_crime(self.game)
+        # Police suppression, generation and spreading as vectorized steps
+        changed = self.crime.step(buildings)
         
-        # Spread crime between neighboring buildings using hex map
-        self.spread_crime_to_neighbors(buildings)
-        
-        # Update building effects (quality for residential buildings)
-        for building in buildings:
-            if hasattr(building, 'update_quality_from_crime'):
+        # Update building effects (quality for residential buildings whose crime changed)
+        residential = buildings.residential
+        for building in changed:
+            if building in residential:
                 building.update_quality_from_crime()
-    
-    def apply_police_effects(self, buildings):
-        """Apply police precinct area of effect to reduce crime"""
-        police_precincts = [b for b in buildings if hasattr(b, 'crime_reduction_per_worker')]
-        
-        for precinct in police_precincts:
-            if precinct.active and precinct.assigned_workers > 0:
-                precinct.apply_area_effect(self.game)
-    
-    def spread_crime_to_neighbors(self, buildings):
-        """Spread crime from high-crime buildings to their neighbors using hex map"""
-        hex_map = self.game.graphics.screens['main'].hex_map
-        
-        # Get all building neighbors from hex map
-        building_neighbors = hex_map.get_all_building_neighbors()
-        
-        # Spread crime from each crime source to its neighbors
-        for building, neighbors in building_neighbors.items():
-            if building.is_crime_source and building.crime_level > 10:
-                for neighbor_building in neighbors:
-                    if hasattr(neighbor_building, 'crime_level'):
-                        # Spread crime based on source crime level and neighbor's resistance
-                        spread_amount = building.crime_level * 0.15  # 15% spread
-                        neighbor_building.crime_level = min(100, 
-                            neighbor_building.crime_level + (spread_amount / neighbor_building.crime_resistance))
 
     def check_slum_spawning(self, game):
         """Check if slums should spawn based on homeless situation"""
         # Count homeless colonists who have been homeless for more than 3 days
-        long_term_homeless = [c for c in self.colonists if not c.housing and c.days_homeless >= 3]
+        days_homeless = self.store.column('days_homeless')
+        long_term_homeless = ~self.store.column('housed') & (days_homeless >= 3)
         
-        if not long_term_homeless:
+        homeless_count = int(np.count_nonzero(long_term_homeless))
+        if not homeless_count:
             return False
             
-        homeless_count = len(long_term_homeless)
-        avg_homeless_days = sum(c.days_homeless for c in long_term_homeless) / homeless_count
+        avg_homeless_days = days_homeless[long_term_homeless].sum() / homeless_count
         
         # Calculate spawn chance based on homeless count and days
         base_chance = min(0.8, (homeless_count / 10) + (avg_homeless_days / 30))
@@ -357,44 +476,21 @@ class Population:
         # Create the slum building
         slum = Slums()
         
-        # Find a valid position next to existing buildings
-        valid_hexes = self.find_slum_placement_hexes(game.graphics.screens['main'].hex_map)
+        # Choose a random valid position next to existing buildings
+        target_hex = game.colony_map.frontier.choice(random)
         
-        if valid_hexes:
-            # Choose a random valid hex
-            target_hex = random.choice(valid_hexes)
-            
+        if target_hex:
             # Place the slum
-            target_hex.place_building(slum)
-            game.buildings.append(slum)
+            game.place_building(target_hex, slum)
             
             # Notify player
-            if game.graphics:
-                game.graphics.show_message("Slums have appeared due to housing shortages!")
+            game.show_message("Slums have appeared due to housing shortages!")
             
             return True
         
         return False
 
-    def find_slum_placement_hexes(self, hex_map):
-        """Find valid hexes for slum placement (next to existing buildings) - UPDATED"""
-        valid_hexes = []
-        
-        # Find all hexes adjacent to existing buildings using HexMap methods
-        for hexagon in hex_map.hexagons:
-            # Skip hexes that already have buildings
-            if hexagon.building:
-                continue
-                
-            # Check if this hex is adjacent to any building using centralized neighbor function
-            neighbor_buildings = hex_map.get_neighbor_buildings(hexagon)
-            
-            if neighbor_buildings:  # If there are any neighboring buildings
-                # Check if the hexagon is accessible (has at least one accessible side)
-                neighbor_elevations = hex_map.get_neighbor_elevations(hexagon)
-                accessible_sides = hexagon.get_accessible_sides(neighbor_elevations)
-                
-                if any(accessible_sides):  # At least one side is accessible
-                    valid_hexes.append(hexagon)
-        
-        return valid_hexes
\ No newline at end of file
+    def find_slum_placement_hexes(self, colony_map):
+        """Find valid hexes for slum placement (next to existing buildings)"""
+        # The map keeps the empty, accessible tiles bordering the colony up to date
+        return list(colony_map.frontier)
\ No newline at end of file
@@ -69,7 +69,7 @@ class Quest:
         elif obj_type == 'population_count':
             return game.population.count >= objective['required']
         elif obj_type == 'building_count':
-            count = sum(1 for b in game.buildings if isinstance(b, objective['building_type']))
+            count = game.buildings.count_of(objective['building_type'])
             return count >= objective['required']
         elif obj_type == 'day_reached':
             return game.day >= objective['required']
@@ -98,16 +98,14 @@ def execute_reward(reward_dict, game):
         current = getattr(game.resources, resource_type, 0)
         setattr(game.resources, resource_type, current + amount)
         
-        if hasattr(game, 'graphics'):
-            game.graphics.show_message(f"Quest Reward: +{amount} {resource_type}")
+        game.show_message(f"Quest Reward: +{amount} {resource_type}")
     
     elif reward_type == "unlock_building":
         building_class = reward_dict["building_class"]
         building_name = building_class.__name__
         if game.construction_system.unlock_building(building_name):
-            if hasattr(game, 'graphics'):
-                building_instance = building_class()
-                game.graphics.show_message(f"New Building Unlocked: {building_instance.name}")
+            building_instance = building_class()
+            game.show_message(f"New Building Unlocked: {building_instance.name}")
             return True
         return False
     
@@ -123,8 +121,7 @@ def execute_reward(reward_dict, game):
             game.market.modify_base_price(resource_type, modifier)
             message = f"{resource_type} market price modified by {modifier:.1%}"
         
-        if hasattr(game, 'graphics'):
-            game.graphics.show_message(f"Quest Reward: {message}")
+        game.show_message(f"Quest Reward: {message}")
     
     elif reward_type == "grant_population_bonus":
         bonus_count = reward_dict["bonus_count"]
@@ -136,8 +133,8 @@ def execute_reward(reward_dict, game):
         new_count = game.population.count
         actual_bonus = new_count - old_count
         
-        if hasattr(game, 'graphics') and actual_bonus > 0:
-            game.graphics.show_message(f"Quest Reward: +{actual_bonus} new colonists arrived!")
+        if actual_bonus > 0:
+            game.show_message(f"Quest Reward: +{actual_bonus} new colonists arrived!")
     
     elif reward_type == "reduce_market_fees":
         buy_reduction = reward_dict["buy_reduction"]
@@ -157,8 +154,8 @@ def execute_reward(reward_dict, game):
         if sell_improvement > 0:
             message_parts.append(f"sell fees improved by {sell_improvement:.1%}")
             
-        if message_parts and hasattr(game, 'graphics'):
-            game.graphics.show_message(f"Quest Reward: Market {', '.join(message_parts)}")
+        if message_parts:
+            game.show_message(f"Quest Reward: Market {', '.join(message_parts)}")
     
     elif reward_type == "grant_shares":
         resource_type = reward_dict["resource_type"]
@@ -173,8 +170,7 @@ def execute_reward(reward_dict, game):
             else:
                 ticker = resource_type.upper()
                 
-            if hasattr(game, 'graphics'):
-                game.graphics.show_message(f"Quest Reward: Received {shares} shares of {ticker}")
+            game.show_message(f"Quest Reward: Received {shares} shares of {ticker}")
     
     elif reward_type == "unlock_advanced_building":
         # This would unlock buildings not in the initial catalog
@@ -186,23 +182,23 @@ def execute_reward(reward_dict, game):
         for building_name, price in advanced_buildings.items():
             game.construction_system.unlock_building(building_name)
             
-        if hasattr(game, 'graphics'):
-            game.graphics.show_message("Quest Reward: Advanced buildings unlocked!")
+        game.show_message("Quest Reward: Advanced buildings unlocked!")
     
     elif reward_type == "permanent_production_boost":
         building_type = reward_dict["building_type"]
         multiplier = reward_dict["multiplier"]
         
-        for building in game.buildings:
-            if isinstance(building, building_type):
-                if hasattr(building, 'production_boost'):
-                    building.production_boost *= multiplier
-                else:
-                    building.production_boost = multiplier
+        producers = game.buildings.producers
+        for building in game.buildings.of_type(building_type):
+            if building not in producers:
+                continue
+            if hasattr(building, 'production_boost'):
+                building.production_boost *= multiplier
+            else:
+                building.production_boost = multiplier
                     
-        if hasattr(game, 'graphics'):
-            building_instance = building_type()
-            game.graphics.show_message(f"Quest Reward: {building_instance.name} production +{multiplier:.1%}")
+        building_instance = building_type()
+        game.show_message(f"Quest Reward: {building_instance.name} production +{multiplier:.1%}")
 
 # NEW: Function to get reward description from dictionary
 def get_reward_description(reward_dict):
@@ -15,7 +15,7 @@ def create_population_trigger(population_count: int):
 
 def create_building_trigger(building_type, count: int = 1):
     """Trigger when a specific building type is constructed"""
-    return lambda game: sum(1 for b in game.buildings if isinstance(b, building_type)) >= count
+    return lambda game: game.buildings.count_of(building_type) >= count
 
 def create_event_trigger(event_type: EventType, data_condition: callable = None):
     """Trigger when a specific event occurs"""
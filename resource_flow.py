@@ -0,0 +1,99 @@
+# resource_flow.py - Compiled production/consumption model for the colony's buildings
+import numpy as np
+
+RESOURCES = ('oxygen', 'food', 'regolith', 'energy', 'credits', 'hydrogen', 'fuel')
+RESOURCE_INDEX = {resource: i for i, resource in enumerate(RESOURCES)}
+
+
+class ResourceFlow:
+    """Buildings x resources rate matrices plus staffing, crime and activity vectors.
+
+    Rate rows are compiled once per building. A building's staffing, crime
+    and activity entries are refreshed only after those attributes change,
+    so the daily totals reduce to a few vectorized products.
+    """
+    def __init__(self):
+        self.buildings = []
+        self.rows = {}  # Building -> row index
+        self.registry_version = None
+        self.dirty = {}  # Buildings whose vector entries are stale (ordered set)
+        self.version = 0  # Bumped whenever a building input changes
+
+        count = len(RESOURCES)
+        self.worker_rates = np.zeros((0, count))  # Production per assigned worker
+        self.fixed_rates = np.zeros((0, count))  # Production independent of staffing
+        self.consumption_rates = np.zeros((0, count))  # Consumption at full staffing
+        self.workers = np.zeros(0)
+        self.max_workers = np.ones(0)
+        self.crime_penalty = np.zeros(0)
+        self.active = np.zeros(0, dtype=bool)
+
+    def mark_dirty(self, building):
+        """Called by buildings when workers, crime or activity change"""
+        self.dirty[building] = None
+        self.version += 1
+
+    def compile(self, buildings):
+        """Rebuild every row for a new set of buildings"""
+        for building in self.buildings:
+            if building.flow is self:
+                building.flow = None
+        self.buildings = list(buildings)
+        self.rows = {building: i for i, building in enumerate(self.buildings)}
+        self.registry_version = getattr(buildings, 'version', None)
+
+        count = len(self.buildings)
+        self.worker_rates = np.zeros((count, len(RESOURCES)))
+        self.fixed_rates = np.zeros((count, len(RESOURCES)))
+        self.consumption_rates = np.zeros((count, len(RESOURCES)))
+        for i, building in enumerate(self.buildings):
+            per_worker, fixed = building.get_production_rates()
+            self._fill(self.worker_rates[i], per_worker)
+            self._fill(self.fixed_rates[i], fixed)
+            self._fill(self.consumption_rates[i], building.get_consumption_rates())
+            building.flow = self
+
+        self.workers = np.zeros(count)
+        self.max_workers = np.array([max(1, b.max_workers) for b in self.buildings], dtype=float)
+        self.crime_penalty = np.zeros(count)
+        self.active = np.zeros(count, dtype=bool)
+        self.dirty = dict.fromkeys(self.buildings)
+
+    def _fill(self, row, rates):
+        """Write a {resource: rate} dict into a matrix row"""
+        for resource, rate in rates.items():
+            row[RESOURCE_INDEX[resource]] = rate
+
+    def refresh(self, buildings):
+        """Recompile on construction/demolition, then update stale rows"""
+        version = getattr(buildings, 'version', None)
+        if version is None or version != self.registry_version or len(self.buildings) != len(buildings):
+            self.compile(buildings)
+
+        for building in self.dirty:
+            i = self.rows.get(building)
+            if i is None:
+                continue  # Demolished since it was marked
+            self.workers[i] = building.assigned_workers
+            self.crime_penalty[i] = building.get_crime_penalty()
+            self.active[i] = building.active
+        self.dirty.clear()
+
+    def daily_totals(self, buildings, stock):
+        """Total building production and consumption for one day as resource vectors.
+
+        `stock` is the resource vector at the start of the day; a building
+        only produces if it could cover its own consumption from it.
+        """
+        self.refresh(buildings)
+        if not self.buildings:
+            return np.zeros(len(RESOURCES)), np.zeros(len(RESOURCES))
+
+        staffing = self.workers / self.max_workers
+        consumption = staffing[:, None] * self.consumption_rates
+        can_operate = np.all((consumption <= 0) | (stock >= consumption), axis=1)
+
+        # Inactive buildings still consume but produce nothing
+        output = np.where(can_operate & self.active, 1.0 - self.crime_penalty, 0.0)
+        production = (output * self.workers) @ self.worker_rates + output @ self.fixed_rates
+        return production, consumption.sum(axis=0)
@@ -1,6 +1,11 @@
-import pygame
+import numpy as np
+
+from resource_flow import ResourceFlow, RESOURCES, RESOURCE_INDEX
+
 
 class ResourceManager:
+    version = 0  # Bumped whenever a resource amount changes
+
     def __init__(self):
         self.oxygen = 100
         self.food = 100
@@ -12,6 +17,12 @@ class ResourceManager:
         
         self.images = {}
         self.fonts = {}
+        self.flow = ResourceFlow()  # Compiled building production/consumption
+
+    def __setattr__(self, name, value):
+        if name in RESOURCE_INDEX:
+            object.__setattr__(self, 'version', self.version + 1)
+        object.__setattr__(self, name, value)
 
     def apply_production(self, production_dict, consumption_dict):
         # Apply production
@@ -27,43 +38,24 @@ class ResourceManager:
                 setattr(self, resource, max(0, current - amount))
 
     def update(self, population, buildings):
-        # Calculate total production and consumption from all buildings
-        total_production = {
-            'oxygen': 0, 'food': 0, 'regolith': 0, 'energy': 0, 
-            'credits': 0, 'hydrogen': 0, 'fuel': 0
-        }
-        total_consumption = {
-            'oxygen': 0, 'food': 0, 'regolith': 0, 'energy': 0, 
-            'credits': 0, 'hydrogen': 0, 'fuel': 0
-        }
+        """Apply one day of production and consumption"""
+        stock = np.array([getattr(self, resource) for resource in RESOURCES], dtype=float)
         
-        # Base consumption by population - now based on individual colonists
-        total_consumption['oxygen'] += population.count * 0.1
-        total_consumption['food'] += population.count * 0.2
-        total_consumption['energy'] += population.count * 0.05
-        
-        # Calculate building production and consumption
-        for building in buildings:
-            production = building.calculate_effective_production(self)  # Use the new method
-            consumption = building.calculate_consumption()
-            
-            for resource, amount in production.items():
-                total_production[resource] += amount
-                    
-            for resource, amount in consumption.items():
-                total_consumption[resource] += amount
+        # Building production and consumption from the compiled flow model
+        production, consumption = self.flow.daily_totals(buildings, stock)
         
-        # Calculate rent income from all colonists
-        rent_income = 0
-        for colonist in population.colonists:
-            if colonist.housing and colonist.can_afford_rent():
-                rent_income += colonist.rent_cost
+        # Base consumption by population - now based on individual colonists
+        consumption[RESOURCE_INDEX['oxygen']] += population.count * 0.1
+        consumption[RESOURCE_INDEX['food']] += population.count * 0.2
+        consumption[RESOURCE_INDEX['energy']] += population.count * 0.05
         
-        # Add rent income to credits
-        total_production['credits'] += rent_income
+        # Add rent income from all colonists to credits
+        production[RESOURCE_INDEX['credits']] += population.store.rent_income()
         
-        # Apply the net effect
-        self.apply_production(total_production, total_consumption)
+        # Apply the net effect (stocks never drop below zero)
+        new_stock = np.maximum(0, stock + production - consumption)
+        for resource, amount in zip(RESOURCES, new_stock.tolist()):
+            setattr(self, resource, amount)
 
     def get_resource(self, resource_name):
         return getattr(self, resource_name, 0)
@@ -74,6 +66,7 @@ class ResourceManager:
 
     def load_image(self, key, path, scale=None):
         """Load and optionally scale an image"""
+        import pygame  # Imported lazily so the simulation can run headless
         try:
             image = pygame.image.load(path)
             if image.get_alpha():
@@ -92,6 +85,7 @@ class ResourceManager:
     
     def create_placeholder(self, size):
         """Create a placeholder image for missing assets"""
+        import pygame
         placeholder = pygame.Surface(size, pygame.SRCALPHA)
         pygame.draw.rect(placeholder, (255, 0, 255), (0, 0, size[0], size[1]), 2)
         font = pygame.font.SysFont('Arial', min(size)//4)
@@ -106,6 +100,7 @@ class ResourceManager:
     
     def load_font(self, key, path, size):
         """Load a font"""
+        import pygame
         try:
             font = pygame.font.Font(path, size)
             self.fonts[key] = font
@@ -116,4 +111,5 @@ class ResourceManager:
     
     def get_font(self, key):
         """Retrieve a loaded font"""
+        import pygame
         return self.fonts.get(key, pygame.font.SysFont('Arial', 16))
\ No newline at end of file
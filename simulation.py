@@ -0,0 +1,165 @@
+# simulation.py - Headless colony simulation (no pygame, no display)
+import numpy as np
+
+from resources import ResourceManager
+from population import Population
+from buildings import Mine, EnergyGenerator, OxygenGenerator, HydroponicFarm, Hospital, HabitatBlock
+from colony_map import ColonyMap
+from building_registry import BuildingRegistry
+from market import Market
+from stock_market import StockMarket
+from events.event_system import EventManager
+from events import EventType, GameEvent
+from construction import ConstructionSystem
+from forecast import ForecastService
+from path_service import PathService
+from quests import QuestManager
+from quests.quest_definitions import get_initial_quests, get_midgame_quests
+from messages import MessageManager
+from messages.message_definitions import get_initial_messages
+
+# Grid size that fills the map panel of the default 1024x768 main screen
+DEFAULT_MAP_COLUMNS = 11
+DEFAULT_MAP_ROWS = 9
+
+
+class SimulationCore:
+    """Owns the colony state and advances it day by day.
+
+    Rendering is optional: a Graphics instance can be attached as an
+    observer through `self.graphics`, otherwise the core runs headless.
+    """
+    def __init__(self, map_cols=DEFAULT_MAP_COLUMNS, map_rows=DEFAULT_MAP_ROWS, seed=None):
+        self.graphics = None  # Optional observer, attached by Game
+        # Seeds the terrain, the daily death and departure rolls and both markets.
+        # Births, new colonists' stats, slum spawning and events still draw from `random`
+        self.seed = seed
+        map_seed, population_seed, market_seed, stock_seed = np.random.SeedSequence(seed).spawn(4)
+
+        self.resources = ResourceManager()
+        self.population = Population(self, seed=population_seed)
+        initial_buildings = [
+            Mine(),
+            EnergyGenerator(),
+            OxygenGenerator(),
+            HydroponicFarm(),
+            Hospital(),
+            HabitatBlock()
+        ]
+
+        # Map model - buildings are placed on it before any graphics exist
+        self.colony_map = ColonyMap(map_cols, map_rows, seed=map_seed)
+        self.colony_map.place_buildings(initial_buildings)
+
+        # Registry indexes buildings by type, capability and position once placed
+        self.buildings = BuildingRegistry(initial_buildings)
+
+        # Routing between accessible hexes, with cached building distances
+        self.path_service = PathService(self.colony_map, self.buildings)
+
+        self.market = Market(seed=market_seed)
+        self.stock_market = StockMarket(self.market, self.resources, seed=stock_seed)
+        self.day = 1
+        self.event_manager = EventManager()
+
+        # Cached next-day resource projection
+        self.forecast = ForecastService(self)
+
+        # Construction system
+        self.construction_system = ConstructionSystem(self)
+
+        # Quest system
+        self.quest_manager = QuestManager(self)
+        self._initialize_quests()
+
+        # Message system
+        self.message_manager = MessageManager(self)
+        self._initialize_messages()
+
+        # Check for initial messages
+        self.message_manager.check_pending_messages()
+
+    def _initialize_quests(self):
+        """Initialize starting quests"""
+        for quest in get_initial_quests():
+            self.quest_manager.add_quest(quest)
+
+    def _initialize_messages(self):
+        """Initialize starting messages"""
+        for message in get_initial_messages():
+            self.message_manager.add_message(message)
+
+    def show_message(self, message):
+        """Forward a player-facing message to the attached graphics, if any"""
+        if self.graphics:
+            self.graphics.show_message(message)
+
+    def check_midgame_quests(self):
+        """Check and add midgame quests when appropriate"""
+        if self.day >= 20:
+            for quest in get_midgame_quests():
+                if quest.quest_id not in self.quest_manager.quests:
+                    self.quest_manager.add_quest(quest)
+
+    def place_building(self, tile, building):
+        """Place a building on a map tile and register it with the colony"""
+        if not self.colony_map.place_building(tile, building):
+            return False
+        self.buildings.append(building)
+        return True
+
+    def remove_building(self, tile):
+        """Demolish the building on a map tile, releasing its residents and workers"""
+        building = self.buildings.at((tile.map_x, tile.map_y))
+        if building is None:
+            return False
+
+        # Handle colonists in residential buildings
+        if hasattr(building, 'residents') and building.residents:
+            # Remove all residents from the habitat
+            for colonist in building.residents[:]:  # Use slice copy to avoid modification during iteration
+                building.remove_resident(colonist)
+
+        # Unassign all workers from the building
+        self.population.workforce.release_building(building)
+
+        # Remove building from game buildings list
+        if building in self.buildings:
+            self.buildings.remove(building)
+
+        # Remove building from the map
+        self.colony_map.remove_building(tile)
+        return True
+
+    def next_day(self):
+        """Advance to the next day"""
+        self.resources.update(self.population, self.buildings)
+        self.population.update(self.resources, self.buildings)
+        self.market.update_market()
+        self.stock_market.update_market(self.day)
+        self.quest_manager.update_quests()
+
+        self.day += 1
+
+        # Publish day advanced event
+        self.event_manager.publish(GameEvent(
+            EventType.DAY_ADVANCED,
+            f"Day {self.day} has begun",
+            {"day": self.day}
+        ))
+
+        # Check for pending messages
+        self.message_manager.check_pending_messages()
+
+        # Check for game over
+        if self.population.count <= 0:
+            self.show_message("Game Over! Your colony has failed.")
+            return False
+        return True
+
+    def run_days(self, days):
+        """Advance the simulation several days; stops early on game over"""
+        for _ in range(days):
+            if not self.next_day():
+                return False
+        return True
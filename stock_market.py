@@ -1,59 +1,111 @@
-import random
 from enum import Enum
 
+import numpy as np
+
+from timeseries import RingBuffer, RollingStats
+
 class MarketSentiment(Enum):
     BULLISH = "bullish"
     BEARISH = "bearish"
     NEUTRAL = "neutral"
 
+# Sentiment codes stored per index: 0 neutral, 1 bullish, -1 (last item) bearish
+SENTIMENTS = (MarketSentiment.NEUTRAL, MarketSentiment.BULLISH, MarketSentiment.BEARISH)
+
+TICKERS = {
+    'regolith': 'RGLT',
+    'food': 'FOOD',
+    'oxygen': 'OXYG',
+    'hydrogen': 'HYDR',
+    'fuel': 'FUEL'
+}
+
+COMMODITY_INFLUENCE = 0.3  # 30% influence from commodities
+
+
+def _float_field(name):
+    """Property reading/writing one index's entry of a StockMarket float array"""
+    def getter(self):
+        return float(getattr(self.market, name)[self.row])
+    
+    def setter(self, value):
+        getattr(self.market, name)[self.row] = value
+    return property(getter, setter)
+
+
+def _int_field(name):
+    """Property reading/writing one index's entry of a StockMarket integer array"""
+    def getter(self):
+        return int(getattr(self.market, name)[self.row])
+    
+    def setter(self, value):
+        getattr(self.market, name)[self.row] = value
+    return property(getter, setter)
+
+
 class ResourceIndex:
-    def __init__(self, resource_type, base_price):
+    """Thin view over one ticker's entries in the StockMarket arrays.
+
+    Prices, sentiment, volume and the per-index random traits live in the
+    market's arrays so a trading day runs for every index at once; the
+    view only keeps the index's row, resource name and ticker symbol.
+    """
+    current_price = _float_field('prices')
+    previous_close = _float_field('previous_close')
+    base_price = _float_field('base_prices')
+    volatility = _float_field('volatilities')  # 8-25% volatility
+    beta = _float_field('betas')
+    sentiment_momentum = _float_field('sentiment_momentum')
+    market_cap = _float_field('market_caps')
+    volume = _int_field('volumes')
+    
+    def __init__(self, market, row, resource_type, ticker=None):
+        self.market = market
+        self.row = row
         self.resource_type = resource_type
-        self.ticker = self._generate_ticker(resource_type)
-        
-        # Price metrics
-        self.base_price = base_price
-        self.current_price = base_price
-        self.previous_close = base_price
-        
-        # Market metrics
-        self.volume = 0
-        self.price_history = [base_price]  # Start with base price
-        self.volatility = random.uniform(0.08, 0.25)  # 8-25% volatility
-        
-        # Individual index sentiment and factors
-        self.sentiment = MarketSentiment.NEUTRAL
-        self.sentiment_momentum = 0
-        self.beta = random.uniform(0.7, 1.3)
-        self.market_cap = base_price * random.randint(50000, 200000)
-        
+        self.ticker = ticker or self._generate_ticker(resource_type)
+    
     def _generate_ticker(self, resource_type):
         """Generate a ticker symbol for the resource index"""
-        tickers = {
-            'regolith': 'RGLT',
-            'food': 'FOOD',
-            'oxygen': 'OXYG', 
-            'hydrogen': 'HYDR',
-            'fuel': 'FUEL'
-        }
-        return tickers.get(resource_type, resource_type.upper()[:4])
+        return TICKERS.get(resource_type, resource_type.upper()[:4])
+    
+    @property
+    def sentiment(self):
+        return SENTIMENTS[self.market.sentiments[self.row]]
+    
+    @property
+    def price_history(self):
+        """Read-only view of this index's stored daily closes, oldest first"""
+        return self.market.history.last()[:, self.row]
     
     def calculate_commodity_influence(self, commodity_ratio):
         """Calculate how commodity prices influence this index"""
         # Commodity ratio above 1.0 is bullish, below 1.0 is bearish for the resource
-        return (commodity_ratio - 1.0) * 0.3  # 30% influence from commodities
+        return (commodity_ratio - 1.0) * COMMODITY_INFLUENCE
 
 
 class StockMarket:
-    def __init__(self, commodity_market, resources):
+    """Every resource index advanced together as NumPy arrays.
+
+    Index state (price, previous close, base price, sentiment momentum,
+    beta, volatility, volume, market cap) is one array entry per ticker,
+    and daily closes go into one RingBuffer row per day with rolling
+    statistics for all tickers. A trading day draws all of its random
+    numbers from one NumPy generator in a few array calls, so its cost
+    barely grows with the number of listed indices. ResourceIndex objects
+    in `self.indices` are views for trading and display.
+    """
+    def __init__(self, commodity_market, resources, seed=None, history_days=50):
         self.commodity_market = commodity_market
         self.resources = resources
+        self.rng = np.random.default_rng(seed)
         self.indices = {}
+        self.tickers = []  # Resource name per array row
         self.day = 0
         self.last_update_day = 0
         
         # Player portfolio
-        self.player_portfolio = {resource: 0 for resource in ['regolith', 'food', 'oxygen', 'hydrogen', 'fuel']}
+        self.player_portfolio = {}
         self.trade_history = []
         
         # Global market conditions (affect all indices but to varying degrees)
@@ -62,190 +114,215 @@ class StockMarket:
         
         self.pending_news_events = []
         
+        # Per-index state, one entry per row of self.tickers
+        self.prices = np.zeros(0)
+        self.previous_close = np.zeros(0)
+        self.base_prices = np.zeros(0)
+        self.volatilities = np.zeros(0)
+        self.betas = np.zeros(0)
+        self.sentiment_momentum = np.zeros(0)
+        self.sentiments = np.zeros(0, dtype=np.int8)
+        self.market_caps = np.zeros(0)
+        self.volumes = np.zeros(0, dtype=np.int64)
+        self.commodity_rows = np.zeros(0, dtype=np.intp)  # Commodity per index, -1 for none
+        self.commodities = list(commodity_market.base_prices)
+        
+        self.history = RingBuffer(history_days, width=0)
+        self.stats = RollingStats(self.history)
+        self.index_stats = None  # Display statistics of every index, until the next close
+        
         self._initialize_indices()
     
     def _initialize_indices(self):
         """Initialize index funds for each resource type"""
         base_prices = {
             'regolith': 45,
-            'food': 75, 
+            'food': 75,
             'oxygen': 35,
             'hydrogen': 25,
             'fuel': 90
         }
-        
-        for resource, base_price in base_prices.items():
-            self.indices[resource] = ResourceIndex(resource, base_price)
+        self.add_indices(base_prices)
+    
+    def add_indices(self, base_prices, tickers=None):
+        """List new indices, given as {resource name: base price}; returns their views.
+
+        New indices start at their base price with a flat price history.
+        Names matching a commodity follow that commodity's price.
+        """
+        names = [name for name in base_prices if name not in self.indices]
+        if not names:
+            return []
+        count = len(names)
+        start = len(self.tickers)
+        base = np.array([base_prices[name] for name in names], dtype=float)
+        
+        self.prices = np.concatenate((self.prices, base))
+        self.previous_close = np.concatenate((self.previous_close, base))
+        self.base_prices = np.concatenate((self.base_prices, base))
+        self.volatilities = np.concatenate((self.volatilities, self.rng.uniform(0.08, 0.25, count)))
+        self.betas = np.concatenate((self.betas, self.rng.uniform(0.7, 1.3, count)))
+        self.market_caps = np.concatenate((self.market_caps, base * self.rng.integers(50000, 200001, count)))
+        self.sentiment_momentum = np.concatenate((self.sentiment_momentum, np.zeros(count)))
+        self.sentiments = np.concatenate((self.sentiments, np.zeros(count, dtype=np.int8)))
+        self.volumes = np.concatenate((self.volumes, np.zeros(count, dtype=np.int64)))
+        rows = [self.commodities.index(name) if name in self.commodities else -1 for name in names]
+        self.commodity_rows = np.concatenate((self.commodity_rows, np.array(rows, dtype=np.intp)))
+        
+        # Back-fill a flat history, or start the history with base prices
+        self.stats.widen(base)
+        if not len(self.history):
+            self.stats.append(self.prices)
+        self.index_stats = None
+        
+        added = []
+        for offset, name in enumerate(names):
+            ticker = tickers.get(name) if tickers else None
+            index = self.indices[name] = ResourceIndex(self, start + offset, name, ticker)
+            self.tickers.append(name)
+            self.player_portfolio.setdefault(name, 0)
+            added.append(index)
+        return added
     
     def update_market(self, game_day):
         """Update stock market for the new day"""
         if game_day == self.last_update_day:
             return
-            
+        
         self.day = game_day
         self.last_update_day = game_day
         
         # Update global market conditions
         self._update_global_conditions()
         
-        # Update each resource index price with individual sentiment
-        for resource, index in self.indices.items():
-            self._update_index_sentiment(index)
-            self._update_index_price(index)
-            
+        # Update every index's sentiment and price at once
+        if self.tickers:
+            self._update_index_sentiment()
+            self._update_index_prices()
+        
         # Apply any pending news events
         self._apply_pending_news()
         
         # Generate random market events (25% chance per day)
-        if random.random() < 0.25:
+        if self.rng.random() < 0.25:
             self._generate_market_event()
     
     def _update_global_conditions(self):
         """Update overall market conditions that affect all indices"""
         # Global volatility slowly changes
-        volatility_change = random.uniform(-0.02, 0.02)
-        self.global_volatility = max(0.05, min(0.4, self.global_volatility + volatility_change))
+        volatility_change = self.rng.uniform(-0.02, 0.02)
+        self.global_volatility = float(max(0.05, min(0.4, self.global_volatility + volatility_change)))
         
         # Global trend has momentum but mean-reverts to zero
-        trend_change = random.uniform(-0.01, 0.01)
-        self.global_trend = self.global_trend * 0.9 + trend_change * 0.1
+        trend_change = self.rng.uniform(-0.01, 0.01)
+        self.global_trend = float(self.global_trend * 0.9 + trend_change * 0.1)
     
-    def _update_index_sentiment(self, index):
-        """Update individual index sentiment based on its specific conditions"""
-        sentiment_factors = []
-        
+    def _commodity_ratios(self):
+        """Commodity price over base price for every index (1.0 without a commodity)"""
+        market = self.commodity_market
+        ratios = [market.prices[name] / market.base_prices[name] for name in self.commodities]
+        ratios.append(1.0)  # Row -1: no linked commodity
+        return np.array(ratios)[self.commodity_rows]
+    
+    def _update_index_sentiment(self):
+        """Update every index's sentiment from its own conditions"""
         # Factor 1: Commodity price influence (most important)
-        commodity_price = self.commodity_market.prices[index.resource_type]
-        commodity_base = self.commodity_market.base_prices[index.resource_type]
-        commodity_ratio = commodity_price / commodity_base
-        commodity_influence = index.calculate_commodity_influence(commodity_ratio)
-        sentiment_factors.append(commodity_influence)
+        commodity_influence = (self._commodity_ratios() - 1.0) * COMMODITY_INFLUENCE
         
-        # Factor 2: Price momentum (recent performance)
-        momentum = self._calculate_price_momentum(index)
-        sentiment_factors.append(momentum * 0.4)  # 40% weight to momentum
+        # Factor 2: Price momentum (recent performance), 40% weight
+        momentum = self._calculate_price_momentum()
         
         # Factor 3: Global market influence
-        sentiment_factors.append(self.global_trend * index.beta)
+        global_influence = self.global_trend * self.betas
         
         # Factor 4: Random noise (affected by volatility)
-        noise = random.gauss(0, index.volatility * 0.1)
-        sentiment_factors.append(noise)
+        noise = self.rng.normal(0, self.volatilities * 0.1)
         
         # Calculate net sentiment
-        net_sentiment = sum(sentiment_factors)
+        net_sentiment = commodity_influence + momentum * 0.4 + global_influence + noise
         
         # Update sentiment momentum (slower changes)
-        index.sentiment_momentum = index.sentiment_momentum * 0.8 + net_sentiment * 0.2
+        self.sentiment_momentum = self.sentiment_momentum * 0.8 + net_sentiment * 0.2
         
         # Determine sentiment
-        if index.sentiment_momentum > 0.03:
-            index.sentiment = MarketSentiment.BULLISH
-        elif index.sentiment_momentum < -0.03:
-            index.sentiment = MarketSentiment.BEARISH
-        else:
-            index.sentiment = MarketSentiment.NEUTRAL
+        self.sentiments = np.select(
+            [self.sentiment_momentum > 0.03, self.sentiment_momentum < -0.03], [1, -1], 0
+        ).astype(np.int8)
     
-    def _calculate_price_momentum(self, index):
-        """Calculate price momentum from recent history"""
-        if len(index.price_history) < 5:
-            return 0
-        
-        # Use last 5 days for short-term momentum
-        recent_prices = index.price_history[-5:]
-        price_change = (recent_prices[-1] - recent_prices[0]) / recent_prices[0]
+    def _calculate_price_momentum(self):
+        """Calculate price momentum of every index from recent history"""
+        if len(self.history) < 5:
+            return np.zeros(len(self.tickers))
         
-        # Normalize and cap momentum
-        return max(-0.1, min(0.1, price_change * 2))
+        # Use last 5 days for short-term momentum; normalize and cap
+        return np.clip(self.stats.momentum(5) * 2, -0.1, 0.1)
     
-    def _update_index_price(self, index):
-        """Update individual resource index price using realistic price movement"""
-        # Store previous close
-        index.previous_close = index.current_price
+    def _update_index_prices(self):
+        """Update every index price using realistic price movement"""
+        count = len(self.tickers)
+        prices = self.prices
         
-        # Calculate base price movement from sentiment
-        base_movement = 0
+        # Store previous close
+        self.previous_close = prices.copy()
         
-        if index.sentiment == MarketSentiment.BULLISH:
-            base_movement = random.uniform(0.005, 0.03)  # 0.5% to 3% up
-        elif index.sentiment == MarketSentiment.BEARISH:
-            base_movement = random.uniform(-0.03, -0.005)  # 0.5% to 3% down
-        else:  # NEUTRAL
-            base_movement = random.uniform(-0.01, 0.01)  # Small random movement
+        # Calculate base price movement from sentiment:
+        # bullish 0.5% to 3% up, bearish 0.5% to 3% down, neutral small random movement
+        low = np.select([self.sentiments == 1, self.sentiments == -1], [0.005, -0.03], -0.01)
+        high = np.select([self.sentiments == 1, self.sentiments == -1], [0.03, -0.005], 0.01)
+        base_movement = self.rng.uniform(low, high)
         
         # Apply beta to global conditions
-        global_effect = self.global_trend * index.beta
+        global_effect = self.global_trend * self.betas
         
         # Volume effect (high volume can amplify moves)
-        volume_effect = 0
-        if index.volume > 1000:
-            volume_effect = (index.volume / 10000) * 0.01  # Small amplification
+        volume_effect = np.where(self.volumes > 1000, (self.volumes / 10000) * 0.01, 0.0)
         
         # Random volatility effect
-        volatility_effect = random.gauss(0, index.volatility * self.global_volatility)
+        volatility_effect = self.rng.normal(0, self.volatilities * self.global_volatility, count)
         
         # Combine all factors
         total_movement = base_movement + global_effect + volume_effect + volatility_effect
         
         # Apply intelligent mean reversion based on both base price and 30-day average
-        if len(index.price_history) >= 10:
-            # Calculate 30-day moving average (use available history if less than 30 days)
-            days_to_use = min(30, len(index.price_history))
-            moving_avg_30 = sum(index.price_history[-days_to_use:]) / days_to_use
-            recent_avg_10 = sum(index.price_history[-10:]) / 10
+        if len(self.history) >= 10:
+            # 30-day moving average (over the available history if less than 30 days)
+            moving_avg_30 = self.stats.mean(30)
+            recent_avg_10 = self.stats.mean(10)
             
             # Calculate deviations from different benchmarks
-            deviation_from_base = (index.current_price - index.base_price) / index.base_price
-            deviation_from_30day = (index.current_price - moving_avg_30) / moving_avg_30
-            deviation_from_10day = (index.current_price - recent_avg_10) / recent_avg_10
+            deviation_from_base = (prices - self.base_prices) / self.base_prices
+            deviation_from_30day = (prices - moving_avg_30) / moving_avg_30
+            deviation_from_10day = (prices - recent_avg_10) / recent_avg_10
             
             # Weight the deviations (30-day average is most important, then base price, then recent)
             total_deviation = (
                 deviation_from_30day * 0.5 +      # 50% weight to 30-day average (medium-term)
-                deviation_from_base * 0.3 +       # 30% weight to base price (long-term anchor)  
+                deviation_from_base * 0.3 +       # 30% weight to base price (long-term anchor)
                 deviation_from_10day * 0.2        # 20% weight to 10-day average (short-term)
             )
             
             # Apply reversion only for significant deviations (>15% combined deviation)
-            if abs(total_deviation) > 0.15:
-                # Use a gentle reversion coefficient that scales with deviation size
-                reversion_strength = 0.08  # 8% reversion strength at maximum deviation
-                
-                # Scale reversion based on how far we are from equilibrium
-                # More aggressive reversion for larger deviations, gentler for smaller ones
-                reversion_factor = reversion_strength * (abs(total_deviation) - 0.15) / 0.85
-                
-                # Apply reversion in the opposite direction of the deviation
-                reversion = -total_deviation * reversion_factor
-                
-                # Cap maximum daily reversion at 5% to avoid violent corrections
-                #reversion = max(-0.05, min(0.05, reversion))
-                
-                total_movement += reversion
-                
-                # Additional: If price is extremely overvalued (>50% above base), apply stronger base reversion
-                if deviation_from_base > 0.5:
-                    base_reversion = -deviation_from_base * 0.02  # Additional 2% pull toward base
-                    total_movement += base_reversion
-        
-        # Ensure reasonable daily movement (-15% to +15% max)
-        #total_movement = max(-0.15, min(0.15, total_movement))
-        
-        # Apply price change
-        new_price = index.current_price * (1 + total_movement)
-        
-        # Ensure absolute minimum price (1% of base)
-        new_price = max(new_price, index.base_price * 0.01)
-        
-        index.current_price = new_price
-        
-        # Add to price history
-        index.price_history.append(new_price)
-        if len(index.price_history) > 50:  # Keep more history for better averaging
-            index.price_history.pop(0)
+            significant = np.abs(total_deviation) > 0.15
+            
+            # Gentle reversion coefficient (8% at maximum deviation) that scales with
+            # how far we are from equilibrium, applied opposite to the deviation
+            reversion_factor = 0.08 * (np.abs(total_deviation) - 0.15) / 0.85
+            reversion = np.where(significant, -total_deviation * reversion_factor, 0.0)
+            
+            # Additional: If price is extremely overvalued (>50% above base), apply stronger base reversion
+            base_reversion = np.where(significant & (deviation_from_base > 0.5),
+                                      -deviation_from_base * 0.02, 0.0)  # Additional 2% pull toward base
+            total_movement += reversion + base_reversion
+        
+        # Apply price change, keeping an absolute minimum price (1% of base)
+        self.prices = np.maximum(prices * (1 + total_movement), self.base_prices * 0.01)
+        
+        # Add to price history (the oldest day drops out once full) and rolling statistics
+        self.stats.append(self.prices)
+        self.index_stats = None
         
         # Reset daily volume
-        index.volume = 0
+        self.volumes[:] = 0
     
     def _generate_market_event(self):
         """Generate random market events"""
@@ -256,16 +333,17 @@ class StockMarket:
             ("regulation", "New regulations affect {resource} industry", 0.07),
         ]
         
-        event_type, message_template, base_impact = random.choice(event_types)
+        event_type, message_template, base_impact = event_types[self.rng.integers(len(event_types))]
+        direction = self.rng.choice([-1, 1])
         
         # 80% chance affects specific resource, 20% affects all
-        if random.random() < 0.8:
-            affected_resource = random.choice(list(self.indices.keys()))
-            impact = base_impact * random.choice([-1, 1])
+        if self.rng.random() < 0.8 and self.tickers:
+            affected_resource = self.tickers[self.rng.integers(len(self.tickers))]
+            impact = base_impact * direction
             message = message_template.format(resource=affected_resource.capitalize())
         else:
             affected_resource = "all"
-            impact = base_impact * 0.3 * random.choice([-1, 1])  # Smaller broad impact
+            impact = base_impact * 0.3 * direction  # Smaller broad impact
             message = "Market-wide " + message_template.format(resource="prices")
         
         # Adjust impact based on volatility
@@ -274,7 +352,7 @@ class StockMarket:
         self.pending_news_events.append({
             'type': event_type,
             'message': message,
-            'impact': impact,
+            'impact': float(impact),
             'affected_resource': affected_resource,
             'day': self.day + 1
         })
@@ -285,14 +363,13 @@ class StockMarket:
         
         for event in events_to_apply:
             if event['affected_resource'] == 'all':
-                for index in self.indices.values():
-                    # Apply with some variation
-                    variation = random.uniform(0.8, 1.2)
-                    index.current_price *= (1 + event['impact'] * variation)
+                # Apply with some variation per index
+                variation = self.rng.uniform(0.8, 1.2, len(self.tickers))
+                self.prices *= (1 + event['impact'] * variation)
             else:
                 if event['affected_resource'] in self.indices:
                     index = self.indices[event['affected_resource']]
-                    index.current_price *= (1 + event['impact'])
+                    self.prices[index.row] *= (1 + event['impact'])
             
             self.pending_news_events.remove(event)
     
@@ -382,15 +459,29 @@ class StockMarket:
                 index = self.indices[resource]
                 price_change = index.current_price - index.previous_close
                 daily_change += price_change * shares
-
+        
         return daily_change
     
+    def get_index_stats(self):
+        """Rolling statistics of every index as arrays, computed once per close"""
+        if self.index_stats is None:
+            self.index_stats = {
+                'moving_avg_10': self.stats.mean(10),
+                'moving_avg_30': self.stats.mean(30),
+                'ema': self.stats.ema,
+                'price_stdev': np.sqrt(self.stats.variance(30)),
+                'momentum': self.stats.momentum(5),
+            }
+        return self.index_stats
+    
     def get_market_data(self, resource):
         """Get market data for a resource index"""
         if resource not in self.indices:
             return None
         
         index = self.indices[resource]
+        row = index.row
+        stats = self.get_index_stats()
         price_change = index.current_price - index.previous_close
         percent_change = (price_change / index.previous_close) * 100 if index.previous_close > 0 else 0
         
@@ -404,11 +495,16 @@ class StockMarket:
             'volume': index.volume,
             'sentiment': index.sentiment.value,
             'volatility': index.volatility,
-            'price_history': index.price_history[-30:],
+            'price_history': self.history.last(30)[:, row],
+            'moving_avg_10': float(stats['moving_avg_10'][row]),
+            'moving_avg_30': float(stats['moving_avg_30'][row]),
+            'ema': float(stats['ema'][row]),
+            'price_stdev': float(stats['price_stdev'][row]),
+            'momentum': float(stats['momentum'][row]),
             'market_cap': index.market_cap,
             'beta': index.beta
         }
     
     def get_all_indices(self):
         """Get data for all resource indices"""
-        return {resource: self.get_market_data(resource) for resource in self.indices.keys()}
\ No newline at end of file
+        return {resource: self.get_market_data(resource) for resource in self.indices.keys()}
@@ -0,0 +1,99 @@
+# terrain.py - Seedable NumPy terrain generation for the colony map
+import numpy as np
+
+# Odd-row offset neighbour directions, in ColonyMap.get_neighbor_positions order
+HEX_DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+SURFACE_TYPES = ("regolith", "stone", "ice")
+REGOLITH, STONE, ICE = range(3)
+
+
+class TerrainGenerator:
+    """Generates elevation and surface arrays for a map of any size.
+
+    Elevations are 0, 1 or 2 and surfaces are indexes into SURFACE_TYPES,
+    both as (rows, cols) arrays. Every random draw comes from one NumPy
+    generator, so the same seed always yields the same terrain.
+    """
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def generate(self, cols, rows, min_ice=3, min_regolith=3):
+        """Elevation and surface arrays for a cols x rows map"""
+        elevation = self.generate_elevation_map(cols, rows)
+        surface = self.generate_surface_map(elevation)
+        self.ensure_minimum(surface, ICE, min_ice, candidates=(elevation == 0) & (surface != ICE))
+        self.ensure_accessibility(elevation)
+        self.ensure_minimum(surface, REGOLITH, min_regolith, candidates=surface != REGOLITH)
+        return elevation, surface
+
+    def generate_elevation_map(self, cols, rows):
+        """Three noise layers at different scales, bucketed into elevation levels"""
+        scales = np.array([1.0, 2.0, 4.0])[:, None, None]
+        combined = (self.rng.random((3, rows, cols)) * scales).mean(axis=0)
+
+        # Normalize to 0-1 range
+        low, high = combined.min(), combined.max()
+        normalized = (combined - low) / (high - low) if high > low else np.zeros_like(combined)
+
+        # Low below 0.3, medium below 0.6, high above
+        return np.digitize(normalized, [0.3, 0.6]).astype(np.int8)
+
+    def generate_surface_map(self, elevation):
+        """Stone on high ground, ice on some low ground, regolith elsewhere"""
+        roll = self.rng.random(elevation.shape)
+        surface = np.full(elevation.shape, REGOLITH, dtype=np.int8)
+        surface[elevation == 2] = STONE
+        surface[(elevation == 1) & (roll < 0.6)] = STONE  # 60% chance at medium elevation
+        surface[(elevation == 0) & (roll < 0.3)] = ICE  # 30% chance at low elevation
+        return surface
+
+    def ensure_minimum(self, surface, surface_type, minimum, candidates):
+        """Convert random candidate cells until a surface type appears `minimum` times"""
+        needed = minimum - int(np.count_nonzero(surface == surface_type))
+        if needed <= 0:
+            return
+        cells = np.flatnonzero(candidates)
+        chosen = self.rng.choice(cells, size=min(needed, cells.size), replace=False)
+        surface.flat[chosen] = surface_type
+
+    def ensure_accessibility(self, elevation):
+        """Flip cells that no side can be crossed from to their neighbours' level"""
+        neighbors, inside = neighbor_values(elevation)
+        has_neighbors = inside.any(axis=0)
+        elevation[~has_neighbors] = 1  # Only possible on single-cell maps
+
+        while True:
+            blocked = ~inside | (np.abs(neighbors - elevation) >= 2)
+            stuck = blocked.all(axis=0) & has_neighbors
+            if not stuck.any():
+                return
+
+            # Every neighbour of a stuck cell sits two levels away, so flipping
+            # to the opposite extreme matches them. Low cells are raised first
+            # so two adjacent stuck cells never swap with each other
+            if (stuck & (elevation == 0)).any():
+                stuck &= elevation == 0
+            elevation[stuck] = 2 - elevation[stuck]
+            neighbors, inside = neighbor_values(elevation)
+
+
+def neighbor_indices(rows, cols):
+    """(6, rows, cols) flat neighbour indexes and in-bounds flags for an odd-row offset grid"""
+    row_index, col_index = np.indices((rows, cols))
+    indices = np.zeros((6, rows, cols), dtype=np.int64)
+    inside = np.zeros((6, rows, cols), dtype=bool)
+    for side, (dx, dy) in enumerate(HEX_DIRECTIONS):
+        n_row = row_index + dy
+        n_col = col_index + dx
+        if dy:
+            n_col = n_col + (row_index & 1)  # Odd rows are shifted right
+        inside[side] = (n_row >= 0) & (n_row < rows) & (n_col >= 0) & (n_col < cols)
+        indices[side] = n_row.clip(0, rows - 1) * cols + n_col.clip(0, cols - 1)
+    return indices, inside
+
+
+def neighbor_values(grid):
+    """(6, rows, cols) neighbour values and in-bounds flags; outside cells read as 0"""
+    indices, inside = neighbor_indices(*grid.shape)
+    return np.where(inside, grid.ravel()[indices], 0).astype(grid.dtype), inside
@@ -0,0 +1,5 @@
+# conftest.py - Lets tests import the game's top-level modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
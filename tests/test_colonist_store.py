@@ -0,0 +1,211 @@
+# test_colonist_store.py - The column store against the original per-object colonist
+import random
+
+import numpy as np
+
+from buildings import HabitatBlock, Mine, Slums
+from colonist import UNHAPPY_THRESHOLD
+from population import Population
+
+FIELDS = ('health', 'happiness', 'wage', 'savings', 'debt', 'days_unemployed', 'days_homeless',
+          'living_cost', 'housing_quality', 'rent_cost', 'employed')
+
+
+class LegacyColonist:
+    """Colonist.update and its helpers as they were, on plain attributes"""
+    def __init__(self, colonist):
+        for name in FIELDS:
+            setattr(self, name, getattr(colonist, name))
+        self.housing = colonist.housing
+
+    def calculate_living_cost(self):
+        base_cost = self.living_cost + (self.debt * 0.01)
+        if self.housing:
+            base_cost += self.rent_cost
+        return base_cost
+
+    def calculate_housing_happiness(self):
+        if self.housing:
+            if hasattr(self.housing, 'is_slum'):
+                return -10
+            housing_happiness = self.housing_quality * 3
+            if self.wage > 0:
+                rent_ratio = self.rent_cost / self.wage
+                rent_burden = (rent_ratio - 0.3) * 15 if rent_ratio > 0.3 else 0
+            else:
+                rent_burden = 5
+            return housing_happiness - rent_burden
+        return -15 - (self.days_homeless * 0.5)
+
+    def calculate_wage_satisfaction(self):
+        living_cost = self.calculate_living_cost()
+        if self.wage <= living_cost:
+            return -20
+        elif self.wage <= living_cost * 1.5:
+            return 0
+        elif self.wage <= living_cost * 2:
+            return 10
+        return 20
+
+    def update(self, severe_shortage):
+        if not self.housing:
+            self.days_homeless += 1
+        else:
+            self.days_homeless = 0
+
+        wage_satisfaction = self.calculate_wage_satisfaction()
+        employment_factor = 0 if self.employed else -5
+        housing_happiness = self.calculate_housing_happiness()
+        unemployment_penalty = min(20, self.days_unemployed * 0.5)
+        debt_penalty = min(15, self.debt * 0.1)
+        health_factor = (self.health - 50) / 10
+        self.happiness += (wage_satisfaction + employment_factor + housing_happiness -
+                           unemployment_penalty - debt_penalty + health_factor)
+        self.happiness = max(0, min(100, self.happiness))
+
+        self.health -= 0.1
+        if self.health < 30:
+            self.health -= 0.5
+
+        if not self.employed:
+            self.days_unemployed += 1
+        else:
+            self.days_unemployed = 0
+
+        living_cost = self.calculate_living_cost()
+        if self.savings >= living_cost:
+            self.savings -= living_cost
+        else:
+            self.debt += living_cost - self.savings
+            self.savings = 0
+
+        if self.employed and self.wage > 0:
+            self.savings += self.wage
+
+        if severe_shortage:
+            self.health -= 2
+            self.happiness -= 5
+
+    def clamp(self):
+        self.happiness = max(0, min(100, self.happiness))
+        self.health = max(0, min(100, self.health))
+
+
+def make_colony(seed, count=300):
+    """A population with random savings, debts, jobs and homes"""
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    population = Population(seed=seed)
+    population.max_population = count
+    while population.count < count:
+        population.add_colonist()
+
+    mines = [Mine() for _ in range(count // 40)]
+    homes = [Slums() if i % 4 == 3 else HabitatBlock() for i in range(count // 10)]
+    for home in homes:
+        home.capacity = 6
+        if not hasattr(home, 'is_slum'):
+            home.update_quality(float(rng.integers(0, 6)))
+            home.update_rent(float(rng.integers(0, 8)))
+    for colonist in population.colonists:
+        colonist.health = float(rng.uniform(20, 100))
+        colonist.happiness = float(rng.uniform(0, 100))
+        colonist.savings = float(rng.choice([0, rng.uniform(0, 20)]))
+        colonist.debt = float(rng.choice([0, rng.uniform(0, 200)]))
+        colonist.days_unemployed = int(rng.integers(0, 50))
+        colonist.days_homeless = int(rng.integers(0, 10))
+        colonist.living_cost = float(rng.choice([1.0, 1.5, 2.5]))
+        if rng.random() < 0.6:
+            mines[int(rng.integers(len(mines)))].assign_colonist(colonist, float(rng.integers(0, 15)))
+        if rng.random() < 0.7:
+            homes[int(rng.integers(len(homes)))].add_resident(colonist)
+    population.stats.end_of_day()  # Re-add the columns written above, as a tick does
+    return population, mines + homes
+
+
+def test_daily_update_matches_colonist_update():
+    for seed in range(4):
+        population, buildings = make_colony(seed)
+        store = population.store
+        legacy = [LegacyColonist(colonist) for colonist in population.colonists]
+        for day in range(30):
+            severe_shortage = day % 7 == 6
+            store.update_daily(severe_shortage)
+            store.clamp()
+            for colonist in legacy:
+                colonist.update(severe_shortage)
+                colonist.clamp()
+
+            for name in FIELDS:
+                expected = np.array([getattr(colonist, name) for colonist in legacy])
+                assert np.allclose(store.column(name), expected), (seed, day, name)
+            # The views read the same rows
+            sample = population.colonists[::37]
+            assert [c.savings for c in sample] == [float(store.column('savings')[c.row]) for c in sample]
+
+
+def test_unhappy_counters_follow_happiness():
+    population, buildings = make_colony(11)
+    for day in range(20):
+        population.store.update_daily(severe_shortage=day % 3 == 0)
+        population.store.clamp()
+        for building in buildings:
+            workers = sum(c.happiness < UNHAPPY_THRESHOLD for c in building.assigned_colonists)
+            assert building.unhappy_workers == workers, (day, building.name)
+            if hasattr(building, 'residents'):
+                residents = sum(c.happiness < UNHAPPY_THRESHOLD for c in building.residents)
+                assert building.unhappy_residents == residents, (day, building.name)
+
+
+def snapshot(colonist):
+    return {name: getattr(colonist, name) for name in ('health', 'happiness', 'wage', 'savings', 'debt')}
+
+
+def check_rows(population):
+    store = population.store
+    assert len(store.views) == store.size == len(population.colonists_by_id)
+    for row, colonist in enumerate(store.views):
+        assert colonist.row == row and colonist.store is store
+        assert population.colonists_by_id[colonist.id] is colonist
+
+
+def test_removals_match_list_removal():
+    for seed in range(4):
+        population, buildings = make_colony(seed)
+        population.max_population = 1000
+        rng = np.random.default_rng(seed)
+        legacy = [(c.id, snapshot(c)) for c in population.colonists]  # The old colonist list
+        for day in range(25):
+            # A batch pass keeps the survivors in list order
+            mask = rng.random(population.count) < 0.08
+            leaving = [c for c, leaves in zip(population.colonists, mask) if leaves]
+            population.remove_colonists(mask)
+            legacy = [entry for entry, leaves in zip(legacy, mask) if not leaves]
+            assert [(c.id, snapshot(c)) for c in population.colonists] == legacy, (seed, day)
+
+            # Removed views keep their values on a detached store
+            gone = {c.id for c in leaving}
+            for colonist in leaving:
+                assert colonist.store is not population.store and colonist.population is None
+                assert colonist.housing is None
+                assert colonist.store.views[colonist.row] is colonist
+            for building in buildings:
+                assert not gone & {c.id for c in building.assigned_colonists}
+                assert not gone & {c.id for c in getattr(building, 'residents', ())}
+
+            # A single removal moves the last row into the gap
+            if population.count:
+                colonist = population.colonists[int(rng.integers(population.count))]
+                values = snapshot(colonist)
+                population.remove_colonist(colonist)
+                legacy.remove((colonist.id, values))
+                assert snapshot(colonist) == values
+                assert sorted((c.id, snapshot(c)) for c in population.colonists) == sorted(legacy)
+                legacy = [(c.id, snapshot(c)) for c in population.colonists]
+
+            for _ in range(int(rng.integers(0, 20))):
+                population.add_colonist()
+                legacy.append((population.colonists[-1].id, snapshot(population.colonists[-1])))
+            check_rows(population)
+            assert population.stats.housed == sum(c.housing is not None for c in population.colonists)
+            assert np.isclose(population.stats.happiness_sum, sum(c.happiness for c in population.colonists))
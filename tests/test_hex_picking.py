@@ -0,0 +1,63 @@
+# test_hex_picking.py - Analytic hex picking against the original scan of every hexagon
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+from colony_map import ColonyMap
+from graphics.hex_map import HexMap
+
+
+def legacy_contains_point(vertices, point):
+    """Hexagon.contains_point as it was (ray casting)"""
+    x, y = point
+    num_vertices = len(vertices)
+    inside = False
+    p1x, p1y = vertices[0]
+    for i in range(num_vertices + 1):
+        p2x, p2y = vertices[i % num_vertices]
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x, p1y = p2x, p2y
+    return inside
+
+
+def legacy_hex_at_position(hex_map, pos):
+    """HexMap.get_hex_at_position as it was: the first hexagon in map order containing the point"""
+    colony_map = hex_map.colony_map
+    for row in range(colony_map.rows):
+        for col in range(colony_map.cols):
+            hexagon = hex_map.get_hex_at_grid(col, row)
+            if legacy_contains_point(hexagon.vertices, pos):
+                return hexagon
+    return None
+
+
+def picked(hexagon):
+    return None if hexagon is None else (hexagon.map_x, hexagon.map_y)
+
+
+def test_picking_matches_the_full_scan():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    for seed in range(3):
+        rng = np.random.default_rng(seed)
+        hex_map = HexMap(20, 30, 700, 500, ColonyMap(24, 18, seed=seed))
+        for view in range(4):
+            hex_map.zoom_at((300, 250), int(rng.integers(-2, 3)))
+            hex_map.pan(*rng.integers(-200, 200, size=2).tolist())
+
+            # Mouse positions are whole pixels; also try every vertex of a few hexes
+            points = [tuple(p) for p in rng.integers(0, 760, size=(300, 2)).tolist()]
+            for col, row in rng.integers(0, 18, size=(5, 2)).tolist():
+                points.extend(hex_map.get_hex_at_grid(col, row).vertices)
+            for point in points:
+                expected = picked(legacy_hex_at_position(hex_map, point))
+                assert picked(hex_map.get_hex_at_position(point)) == expected, (seed, view, point)
@@ -0,0 +1,122 @@
+# test_housing_market.py - The housing market against the original per-colonist pass
+import random
+
+import numpy as np
+
+from building_registry import BuildingRegistry
+from buildings import HabitatBlock, Slums
+from population import Population
+
+
+def legacy_update_housing(population, buildings):
+    """Population.update_housing and Colonist.update_housing_situation as they were"""
+    habitats = [b for b in buildings if hasattr(b, 'residents')]
+    habitats.sort(key=lambda h: h.quality, reverse=True)
+    slums = [h for h in habitats if hasattr(h, 'is_slum') and h.is_slum]
+    regular_housing = [h for h in habitats if not hasattr(h, 'is_slum') or not h.is_slum]
+
+    for colonist in sorted(population.colonists, key=lambda c: c.wage, reverse=True):
+        if colonist.housing and not colonist.can_afford_rent():
+            colonist.housing.remove_resident(colonist)
+            continue
+
+        best_habitat = None
+        for habitat in regular_housing:
+            if (habitat.get_vacancy_count() > 0 and
+                    colonist.can_afford_housing(habitat.rent) and
+                    habitat.quality > colonist.housing_quality):
+                if not best_habitat or habitat.quality > best_habitat.quality:
+                    best_habitat = habitat
+
+        if not colonist.housing:
+            if best_habitat and best_habitat.add_resident(colonist):
+                continue
+            for slum in slums:
+                if slum.get_vacancy_count() > 0 and slum.quality > colonist.housing_quality:
+                    if slum.add_resident(colonist):
+                        break
+        elif best_habitat:
+            colonist.housing.remove_resident(colonist)
+            best_habitat.add_resident(colonist)
+
+
+def make_habitat(rng, slum=False):
+    habitat = Slums() if slum else HabitatBlock()
+    habitat.capacity = int(rng.integers(1, 6))
+    if not slum:
+        habitat.update_rent(float(rng.integers(1, 8)))
+        habitat.update_quality(float(rng.integers(1, 6)))
+    return habitat
+
+
+def make_world(seed):
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    population = Population(seed=seed)
+    for _ in range(70):
+        population.add_colonist()
+    buildings = BuildingRegistry([make_habitat(rng, slum=i % 5 == 4) for i in range(12)])
+    return population, buildings, rng
+
+
+def perturb(population, buildings, rng):
+    """One day of the changes the market has to pick up incrementally"""
+    for colonist in population.colonists:
+        if rng.random() < 0.15:
+            colonist.employed = bool(rng.random() < 0.7)
+            colonist.wage = float(rng.integers(2, 14)) if colonist.employed else 0.0
+        if rng.random() < 0.1:
+            colonist.savings = float(rng.integers(0, 4))
+        colonist.living_cost = 1.0 + int(rng.integers(0, 3)) * 0.5
+
+    if population.count > 20:
+        population.remove_colonists(rng.random(population.count) < 0.05)
+        population.remove_colonist(population.colonists[int(rng.integers(population.count))])
+    for _ in range(int(rng.integers(0, 4))):
+        population.add_colonist()
+
+    habitats = list(buildings.residential)
+    habitat = habitats[int(rng.integers(len(habitats)))]
+    if not getattr(habitat, 'is_slum', False):
+        if rng.random() < 0.5:
+            habitat.update_quality(float(rng.integers(1, 6)))
+        else:
+            habitat.update_rent(float(rng.integers(1, 8)))
+    if rng.random() < 0.2:
+        buildings.append(make_habitat(rng, slum=rng.random() < 0.3))
+
+
+def assignments(population, buildings):
+    homes = [[c.id for c in habitat.residents] for habitat in buildings.residential]
+    housed = sorted(c.id for c in population.colonists if c.housing)
+    return homes, housed
+
+
+def test_matches_the_per_colonist_pass():
+    for seed in range(6):
+        population, buildings, rng = make_world(seed)
+        legacy_population, legacy_buildings, legacy_rng = make_world(seed)
+        for day in range(40):
+            population.housing_market.update(buildings)
+            legacy_update_housing(legacy_population, legacy_buildings)
+            assert assignments(population, buildings) == assignments(legacy_population, legacy_buildings), (seed, day)
+            perturb(population, buildings, rng)
+            perturb(legacy_population, legacy_buildings, legacy_rng)
+
+
+def test_wage_order_merges_changed_rows():
+    population, buildings, rng = make_world(7)
+    for _ in range(200):
+        population.add_colonist()
+    wage_order = population.housing_market.wage_order
+    for day in range(40):
+        # A few changes per day, so every sync merges instead of re-sorting
+        for colonist in rng.choice(population.colonists, 3, replace=False):
+            colonist.wage = float(rng.integers(0, 6))
+        population.remove_colonists(rng.random(population.count) < 0.01)
+        population.remove_colonist(population.colonists[int(rng.integers(population.count))])
+        population.add_colonist()
+        order, rank = wage_order.sync()
+        wage = population.store.column('wage')
+        assert np.array_equal(order, np.argsort(-wage, kind='stable')), day
+        assert np.array_equal(rank[order], np.arange(population.count))
@@ -0,0 +1,87 @@
+# test_path_service.py - Cached routing against the original breadth-first walk of the map
+import numpy as np
+
+from building_registry import BuildingRegistry
+from buildings import HabitatBlock
+from colony_map import ColonyMap
+from path_service import PathService
+
+
+def legacy_neighbor_positions(x, y):
+    """HexMap.get_neighbor_positions as it was"""
+    neighbors = []
+    for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (-1, -1)]:
+        neighbor_x = x + dx
+        if y % 2 == 1 and dy in (1, -1):
+            neighbor_x += 1
+        neighbors.append((neighbor_x, y + dy))
+    return neighbors
+
+
+def legacy_distances(colony_map, center):
+    """HexMap.get_area_of_effect_hexes as it was, without a radius, keeping each hex's distance"""
+    visited = {}
+    queue = [(center, 0)]
+    while queue:
+        current, distance = queue.pop(0)
+        if current in visited:
+            continue
+        visited[current] = distance
+        for pos in legacy_neighbor_positions(current.map_x, current.map_y):
+            neighbor = colony_map.get_hex_at_grid(*pos)
+            if neighbor and neighbor not in visited and abs(current.elevation - neighbor.elevation) < 2:
+                queue.append((neighbor, distance + 1))
+    return visited
+
+
+def random_tile(colony_map, rng):
+    return colony_map.tiles[int(rng.integers(len(colony_map.tiles)))]
+
+
+def test_find_path_is_a_shortest_accessible_route():
+    for seed in range(4):
+        rng = np.random.default_rng(seed)
+        colony_map = ColonyMap(20, 15, seed=seed)
+        service = PathService(colony_map, BuildingRegistry())
+        for _ in range(60):
+            start, goal = random_tile(colony_map, rng), random_tile(colony_map, rng)
+            distance = legacy_distances(colony_map, start).get(goal)
+            path = service.find_path((start.map_x, start.map_y), (goal.map_x, goal.map_y))
+            if distance is None:
+                assert path is None, seed
+                continue
+            assert path[0] is start and path[-1] is goal
+            assert len(path) - 1 == distance, seed
+            for a, b in zip(path, path[1:]):
+                assert (b.map_x, b.map_y) in legacy_neighbor_positions(a.map_x, a.map_y)
+                assert abs(a.elevation - b.elevation) < 2
+
+
+def test_building_distances_follow_terrain_and_building_edits():
+    for seed in range(4):
+        rng = np.random.default_rng(seed)
+        colony_map = ColonyMap(20, 15, seed=seed)
+        buildings = BuildingRegistry()
+        service = PathService(colony_map, buildings)
+        for step in range(15):
+            # Build, demolish or raise the terrain between queries, one kind of edit per step
+            if step % 3 == 0:
+                for _ in range(4):
+                    tile = random_tile(colony_map, rng)
+                    building = HabitatBlock()
+                    if colony_map.place_building(tile, building):
+                        buildings.append(building)
+            elif step % 3 == 1:
+                for _ in range(6):
+                    colony_map.set_terrain(random_tile(colony_map, rng), elevation=int(rng.choice([0, 2])))
+            else:
+                tile = colony_map.get_hex_at_grid(*list(buildings)[int(rng.integers(len(buildings)))].hex_position)
+                buildings.remove(tile.building)
+                colony_map.remove_building(tile)
+
+            placed = [b for b in buildings if b.hex_position]
+            for source in placed:
+                reachable = legacy_distances(colony_map, colony_map.get_hex_at_grid(*source.hex_position))
+                for target in placed:
+                    expected = reachable.get(colony_map.get_hex_at_grid(*target.hex_position))
+                    assert service.building_distance(source, target) == expected, (seed, step)
@@ -0,0 +1,109 @@
+# test_resource_flow.py - The compiled resource flow against the per-building loop
+import random
+
+import numpy as np
+
+import buildings as building_types
+from building_registry import BuildingRegistry
+from population import Population
+from resource_flow import RESOURCES
+from resources import ResourceManager
+
+# Production and consumption of the original per-building methods at half staffing
+BASELINE = {
+    'ChemicalProcessingPlant': ({'fuel': 4.0}, {'energy': 2.0, 'regolith': 0.0, 'hydrogen': 1.0}),
+    'EnergyGenerator': ({'energy': 20.0}, {'energy': 0.0, 'regolith': 0.0, 'fuel': 1.5}),
+    'HabitatBlock': ({}, {'energy': 0.0, 'regolith': 0.0}),
+    'Hospital': ({}, {'energy': 3.0, 'regolith': 1.0}),
+    'HydroponicFarm': ({'food': 17.5}, {'energy': 8 * 7 / 15, 'regolith': 0.0}),
+    'IceExtractor': ({'oxygen': 12.0, 'hydrogen': 9.0}, {'energy': 3.0, 'regolith': 0.0}),
+    'Mine': ({'regolith': 20.0}, {'energy': 2.5, 'regolith': 0.0}),
+    'OxygenGenerator': ({'oxygen': 12.0}, {'energy': 2.0, 'regolith': 0.0}),
+    'PolicePrecinct': ({}, {'energy': 2.0, 'regolith': 0.0, 'fuel': 1.0}),
+    'Slums': ({}, {'energy': 0.0, 'regolith': 0.0}),
+    'SolarPanelArray': ({'energy': 10.0}, {}),
+}
+
+
+def legacy_totals(resources, buildings):
+    """The building loop of ResourceManager.update as it was"""
+    total_production = dict.fromkeys(RESOURCES, 0)
+    total_consumption = dict.fromkeys(RESOURCES, 0)
+    for building in buildings:
+        for resource, amount in building.calculate_effective_production(resources).items():
+            total_production[resource] += amount
+        for resource, amount in building.calculate_consumption().items():
+            total_consumption[resource] += amount
+    return total_production, total_consumption
+
+
+def legacy_update(resources, population, buildings):
+    """ResourceManager.update as it was, applied to a copy of the stocks"""
+    production, consumption = legacy_totals(resources, buildings)
+    consumption['oxygen'] += population.count * 0.1
+    consumption['food'] += population.count * 0.2
+    consumption['energy'] += population.count * 0.05
+    production['credits'] += sum(c.rent_cost for c in population.colonists
+                                 if c.housing and c.can_afford_rent())
+    return [max(0, getattr(resources, r) + production[r] - consumption[r]) for r in RESOURCES]
+
+
+def random_building(rng):
+    name = sorted(BASELINE)[int(rng.integers(len(BASELINE)))]
+    return getattr(building_types, name)()
+
+
+def shake(buildings, resources, rng):
+    """Change staffing, crime, activity and stocks, and sometimes the buildings"""
+    for building in buildings:
+        if rng.random() < 0.4:
+            building.assigned_workers = int(rng.integers(0, building.max_workers + 1))
+        if rng.random() < 0.2:
+            building.crime_level = float(rng.uniform(0, 100))
+        if rng.random() < 0.1:
+            building.active = not building.active
+    for resource in RESOURCES:
+        setattr(resources, resource, float(rng.choice([0.0, rng.uniform(0, 4), rng.uniform(0, 200)])))
+    if rng.random() < 0.3:
+        buildings.append(random_building(rng))
+    if rng.random() < 0.2:
+        buildings.remove(list(buildings)[int(rng.integers(len(buildings)))])
+
+
+def test_per_building_rates_match_the_original_methods():
+    for name, (production, consumption) in BASELINE.items():
+        building = getattr(building_types, name)()
+        building.assigned_workers = max(1, building.max_workers // 2) if building.max_workers else 0
+        assert building.calculate_production() == production, name
+        assert building.calculate_consumption() == consumption, name
+
+
+def test_daily_totals_match_the_building_loop():
+    for seed in range(5):
+        rng = np.random.default_rng(seed)
+        resources = ResourceManager()
+        buildings = BuildingRegistry([random_building(rng) for _ in range(30)])
+        for day in range(40):
+            shake(buildings, resources, rng)
+            stock = np.array([getattr(resources, r) for r in RESOURCES], dtype=float)
+            production, consumption = resources.flow.daily_totals(buildings, stock)
+            expected_production, expected_consumption = legacy_totals(resources, buildings)
+            assert np.allclose(production, [expected_production[r] for r in RESOURCES]), (seed, day)
+            assert np.allclose(consumption, [expected_consumption[r] for r in RESOURCES]), (seed, day)
+
+
+def test_update_matches_the_original_update():
+    random.seed(4)
+    rng = np.random.default_rng(4)
+    population = Population(seed=4)
+    homes = [building_types.HabitatBlock() for _ in range(3)]
+    for colonist in population.colonists[:7]:
+        colonist.savings = float(rng.uniform(0, 10))
+        homes[int(rng.integers(3))].add_resident(colonist)
+    resources = ResourceManager()
+    buildings = BuildingRegistry(homes + [random_building(rng) for _ in range(20)])
+    for day in range(20):
+        shake(buildings, resources, rng)
+        expected = legacy_update(resources, population, buildings)
+        resources.update(population, buildings)
+        assert np.allclose([getattr(resources, r) for r in RESOURCES], expected), day
@@ -0,0 +1,34 @@
+# test_stock_market.py - Price history lengths shorter than the rolling windows
+import numpy as np
+
+from market import Market
+from stock_market import StockMarket
+from timeseries import RingBuffer, RollingStats
+
+
+class Resources:
+    credits = 10000
+
+
+def test_windows_longer_than_capacity_average_the_stored_history():
+    history = RingBuffer(4)
+    stats = RollingStats(history, windows=(5, 10, 30))
+    values = [3.0, 5.0, 8.0, 13.0, 21.0, 34.0, 55.0]
+    for value in values:
+        stats.append(value)
+    for window in (5, 10, 30):
+        assert np.isclose(stats.mean(window), np.mean(values[-4:]))
+        assert np.isclose(stats.variance(window), np.var(values[-4:]))
+    assert np.isclose(stats.momentum(5), (values[-1] - values[-4]) / values[-4])
+
+
+def test_short_history_market_runs():
+    for history_days in (1, 5, 20):
+        stock_market = StockMarket(Market(seed=1), Resources(), seed=1, history_days=history_days)
+        for day in range(1, 80):
+            stock_market.update_market(day)
+        assert len(stock_market.history) == history_days
+        for data in stock_market.get_all_indices().values():
+            assert len(data['price_history']) == history_days
+            assert np.isclose(data['moving_avg_30'], data['price_history'].mean())
+            assert data['current_price'] > 0
@@ -0,0 +1,50 @@
+# test_tick_benchmark.py - A simulated day with 100k colonists stays in the millisecond range
+import random
+import time
+
+from buildings import HabitatBlock, Mine
+from simulation import SimulationCore
+
+COLONISTS = 100000
+DAYS = 10
+TICK_BUDGET = 0.1  # Seconds; the per-object update took 0.2-0.5 s per day
+
+
+def stock_up(resources):
+    for name in ('credits', 'food', 'oxygen', 'energy', 'regolith', 'hydrogen', 'fuel'):
+        setattr(resources, name, 1e12)
+
+
+def test_tick_with_100k_colonists_takes_milliseconds():
+    random.seed(1)
+    game = SimulationCore(seed=1)
+    population = game.population
+    population.max_population = 2 * COLONISTS
+
+    # Enough homes and jobs for everyone, so the colony stays at full size
+    for _ in range(COLONISTS // 10 + 500):
+        game.buildings.append(HabitatBlock())
+    mines = [Mine() for _ in range(COLONISTS // 20)]
+    for mine in mines:
+        game.buildings.append(mine)
+    while population.count < COLONISTS:
+        population.add_colonist()
+    unemployed = iter(population.unemployed_colonists)
+    for mine in mines:
+        for colonist in [next(unemployed) for _ in range(mine.max_workers)]:
+            mine.assign_colonist(colonist)
+
+    # The first day moves everybody in
+    stock_up(game.resources)
+    game.next_day()
+
+    times = []
+    for _ in range(DAYS):
+        stock_up(game.resources)
+        start = time.perf_counter()
+        game.next_day()
+        times.append(time.perf_counter() - start)
+
+    assert population.count >= COLONISTS
+    assert population.stats.housed == population.count
+    assert sorted(times)[DAYS // 2] < TICK_BUDGET
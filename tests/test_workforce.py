@@ -0,0 +1,99 @@
+# test_workforce.py - Employment indexes against full scans of the colonists
+import random
+
+import numpy as np
+
+from building_registry import BuildingRegistry
+from buildings import HydroponicFarm, Mine, OxygenGenerator
+from population import Population
+
+WORKPLACES = (Mine, HydroponicFarm, OxygenGenerator)
+
+
+def make_world(seed):
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    population = Population(seed=seed)
+    for _ in range(150):
+        population.add_colonist()
+    buildings = BuildingRegistry([WORKPLACES[i % 3]() for i in range(9)])
+    return population, buildings, rng
+
+
+def shuffle_jobs(population, buildings, rng):
+    """One day of hiring, firing, wage changes, arrivals and departures"""
+    colonists = population.colonists
+    workplaces = list(buildings)
+    for _ in range(30):
+        colonist = colonists[int(rng.integers(len(colonists)))]
+        building = workplaces[int(rng.integers(len(workplaces)))]
+        roll = rng.random()
+        if roll < 0.6:
+            building.assign_colonist(colonist, float(rng.integers(2, 12)) if rng.random() < 0.5 else None)
+        elif roll < 0.85 and colonist.workplace:
+            colonist.workplace.remove_colonist(colonist)
+        else:
+            colonist.set_wage(float(rng.integers(2, 12)))
+
+    population.remove_colonists(rng.random(population.count) < 0.03)
+    population.remove_colonist(population.colonists[int(rng.integers(population.count))])
+    for _ in range(int(rng.integers(0, 6))):
+        population.add_colonist()
+
+
+def test_indexes_match_a_scan():
+    for seed in range(5):
+        population, buildings, rng = make_world(seed)
+        for day in range(30):
+            shuffle_jobs(population, buildings, rng)
+            colonists = population.colonists
+            employed = {c for c in colonists if c.employed}
+            assert set(population.employed_colonists) == employed, (seed, day)
+            assert set(population.unemployed_colonists) == set(colonists) - employed, (seed, day)
+            assert population.employed_workers == len(employed)
+            for profession in {b.profession for b in buildings}:
+                scan = {c for c in colonists if c.employed and c.profession == profession}
+                assert set(population.get_colonists_by_profession(profession)) == scan, (seed, day)
+                assert population.get_profession_count(profession) == len(scan)
+            assert population.stats.employed == len(employed)
+            assert np.isclose(population.stats.total_wages, sum(c.wage for c in colonists))
+
+
+def legacy_rosters(population, buildings):
+    """Population.update_employment as it was: every roster rebuilt from a scan"""
+    return {building: [c for c in population.colonists if c.workplace == building] for building in buildings}
+
+
+def test_ledger_rosters_match_the_rescan():
+    for seed in range(5):
+        population, buildings, rng = make_world(seed)
+        ledger = population.workforce
+        ledger.debug = True  # settle() raises if a roster drifts
+        for day in range(30):
+            before = {b: set(b.assigned_colonists) for b in buildings}
+            shuffle_jobs(population, buildings, rng)
+            if day % 6 == 5:
+                # Demolition releases the workers before the building leaves the registry
+                building = list(buildings)[int(rng.integers(len(buildings)))]
+                ledger.release_building(building)
+                buildings.remove(building)
+                buildings.append(WORKPLACES[day % 3]())
+
+            dirty = set(ledger.settle(buildings))
+            expected = legacy_rosters(population, buildings)
+            for building in buildings:
+                roster = building.assigned_colonists
+                assert set(roster) == set(expected[building]), (seed, day, building.name)
+                assert len(roster) == len(expected[building]) == building.assigned_workers
+                if before.get(building, set()) != set(roster):
+                    assert building in dirty, (seed, day, building.name)
+            assert ledger.check_consistency(buildings) == []
+
+
+def test_consistency_check_reports_drift():
+    population, buildings, rng = make_world(3)
+    shuffle_jobs(population, buildings, rng)
+    worker = population.employed_colonists[0]
+    worker.workplace.assigned_colonists.remove(worker)
+    problems = population.workforce.check_consistency(buildings)
+    assert any(f"colonist {worker.id}" in problem for problem in problems)
@@ -0,0 +1,142 @@
+# timeseries.py - Fixed-size NumPy ring buffers for daily price histories
+import numpy as np
+
+
+class RingBuffer:
+    """The most recent `capacity` values of a series, oldest first.
+
+    Values live in a preallocated float64 array of twice the capacity and
+    every append writes its slot in both halves. The newest n values are
+    then always one contiguous slice, so windows are read-only views and
+    nothing is copied or shifted as the series grows past its capacity.
+    With a `width`, every entry is a row of that many parallel series
+    (one column per series) that are appended together.
+    """
+    def __init__(self, capacity, initial=(), width=None):
+        self.capacity = max(1, int(capacity))
+        self.shape = () if width is None else (width,)
+        self.data = np.zeros((2 * self.capacity,) + self.shape)
+        self.head = 0  # Slot the next value is written to
+        self.count = 0
+        for value in initial:
+            self.append(value)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.last())
+
+    def append(self, value):
+        """Record a new value (or row), dropping the oldest once the buffer is full"""
+        self.data[self.head] = value
+        self.data[self.head + self.capacity] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def last(self, n=None):
+        """Read-only view of the newest n values (all stored values by default)"""
+        n = self.count if n is None else max(0, min(n, self.count))
+        end = self.head + self.capacity
+        window = self.data[end - n:end]
+        window.flags.writeable = False
+        return window
+
+    def latest(self):
+        """Newest value (or row); the buffer must not be empty"""
+        if self.shape:
+            return self.last(1)[0]
+        return float(self.data[self.head + self.capacity - 1])
+
+    def widen(self, fill):
+        """Add columns to a buffer of rows, back-filling their history with `fill`"""
+        fill = np.atleast_1d(np.asarray(fill, dtype=float))
+        added = np.broadcast_to(fill, (len(self.data), len(fill)))
+        self.data = np.concatenate((self.data, added), axis=1)
+        self.shape = (self.data.shape[1],)
+
+    def clear(self):
+        """Forget every stored value"""
+        self.head = 0
+        self.count = 0
+
+
+class RollingStats:
+    """Moving averages, variances, an EMA and momentum kept up to date per append.
+
+    Appending a value adds it to a running sum and sum of squares per window
+    and subtracts the value leaving each window, which the backing
+    RingBuffer still holds. Every read is O(1) per series, and a buffer of
+    rows updates all its columns with the same array expressions. Windows
+    longer than the history so far, or than the buffer's capacity, average
+    over what is available. The sums are re-added from the buffer once per
+    lap of it so rounding errors cannot build up.
+    """
+    def __init__(self, history, windows=(5, 10, 30), ema_span=10):
+        self.history = history
+        self.windows = tuple(windows)
+        self.sums = {}
+        self.squares = {}
+        self.alpha = 2 / (ema_span + 1)
+        self.ema = None
+        for window in self.windows:
+            self.resum(window)
+        for value in history.last():
+            self.ema = np.array(value) if self.ema is None else self.ema + self.alpha * (value - self.ema)
+
+    def resum(self, window):
+        """Recompute a window's sums from the stored history"""
+        values = self.history.last(window)
+        self.sums[window] = values.sum(axis=0)
+        self.squares[window] = (values * values).sum(axis=0)
+
+    def append(self, value):
+        """Record a new value (or row) in the history and every statistic"""
+        value = np.asarray(value, dtype=float)
+        history = self.history
+        for window in self.windows:
+            if len(history) >= min(window, history.capacity):
+                leaving = history.last(window)[0]
+                self.sums[window] = self.sums[window] - leaving + value
+                self.squares[window] = self.squares[window] - leaving * leaving + value * value
+            else:
+                self.sums[window] = self.sums[window] + value
+                self.squares[window] = self.squares[window] + value * value
+        history.append(value)
+        self.ema = np.array(value) if self.ema is None else self.ema + self.alpha * (value - self.ema)
+
+        if history.head == 0:
+            for window in self.windows:
+                self.resum(window)
+
+    def widen(self, fill):
+        """Add series to a buffer of rows, each with a flat history at `fill`"""
+        fill = np.atleast_1d(np.asarray(fill, dtype=float))
+        self.history.widen(fill)
+        for window in self.windows:
+            self.resum(window)
+        if self.ema is not None:
+            self.ema = np.concatenate((self.ema, fill))
+
+    def count(self, window):
+        """Number of values currently inside a window"""
+        return min(window, len(self.history))
+
+    def mean(self, window):
+        """Average of the newest `window` values (0 for an empty history)"""
+        return self.sums[window] / max(1, self.count(window))
+
+    def variance(self, window):
+        """Population variance of the newest `window` values"""
+        count = max(1, self.count(window))
+        mean = self.sums[window] / count
+        return np.maximum(0.0, self.squares[window] / count - mean * mean)
+
+    def momentum(self, window):
+        """Relative change from the oldest to the newest value of a window"""
+        if not len(self.history):
+            return np.zeros(self.history.shape)
+        first = self.history.last(window)[0]
+        change = self.history.last(1)[0] - first
+        return np.divide(change, first, out=np.zeros(self.history.shape), where=first != 0)
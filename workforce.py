@@ -0,0 +1,76 @@
+# workforce.py - Keeps building rosters in step with colonist assignments
+
+
+class WorkforceLedger:
+    """Records workplace assignment changes as they happen.
+
+    Colonist.assign_to_workplace and unassign_from_workplace report every
+    move here. The ledger removes the colonist from a roster they left, so
+    rosters never need a global rescan. Buildings whose staffing changed
+    are collected in `dirty_buildings` until the next settle().
+    """
+    def __init__(self, population):
+        self.population = population
+        self.dirty_buildings = {}  # Dict used as an ordered set
+        self.debug = False  # Verify every roster on settle() when True
+
+    def record_move(self, colonist, old_workplace, new_workplace):
+        """Note a colonist leaving `old_workplace` for `new_workplace` (either may be None)"""
+        if old_workplace is not None and old_workplace is not new_workplace:
+            self.detach(old_workplace, colonist)
+            self.dirty_buildings[old_workplace] = None
+        if new_workplace is not None:
+            self.dirty_buildings[new_workplace] = None
+
+    def detach(self, building, colonist):
+        """Drop a colonist from a building roster if they are still on it"""
+        if colonist in building.assigned_colonists:
+            building.assigned_colonists.remove(colonist)
+            building.assigned_workers = len(building.assigned_colonists)
+
+    def release_building(self, building):
+        """Unassign every worker of a building that is being demolished"""
+        for colonist in building.assigned_colonists[:]:  # Use slice copy
+            building.remove_colonist(colonist)
+        self.dirty_buildings.pop(building, None)
+
+    def drop_colonists(self, colonists):
+        """Remove departing colonists from their rosters, rebuilding each roster once"""
+        leaving = set(colonists)
+        workplaces = {c.workplace for c in colonists if c.workplace}
+        for building in workplaces:
+            building.assigned_colonists = [c for c in building.assigned_colonists if c not in leaving]
+            building.assigned_workers = len(building.assigned_colonists)
+            self.dirty_buildings[building] = None
+
+    def settle(self, buildings):
+        """End-of-day bookkeeping; returns the buildings whose staffing changed"""
+        if self.debug:
+            problems = self.check_consistency(buildings)
+            if problems:
+                raise RuntimeError("Workforce ledger out of sync: " + "; ".join(problems))
+        dirty = list(self.dirty_buildings)
+        self.dirty_buildings.clear()
+        return dirty
+
+    def check_consistency(self, buildings):
+        """List roster problems; costs O(buildings + workers) using one set of rostered colonists"""
+        problems = []
+        rostered = set()  # Colonists listed on their own workplace's roster
+        for building in buildings:
+            roster = building.assigned_colonists
+            if building.assigned_workers != len(roster):
+                problems.append(f"{building.name} counts {building.assigned_workers} workers but lists {len(roster)}")
+            for colonist in roster:
+                if colonist.workplace is not building:
+                    problems.append(f"colonist {colonist.id} is on the {building.name} roster but works elsewhere")
+                else:
+                    rostered.add(colonist)
+
+        for colonist in self.population.employed_index:
+            workplace = colonist.workplace
+            if workplace is None or workplace not in buildings:
+                problems.append(f"colonist {colonist.id} is employed without a standing workplace")
+            elif colonist not in rostered:
+                problems.append(f"colonist {colonist.id} is missing from the {workplace.name} roster")
+        return problems